@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/search 응답 직렬화 벤치마크 (Pydantic response_model 경로 vs dict + orjson 경로)
+
+고정된 합성 데이터(시드 고정)로 같은 본문을 만드는 두 엔드포인트를 띄우고
+TestClient로 초당 요청 수를 비교합니다. DB는 사용하지 않습니다.
+
+실행: python benchmarks/bench_search_response.py [--rows 100] [--requests 2000]
+"""
+
+import argparse
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.responses import Response
+from fastapi.testclient import TestClient
+
+from src.okky_jobs.api.api_main import JobSearchResult, PaginationInfo, SearchResponse
+from src.okky_jobs.api.serialization import build_search_payload, dumps
+
+CATEGORIES = ["개발", "디자인", "기획", "마케팅", "영업"]
+LOCATIONS = ["서울", "경기", "인천", "부산", "대전"]
+CAREERS = ["신입", "1-3년", "3-5년", "5-10년", "10년 이상"]
+
+
+def make_rows(count: int, seed: int = 42) -> list:
+    """검색 결과 행과 같은 키의 합성 데이터"""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, 9, 0, 0)
+    rows = []
+    for i in range(count):
+        created = base + timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+        rows.append({
+            "id": i + 1,
+            "company": f"회사{rng.randint(1, 500)}",
+            "title": f"백엔드 개발자 채용 {i} (Java/Spring, Python)",
+            "category": rng.choice(CATEGORIES),
+            "location": rng.choice(LOCATIONS),
+            "experience": rng.choice(CAREERS),
+            "deadline": (created + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "views": rng.randint(0, 5000),
+            "created_at": created,
+            "updated_at": created + timedelta(hours=1),
+            "original_url": f"https://okky.kr/recruit/{100000 + i}",
+        })
+    return rows
+
+
+def build_app(rows: list, total: int) -> FastAPI:
+    filters = {"keyword": None, "sort": "createdAt", "skills": [], "skillsMode": "or", "includeClosed": False}
+    app = FastAPI()
+
+    # 기존 경로: 행마다 JobSearchResult 생성 → response_model로 다시 검증/직렬화
+    @app.get("/before", response_model=SearchResponse)
+    def before():
+        jobs = [JobSearchResult(
+            id=str(row['id']),
+            company=row['company'],
+            title=row['title'],
+            category=row['category'],
+            location=row['location'],
+            experience=row['experience'],
+            deadline=row['deadline'] if row['deadline'] else None,
+            views=row['views'] or 0,
+            createdAt=row['created_at'].isoformat() if row['created_at'] else None,
+            updatedAt=row['updated_at'].isoformat() if row['updated_at'] else None,
+            originalUrl=row['original_url']
+        ) for row in rows]
+        total_pages = (total + len(rows) - 1) // len(rows)
+        return SearchResponse(
+            success=True,
+            data=jobs,
+            pagination=PaginationInfo(page=1, limit=len(rows), total=total, totalPages=total_pages,
+                                      hasNext=total_pages > 1, hasPrev=False),
+            filters=filters,
+            facets=None
+        )
+
+    # 최적화 경로: 행 → dict → orjson 바이트
+    @app.get("/after")
+    def after():
+        body = dumps(build_search_payload(rows, total, 1, len(rows), filters))
+        return Response(content=body, media_type="application/json")
+
+    return app
+
+
+def measure(client: TestClient, path: str, requests: int) -> float:
+    for _ in range(min(50, requests)):
+        client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path)
+    return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=100, help="응답 한 번의 행 수 (limit)")
+    parser.add_argument("--requests", type=int, default=2000, help="경로별 요청 수")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    client = TestClient(build_app(rows, total=args.rows * 10))
+
+    # 두 경로의 본문이 같은지 먼저 확인
+    before_body, after_body = client.get("/before").json(), client.get("/after").json()
+    assert before_body == after_body, "두 경로의 응답 본문이 다릅니다"
+
+    before_rps = measure(client, "/before", args.requests)
+    after_rps = measure(client, "/after", args.requests)
+    print(f"rows={args.rows}, requests={args.requests}")
+    print(f"before (Pydantic response_model): {before_rps:8.1f} req/s")
+    print(f"after  (dict + orjson)          : {after_rps:8.1f} req/s")
+    print(f"speedup: {after_rps / before_rps:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,20 +11,29 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
-from src.okky_jobs.db.db import get_connection
+from src.okky_jobs.db.db import get_connection, rebuild_job_skills
+from src.okky_jobs.utils.log_partitions import maintain_log_partitions
 
 def create_crawling_tables():
     """크롤링 관련 테이블 생성"""
     
-    # 크롤링 로그 테이블 생성
+    # 크롤링 로그 테이블 생성 (일 단위 RANGE 파티션)
     create_logs_table = """
     CREATE TABLE IF NOT EXISTS crawling_logs (
-        id INT AUTO_INCREMENT PRIMARY KEY,
+        id BIGINT AUTO_INCREMENT,
+        history_id INT NULL,
         type VARCHAR(20) NOT NULL,
         message TEXT NOT NULL,
-        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
         progress INT DEFAULT NULL,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id, timestamp),
+        KEY idx_crawling_logs_history (history_id, id),
+        KEY idx_crawling_logs_history_type (history_id, type, id),
+        KEY idx_crawling_logs_timestamp (timestamp)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    PARTITION BY RANGE (TO_DAYS(timestamp)) (
+        PARTITION p_future VALUES LESS THAN MAXVALUE
     )
     """
     
@@ -37,16 +46,118 @@ def create_crawling_tables():
         ended_at TIMESTAMP NULL,
         duration INT NULL,
         processed INT DEFAULT 0,
+        ingest_ms INT NULL,
+        merge_lock_ms INT NULL,
+        jobs_inserted INT NULL,
+        jobs_changed INT NULL,
+        jobs_unchanged INT NULL,
+        details_inserted INT NULL,
+        details_changed INT NULL,
+        details_unchanged INT NULL,
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     """
     
-    # 인덱스 생성
-    create_logs_indexes = [
-        "CREATE INDEX IF NOT EXISTS idx_crawling_logs_timestamp ON crawling_logs(timestamp)",
-        "CREATE INDEX IF NOT EXISTS idx_crawling_logs_type ON crawling_logs(type)"
+    # 데이터 세대 번호 테이블 생성 (API 응답 캐시 무효화용)
+    create_generation_table = """
+    CREATE TABLE IF NOT EXISTS data_generation (
+        id TINYINT NOT NULL PRIMARY KEY,
+        generation BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """
+    
+    # 공고 통계 요약 테이블 생성 (/search/stats, /crawl/status 조회용)
+    create_job_stats_table = """
+    CREATE TABLE IF NOT EXISTS job_stats (
+        id TINYINT NOT NULL PRIMARY KEY,
+        open_jobs INT NOT NULL DEFAULT 0,
+        master_jobs INT NOT NULL DEFAULT 0,
+        detail_jobs INT NOT NULL DEFAULT 0,
+        category_counts JSON NULL,
+        location_counts JSON NULL,
+        daily_counts JSON NULL,
+        last_updated_at DATETIME NULL,
+        last_created_at DATETIME NULL,
+        recomputed_at DATETIME NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """
+    
+    # 크롤링 실행 요청 테이블 생성 (API/스케줄러 등록 → 크롤링 워커 실행)
+    create_crawl_runs_table = """
+    CREATE TABLE IF NOT EXISTS crawl_runs (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        label VARCHAR(50) NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        cancel_requested TINYINT(1) NOT NULL DEFAULT 0,
+        worker VARCHAR(100) NULL,
+        history_id INT NULL,
+        error TEXT NULL,
+        requested_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP NULL,
+        heartbeat_at TIMESTAMP NULL,
+        finished_at TIMESTAMP NULL,
+        KEY idx_crawl_runs_status (status, id)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """
+    
+    # 공고별 정규화 스킬 테이블 생성 (/search 기술스택 필터/facet)
+    create_job_skills_table = """
+    CREATE TABLE IF NOT EXISTS job_skills (
+        link VARCHAR(500) NOT NULL,
+        skill VARCHAR(100) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (link, skill),
+        KEY idx_job_skills_skill (skill, link)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """
+    
+    # 보관 공고 테이블 생성 (include_closed 검색 대상)
+    create_archive_tables = [
+        """
+        CREATE TABLE IF NOT EXISTS okky_jobs_archive (
+            id INT PRIMARY KEY,
+            title VARCHAR(255) NOT NULL,
+            company VARCHAR(255),
+            link VARCHAR(500) NOT NULL,
+            deadline VARCHAR(50),
+            category VARCHAR(100),
+            position VARCHAR(100),
+            location VARCHAR(100),
+            career VARCHAR(100),
+            salary VARCHAR(50),
+            content_hash CHAR(40),
+            closed_at DATETIME NULL,
+            created_at TIMESTAMP NULL,
+            updated_at TIMESTAMP NULL,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE KEY unique_link (link)
+        ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS okky_job_details_archive (
+            id INT PRIMARY KEY,
+            link VARCHAR(500) NOT NULL,
+            registered_at VARCHAR(100),
+            view_count INT DEFAULT 0,
+            local_view_count INT NOT NULL DEFAULT 0,
+            start_date VARCHAR(100),
+            work_location VARCHAR(255),
+            pay_date VARCHAR(50),
+            skill VARCHAR(255),
+            description TEXT,
+            contact_id INT,
+            content_hash CHAR(40),
+            created_at TIMESTAMP NULL,
+            updated_at TIMESTAMP NULL,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE KEY unique_link (link)
+        ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+        """,
     ]
     
+    # 인덱스 생성
     create_history_indexes = [
         "CREATE INDEX IF NOT EXISTS idx_crawling_history_started_at ON crawling_history(started_at)",
         "CREATE INDEX IF NOT EXISTS idx_crawling_history_status ON crawling_history(status)"
@@ -62,13 +173,39 @@ def create_crawling_tables():
         print("🗄️ 크롤링 히스토리 테이블 생성 중...")
         cursor.execute(create_history_table)
         
+        print("🗄️ 데이터 세대 테이블 생성 중...")
+        cursor.execute(create_generation_table)
+        cursor.execute("INSERT IGNORE INTO data_generation (id, generation) VALUES (1, 0)")
+        
+        print("🗄️ 공고 통계 테이블 생성 중...")
+        cursor.execute(create_job_stats_table)
+        
+        print("🗄️ 크롤링 실행 요청 테이블 생성 중...")
+        cursor.execute(create_crawl_runs_table)
+        
+        print("🗄️ 공고 스킬 테이블 생성 중...")
+        cursor.execute(create_job_skills_table)
+        
+        print("🗄️ 보관 공고 테이블 생성 중...")
+        for archive_sql in create_archive_tables:
+            cursor.execute(archive_sql)
+        
         print("📊 인덱스 생성 중...")
-        for index_sql in create_logs_indexes + create_history_indexes:
+        for index_sql in create_history_indexes:
             cursor.execute(index_sql)
         
         conn.commit()
         print("✅ 크롤링 관련 테이블이 성공적으로 생성되었습니다!")
         
+        print("📅 로그 파티션 생성 중...")
+        maintain_log_partitions()
+        
+        # 기존 상세 공고의 스킬 채우기 (내용이 바뀐 공고만 적재 시 갱신되므로 처음 한 번 필요)
+        cursor.execute("SHOW TABLES LIKE 'okky_job_details'")
+        if cursor.fetchone():
+            print("🔁 기존 공고 스킬 재구성 중...")
+            rebuild_job_skills()
+        
     except Exception as e:
         print(f"❌ 테이블 생성 실패: {e}")
         conn.rollback()
@@ -0,0 +1,15 @@
+-- 크롤링 실행 요청 (API/스케줄러가 등록, 크롤링 워커가 하나씩 실행)
+CREATE TABLE crawl_runs (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    label VARCHAR(50) NOT NULL,                    -- 요청 주체 (수동 크롤링, 스케줄러)
+    status VARCHAR(20) NOT NULL,                   -- queued, running, completed, failed, cancelled
+    cancel_requested TINYINT(1) NOT NULL DEFAULT 0,
+    worker VARCHAR(100) NULL,                      -- 실행 중인 워커 (호스트명:PID)
+    history_id INT NULL,                           -- crawling_history.id
+    error TEXT NULL,
+    requested_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP NULL,
+    heartbeat_at TIMESTAMP NULL,                   -- 워커 생존 확인 (오래되면 실패 처리)
+    finished_at TIMESTAMP NULL,
+    KEY idx_crawl_runs_status (status, id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
@@ -6,6 +6,14 @@ CREATE TABLE crawling_history (
     ended_at TIMESTAMP NULL,
     duration INT NULL,  -- 밀리초
     processed INT DEFAULT 0,  -- 처리된 항목 수
+    ingest_ms INT NULL,  -- DB 적재 전체 소요 시간 (밀리초)
+    merge_lock_ms INT NULL,  -- 운영 테이블 병합 트랜잭션 시간 (밀리초, staging 모드)
+    jobs_inserted INT NULL,  -- 마스터 신규/변경/동일 건수
+    jobs_changed INT NULL,
+    jobs_unchanged INT NULL,
+    details_inserted INT NULL,  -- 상세 신규/변경/동일 건수
+    details_changed INT NULL,
+    details_unchanged INT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -0,0 +1,13 @@
+-- 기존 crawling_history에 적재 통계 컬럼 추가
+ALTER TABLE crawling_history
+    ADD COLUMN ingest_ms INT NULL AFTER processed,
+    ADD COLUMN merge_lock_ms INT NULL AFTER ingest_ms;
+
+-- 적재 시 신규/변경/동일 건수 컬럼 추가
+ALTER TABLE crawling_history
+    ADD COLUMN jobs_inserted INT NULL AFTER merge_lock_ms,
+    ADD COLUMN jobs_changed INT NULL AFTER jobs_inserted,
+    ADD COLUMN jobs_unchanged INT NULL AFTER jobs_changed,
+    ADD COLUMN details_inserted INT NULL AFTER jobs_unchanged,
+    ADD COLUMN details_changed INT NULL AFTER details_inserted,
+    ADD COLUMN details_unchanged INT NULL AFTER details_changed;
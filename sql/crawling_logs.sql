@@ -1,13 +1,21 @@
--- 크롤링 로그 테이블 생성
+-- 크롤링 로그 테이블 생성 (일 단위 RANGE 파티션, 보관 기간 지난 파티션은 통째로 DROP)
 CREATE TABLE crawling_logs (
-    id INT AUTO_INCREMENT PRIMARY KEY,
+    id BIGINT AUTO_INCREMENT,
+    history_id INT NULL,  -- crawling_history.id
     type VARCHAR(20) NOT NULL,  -- info, success, error, warning, progress
     message TEXT NOT NULL,
-    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     progress INT DEFAULT NULL,  -- 진행률 (0-100)
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, timestamp),
+    -- 현재 히스토리의 최근 로그 / 최신 진행률 조회용
+    KEY idx_crawling_logs_history (history_id, id),
+    KEY idx_crawling_logs_history_type (history_id, type, id),
+    KEY idx_crawling_logs_timestamp (timestamp)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+PARTITION BY RANGE (TO_DAYS(timestamp)) (
+    PARTITION p_future VALUES LESS THAN MAXVALUE
 );
 
--- 인덱스 생성
-CREATE INDEX idx_crawling_logs_timestamp ON crawling_logs(timestamp);
-CREATE INDEX idx_crawling_logs_type ON crawling_logs(type);
+-- 일자별 파티션은 src/okky_jobs/utils/log_partitions.py 의 maintain_log_partitions()가
+-- p_future를 분할하여 미리 생성하고, 보관 기간(CRAWLING_LOG_RETENTION_DAYS)이 지난 파티션을 DROP 합니다.
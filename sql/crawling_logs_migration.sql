@@ -0,0 +1,19 @@
+-- 기존(비파티션) crawling_logs를 파티션 테이블로 전환
+-- 1) history_id 컬럼 추가, timestamp를 DATETIME으로 변경, 파티션 키를 포함하도록 PK 변경
+ALTER TABLE crawling_logs
+    ADD COLUMN history_id INT NULL AFTER id,
+    MODIFY id BIGINT NOT NULL AUTO_INCREMENT,
+    MODIFY timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (id, timestamp);
+
+-- 2) 인덱스 정리
+DROP INDEX idx_crawling_logs_type ON crawling_logs;
+CREATE INDEX idx_crawling_logs_history ON crawling_logs(history_id, id);
+CREATE INDEX idx_crawling_logs_history_type ON crawling_logs(history_id, type, id);
+
+-- 3) 파티션 적용 (이후 일자별 파티션은 maintain_log_partitions()가 생성)
+ALTER TABLE crawling_logs
+    PARTITION BY RANGE (TO_DAYS(timestamp)) (
+        PARTITION p_future VALUES LESS THAN MAXVALUE
+    );
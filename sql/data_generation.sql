@@ -0,0 +1,8 @@
+-- 데이터 세대 번호 (크롤링 적재가 커밋될 때마다 증가, API 응답 캐시 무효화 기준)
+CREATE TABLE data_generation (
+    id TINYINT NOT NULL PRIMARY KEY,
+    generation BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
+
+INSERT INTO data_generation (id, generation) VALUES (1, 0);
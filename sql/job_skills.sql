@@ -0,0 +1,8 @@
+-- 공고별 정규화 스킬 테이블 (okky_job_details.skill 토큰화 결과)
+CREATE TABLE job_skills (
+    link VARCHAR(500) NOT NULL,
+    skill VARCHAR(100) NOT NULL,  -- 대표 표기 (JavaScript, Spring Boot, ...)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (link, skill),
+    KEY idx_job_skills_skill (skill, link)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
@@ -0,0 +1,14 @@
+-- 공고 통계 요약 (단일 행, 적재 시 증분 갱신 + 크롤링 종료 시 재계산)
+CREATE TABLE job_stats (
+    id TINYINT NOT NULL PRIMARY KEY,
+    open_jobs INT NOT NULL DEFAULT 0,       -- 게시 중 공고 수 (closed_at IS NULL)
+    master_jobs INT NOT NULL DEFAULT 0,     -- okky_jobs 전체 행 수
+    detail_jobs INT NOT NULL DEFAULT 0,     -- okky_job_details 전체 행 수
+    category_counts JSON NULL,              -- 게시 중 공고의 카테고리별 수
+    location_counts JSON NULL,              -- 게시 중 공고의 지역별 수
+    daily_counts JSON NULL,                 -- 게시 중 공고의 등록일(YYYY-MM-DD)별 수 (최근 JOB_STATS_DAYS일)
+    last_updated_at DATETIME NULL,          -- MAX(okky_jobs.updated_at)
+    last_created_at DATETIME NULL,          -- MAX(okky_jobs.created_at)
+    recomputed_at DATETIME NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
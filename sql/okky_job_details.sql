@@ -2,13 +2,15 @@ CREATE TABLE okky_job_details (
     id INT AUTO_INCREMENT PRIMARY KEY,
     link VARCHAR(500) NOT NULL,
     registered_at VARCHAR(100),
-    view_count INT DEFAULT 0,
+    view_count INT DEFAULT 0,  -- OKKY에서 수집한 조회수 (크롤링 시 덮어씀)
+    local_view_count INT NOT NULL DEFAULT 0,  -- 이 API에서 집계한 조회수 (표시값 = view_count + local_view_count)
     start_date VARCHAR(100),
     work_location VARCHAR(255),
     pay_date VARCHAR(50),
     skill VARCHAR(255),
     description TEXT,
     contact_id INT,
+    content_hash CHAR(40),  -- 변경 감지용 내용 해시 (SHA-1)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     UNIQUE KEY unique_link (link),
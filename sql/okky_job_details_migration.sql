@@ -0,0 +1,6 @@
+-- 변경 감지용 내용 해시 컬럼 추가 (기존 행은 다음 크롤링 때 한 번 채워짐)
+ALTER TABLE okky_job_details ADD COLUMN content_hash CHAR(40) NULL AFTER contact_id;
+
+-- API 조회수 컬럼 분리 (view_count: OKKY에서 수집한 값, local_view_count: 이 API에서 집계한 값)
+ALTER TABLE okky_job_details ADD COLUMN local_view_count INT NOT NULL DEFAULT 0 AFTER view_count;
+-- okky_job_details_archive는 okky_jobs_archive.sql에 이미 local_view_count가 포함되어 있음
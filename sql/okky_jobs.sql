@@ -9,7 +9,11 @@ CREATE TABLE okky_jobs (
     location VARCHAR(100),
     career VARCHAR(100),
     salary VARCHAR(50),
+    content_hash CHAR(40),  -- 변경 감지용 내용 해시 (SHA-1)
+    closed_at DATETIME NULL,  -- OKKY 목록에서 사라진 시각 (NULL: 게시 중)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    UNIQUE KEY unique_link (link)
+    UNIQUE KEY unique_link (link),
+    KEY idx_okky_jobs_closed_at (closed_at),
+    KEY idx_okky_jobs_created (created_at, id)
 ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
\ No newline at end of file
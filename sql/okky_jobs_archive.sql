@@ -0,0 +1,38 @@
+-- 마감 후 보관 기간(CLOSED_ARCHIVE_DAYS)이 지난 공고 보관 테이블 (id는 okky_jobs의 값을 그대로 유지)
+CREATE TABLE okky_jobs_archive (
+    id INT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    company VARCHAR(255),
+    link VARCHAR(500) NOT NULL,
+    deadline VARCHAR(50),
+    category VARCHAR(100),
+    position VARCHAR(100),
+    location VARCHAR(100),
+    career VARCHAR(100),
+    salary VARCHAR(50),
+    content_hash CHAR(40),
+    closed_at DATETIME NULL,
+    created_at TIMESTAMP NULL,
+    updated_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_link (link)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
+
+CREATE TABLE okky_job_details_archive (
+    id INT PRIMARY KEY,
+    link VARCHAR(500) NOT NULL,
+    registered_at VARCHAR(100),
+    view_count INT DEFAULT 0,
+    local_view_count INT NOT NULL DEFAULT 0,
+    start_date VARCHAR(100),
+    work_location VARCHAR(255),
+    pay_date VARCHAR(50),
+    skill VARCHAR(255),
+    description TEXT,
+    contact_id INT,
+    content_hash CHAR(40),
+    created_at TIMESTAMP NULL,
+    updated_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_link (link)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci;
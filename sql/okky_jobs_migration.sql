@@ -0,0 +1,10 @@
+-- 변경 감지용 내용 해시 컬럼 추가 (기존 행은 다음 크롤링 때 한 번 채워짐)
+ALTER TABLE okky_jobs ADD COLUMN content_hash CHAR(40) NULL AFTER salary;
+
+-- 마감(목록에서 사라진) 공고 표시 컬럼 추가
+ALTER TABLE okky_jobs
+    ADD COLUMN closed_at DATETIME NULL AFTER content_hash,
+    ADD KEY idx_okky_jobs_closed_at (closed_at);
+
+-- /jobs keyset 페이지네이션 (created_at DESC, id DESC) 인덱스
+ALTER TABLE okky_jobs ADD KEY idx_okky_jobs_created (created_at, id);
@@ -1,18 +1,36 @@
 from fastapi import FastAPI, Query, Request, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List, Dict, Any
-from threading import Thread
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import time
 import pymysql
 import os
+import base64
 from datetime import datetime, timedelta
+from itertools import chain
 from pydantic import BaseModel, Field
 from enum import Enum
 
-from ..db.db import get_connection
-from ..utils.excel_utils import export_to_excel
-from ..utils.crawling_logger import CrawlingLogger
-from ..scheduler.scheduler import job
+from ..db.db import (
+    get_connection, get_read_connection, iter_search_jobs, get_data_generation, get_data_last_modified,
+    SEARCH_JOB_COLUMNS
+)
+from ..db.job_stats import read_job_stats
+from ..db.crawl_runs import enqueue_run, get_run, request_cancel, run_to_dict
+from ..utils.excel_utils import iter_xlsx_chunks, iter_csv_chunks, XLSX_MEDIA_TYPE, CSV_MEDIA_TYPE
+from ..utils.crawling_logger import CrawlingLogger, flush_logs
+from ..utils.skill_utils import normalize_skills, parse_skill_filter
+from ..utils.response_cache import ResponseCache, normalize_key, get_cache_stats
+from ..utils.http_cache import make_etag, make_version_etag, is_not_modified, cache_headers
+from ..utils.view_counter import view_counter
+from ..utils.log_stream import log_stream_bus, format_sse, LOG_STREAM_KEEPALIVE
+from ..utils.export_jobs import ExportManager, ExportQueueFull
+from ..utils.rate_limit import RateLimiter, ConcurrencyGate, AdmissionControlMiddleware
+from ..search.engine import SearchEngineHolder
+from ..search.suggest import SuggestIndexHolder
+from .serialization import FastJSONResponse, build_search_payload, dumps
 
 # 열거형 정의
 class Category(str, Enum):
@@ -97,15 +115,120 @@ class SearchResponse(BaseModel):
     data: List[JobSearchResult]
     pagination: PaginationInfo
     filters: Dict[str, Any]
+    facets: Optional[Dict[str, Dict[str, int]]] = None
 
 class JobDetailResponse(BaseModel):
     success: bool
     data: JobDetail
 
+class JobBatchRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, description="조회할 공고 id 목록")
+
+class JobBatchResponse(BaseModel):
+    success: bool
+    data: List[JobDetail]
+    missing: List[str]
+
 class StatsResponse(BaseModel):
     success: bool
     data: Dict[str, Any]
 
+# 검색 대상 테이블 (include_closed: 운영 + 보관 테이블)
+def build_search_source(include_closed: bool = False) -> str:
+    if not include_closed:
+        return "okky_jobs j LEFT JOIN okky_job_details d ON j.link = d.link"
+    return """(
+        SELECT id, title, company, link, deadline, category, career, location, created_at, updated_at, closed_at
+        FROM okky_jobs
+        UNION ALL
+        SELECT id, title, company, link, deadline, category, career, location, created_at, updated_at, closed_at
+        FROM okky_jobs_archive
+    ) j
+    LEFT JOIN (
+        SELECT link, view_count, local_view_count, description FROM okky_job_details
+        UNION ALL
+        SELECT link, view_count, local_view_count, description FROM okky_job_details_archive
+    ) d ON j.link = d.link"""
+
+# 마감일 필터 기준일
+def deadline_cutoff(deadline: str) -> str:
+    """마감일 필터 값(today, 3days, 1week, 1month)을 기준일 문자열로 변환"""
+    today = datetime.now().date()
+    days = {"today": 0, "3days": 3, "1week": 7, "1month": 30}.get(deadline, 0)
+    return (today + timedelta(days=days)).strftime("%Y-%m-%d")
+
+# 검색 조건 빌더
+def build_search_conditions(
+    keyword: Optional[str] = None,
+    category: Optional[str] = None,
+    location: Optional[str] = None,
+    experience: Optional[str] = None,
+    deadline: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    skills_mode: str = "or",
+    include_closed: bool = False
+) -> tuple:
+    """검색 조건에 따른 WHERE 절(AND ...)과 파라미터를 빌드합니다."""
+    conditions = ""
+    params = []
+    
+    # 마감된 공고 제외 (기본)
+    if not include_closed:
+        conditions += " AND j.closed_at IS NULL"
+    
+    # 키워드 검색 (제목, 회사명, 상세 설명에서 검색 - 인메모리 검색 엔진과 같은 범위)
+    if keyword:
+        conditions += """
+        AND (j.title LIKE %s OR j.company LIKE %s OR d.description LIKE %s)
+        """
+        keyword_param = f"%{keyword}%"
+        params.extend([keyword_param, keyword_param, keyword_param])
+    
+    # 카테고리 필터
+    if category:
+        conditions += " AND j.category = %s"
+        params.append(category)
+    
+    # 지역 필터
+    if location:
+        conditions += " AND j.location = %s"
+        params.append(location)
+    
+    # 경력 필터
+    if experience:
+        conditions += " AND j.career = %s"
+        params.append(experience)
+    
+    # 마감일 필터 (deadline이 VARCHAR이므로 문자열 비교)
+    if deadline:
+        conditions += " AND j.deadline <= %s"
+        params.append(deadline_cutoff(deadline))
+    
+    # 기술스택 필터 (job_skills의 skill 인덱스로 조회)
+    if skills:
+        placeholders = ", ".join(["%s"] * len(skills))
+        if skills_mode == "and":
+            conditions += f"""
+            AND j.link IN (
+                SELECT s.link FROM job_skills s
+                WHERE s.skill IN ({placeholders})
+                GROUP BY s.link
+                HAVING COUNT(*) = %s
+            )
+            """
+            params.extend(skills)
+            params.append(len(skills))
+        else:
+            conditions += f"""
+            AND j.link IN (
+                SELECT s.link FROM job_skills s
+                WHERE s.skill IN ({placeholders})
+            )
+            """
+            params.extend(skills)
+    
+    return conditions, params
+
 # 검색 쿼리 빌더
 def build_search_query(
     keyword: Optional[str] = None,
@@ -115,12 +238,17 @@ def build_search_query(
     deadline: Optional[str] = None,
     sort: str = "createdAt",
     page: int = 1,
-    limit: int = 20
+    limit: int = 20,
+    skills: Optional[List[str]] = None,
+    skills_mode: str = "or",
+    include_closed: bool = False
 ) -> tuple:
     """검색 조건에 따른 SQL 쿼리를 빌드합니다."""
     
+    source = build_search_source(include_closed)
+    
     # 기본 쿼리 (실제 테이블 구조에 맞게 수정)
-    base_query = """
+    base_query = f"""
     SELECT 
         j.id,
         j.company,
@@ -129,72 +257,35 @@ def build_search_query(
         j.location,
         j.career as experience,
         j.deadline,
-        COALESCE(d.view_count, 0) as views,
+        (COALESCE(d.view_count, 0) + COALESCE(d.local_view_count, 0)) as views,
         j.created_at,
         j.updated_at,
         j.link as original_url
-    FROM okky_jobs j
-    LEFT JOIN okky_job_details d ON j.link = d.link
+    FROM {source}
     WHERE 1=1
     """
     
-    count_query = "SELECT COUNT(*) as total FROM okky_jobs j LEFT JOIN okky_job_details d ON j.link = d.link WHERE 1=1"
+    count_query = f"SELECT COUNT(*) as total FROM {source} WHERE 1=1"
     
-    params = []
-    
-    # 키워드 검색 (제목, 회사명에서 검색)
-    if keyword:
-        keyword_condition = """
-        AND (j.title LIKE %s OR j.company LIKE %s)
-        """
-        base_query += keyword_condition
-        count_query += keyword_condition
-        keyword_param = f"%{keyword}%"
-        params.extend([keyword_param, keyword_param])
-    
-    # 카테고리 필터
-    if category:
-        base_query += " AND j.category = %s"
-        count_query += " AND j.category = %s"
-        params.append(category)
-    
-    # 지역 필터
-    if location:
-        base_query += " AND j.location = %s"
-        count_query += " AND j.location = %s"
-        params.append(location)
-    
-    # 경력 필터
-    if experience:
-        base_query += " AND j.career = %s"
-        count_query += " AND j.career = %s"
-        params.append(experience)
-    
-    # 마감일 필터 (deadline이 VARCHAR이므로 문자열 비교)
-    if deadline:
-        today = datetime.now().date()
-        if deadline == "today":
-            deadline_date = today.strftime("%Y-%m-%d")
-        elif deadline == "3days":
-            deadline_date = (today + timedelta(days=3)).strftime("%Y-%m-%d")
-        elif deadline == "1week":
-            deadline_date = (today + timedelta(days=7)).strftime("%Y-%m-%d")
-        elif deadline == "1month":
-            deadline_date = (today + timedelta(days=30)).strftime("%Y-%m-%d")
-        else:
-            deadline_date = today.strftime("%Y-%m-%d")
-        
-        # deadline이 VARCHAR이므로 문자열 비교 사용
-        base_query += " AND j.deadline <= %s"
-        count_query += " AND j.deadline <= %s"
-        params.append(deadline_date)
+    conditions, params = build_search_conditions(
+        keyword=keyword,
+        category=category,
+        location=location,
+        experience=experience,
+        deadline=deadline,
+        skills=skills,
+        skills_mode=skills_mode,
+        include_closed=include_closed
+    )
+    base_query += conditions
+    count_query += conditions
     
     # 정렬
     sort_mapping = {
         "createdAt": "j.created_at DESC",
         "company": "j.company ASC",
         "deadline": "j.deadline ASC",
-        "views": "COALESCE(d.view_count, 0) DESC"
+        "views": "(COALESCE(d.view_count, 0) + COALESCE(d.local_view_count, 0)) DESC"
     }
     
     order_by = sort_mapping.get(sort, "j.created_at DESC")
@@ -206,6 +297,105 @@ def build_search_query(
     
     return base_query, count_query, params
 
+# 스킬 facet 쿼리 빌더
+def build_skill_facet_query(conditions: str, limit: int = 30, include_closed: bool = False) -> str:
+    """현재 검색 조건에서 스킬별 공고 수를 집계하는 쿼리"""
+    return f"""
+    SELECT s.skill, COUNT(*) as count
+    FROM job_skills s
+    JOIN ({build_search_source(include_closed)}) ON j.link = s.link
+    WHERE 1=1 {conditions}
+    GROUP BY s.skill
+    ORDER BY count DESC
+    LIMIT {int(limit)}
+    """
+
+# 값별 facet (category/location/experience는 한 번의 GROUP BY로 함께 집계)
+GROUP_FACETS = {"category": "j.category", "location": "j.location", "experience": "j.career"}
+FACET_FIELDS = set(GROUP_FACETS) | {"skills"}
+
+def build_group_facet_query(conditions: str, include_closed: bool = False) -> str:
+    """현재 검색 조건에서 (category, location, career) 조합별 공고 수를 집계하는 쿼리"""
+    return f"""
+    SELECT j.category, j.location, j.career as experience, COUNT(*) as count
+    FROM {build_search_source(include_closed)}
+    WHERE 1=1 {conditions}
+    GROUP BY j.category, j.location, j.career
+    """
+
+def sum_group_facets(rows: List[dict], fields) -> Dict[str, Dict[str, int]]:
+    """조합별 집계 행을 facet 항목별 값 → 공고 수로 합산 (값이 없는 행 제외, 많은 순)"""
+    facets = {}
+    for field in fields:
+        counts: Dict[str, int] = {}
+        for row in rows:
+            if row[field]:
+                counts[row[field]] = counts.get(row[field], 0) + int(row['count'])
+        facets[field] = dict(sorted(counts.items(), key=lambda item: -item[1]))
+    return facets
+
+# 응답 캐시 TTL(초): 조회수(local_view_count)는 세대 번호를 바꾸지 않으므로 캐시된 views는 최대 TTL만큼 늦게 반영됨
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", 300))
+DETAIL_CACHE_TTL = float(os.getenv("DETAIL_CACHE_TTL", 60))
+
+# 검색 응답 캐시 (메모리 상한 바이트, TTL 초) - 크롤링 적재 시 데이터 세대 번호로 무효화
+search_cache = ResponseCache(
+    "search",
+    max_bytes=int(os.getenv("SEARCH_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+    ttl=SEARCH_CACHE_TTL
+)
+
+# facet 집계 캐시 (페이지/정렬과 무관하게 검색 조건 조합별로 다음 크롤링 적재까지 재사용)
+facet_cache = ResponseCache(
+    "search_facets",
+    max_bytes=int(os.getenv("FACET_CACHE_MAX_BYTES", 8 * 1024 * 1024)),
+    ttl=float(os.getenv("FACET_CACHE_TTL", 3600))
+)
+
+# 공고 상세 응답 캐시 (공고 id별 직렬화된 본문 + ETag)
+detail_cache = ResponseCache(
+    "job_detail",
+    max_bytes=int(os.getenv("DETAIL_CACHE_MAX_BYTES", 16 * 1024 * 1024)),
+    ttl=DETAIL_CACHE_TTL
+)
+
+# 상세 일괄 조회 한 번에 받을 최대 공고 수
+DETAIL_BATCH_MAX_IDS = int(os.getenv("DETAIL_BATCH_MAX_IDS", 100))
+
+# 내보내기 파일 캐시 (같은 조건 + 같은 데이터 세대면 재사용)
+export_cache = ResponseCache(
+    "export",
+    max_bytes=int(os.getenv("EXPORT_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+    ttl=float(os.getenv("EXPORT_CACHE_TTL", 1800)),
+    max_entry_bytes=int(os.getenv("EXPORT_CACHE_MAX_ENTRY_BYTES", 16 * 1024 * 1024))
+)
+
+# 백그라운드 내보내기 작업 (전용 스레드 풀, 동시 실행 수 제한)
+export_manager = ExportManager()
+
+# 인메모리 검색 엔진 (SEARCH_ENGINE_ENABLED=0이면 SQL만 사용)
+search_engine = SearchEngineHolder()
+
+# 검색어 자동완성 색인 (검색 엔진과 별도로 세대별 적재)
+suggest_indexes = SuggestIndexHolder()
+
+# 공고 id → 링크 (캐시에서 밀려난 공고도 304 응답 시 조회수를 집계하기 위함)
+job_links: Dict[str, str] = {}
+
+
+def version_validators(policy: str, generation: int, *parts) -> Optional[tuple]:
+    """데이터 세대 기반 (ETag, Last-Modified, 응답 헤더). 세대 테이블을 읽지 못했으면 None (조건부 응답 안 함)"""
+    last_modified = get_data_last_modified()
+    if last_modified is None:
+        return None
+    etag = make_version_etag(policy, generation, *parts)
+    return etag, last_modified, cache_headers(policy, etag, last_modified)
+
+
+def views_window(ttl: float) -> int:
+    """조회수가 바뀌어도 세대는 그대로이므로 ETag에 TTL 단위 구간을 넣어 304가 views를 계속 고정하지 않게 함"""
+    return int(time.time() // max(ttl, 1))
+
 # 환경에 따라 root_path 동적 설정
 # 서버 배포 시: /okky (리버스 프록시용), 로컬 개발 시: /
 root_path = os.getenv("ROOT_PATH", "/okky")
@@ -226,6 +416,11 @@ async def add_process_time_header(request: Request, call_next):
     response = await call_next(request)
     return response
 
+# 요청 제한 (클라이언트별 토큰 버킷 + 무거운 엔드포인트 동시 실행 수 제한, 429 응답에도 CORS 헤더가 붙도록 CORS 안쪽에 둠)
+rate_limiter = RateLimiter()
+admission_gate = ConcurrencyGate()
+app.add_middleware(AdmissionControlMiddleware, limiter=rate_limiter, gate=admission_gate)
+
 # CORS 미들웨어 추가
 app.add_middleware(
     CORSMiddleware,
@@ -236,42 +431,46 @@ app.add_middleware(
 )
 
 
-def search_jobs(keyword: Optional[str] = None) -> List[dict]:
-    """DB에서 키워드 기반 검색 결과 반환"""
-    conn = get_connection()
+def load_job_stats() -> dict:
+    """job_stats 요약 행 조회 (기본키 조회 한 번, 행이 없으면 503 - 생성은 크롤링 파이프라인/워커가 담당)"""
+    conn = get_read_connection()
     cursor = conn.cursor(pymysql.cursors.DictCursor)
     try:
-        sql = """
-            SELECT 
-                j.title, j.company, j.link, j.deadline, j.category, j.position, j.location,
-                j.career, j.salary,
-                d.registered_at, d.view_count, d.start_date, d.work_location,
-                d.pay_date, d.skill, d.description,
-                c.name AS contact_name, c.phone AS contact_phone, c.email AS contact_email
-            FROM okky_jobs j
-            LEFT JOIN okky_job_details d ON j.link = d.link  -- ✅ 링크 기준으로 조인
-            LEFT JOIN okky_job_contacts c ON d.contact_id = c.id
-        """
-        params = ()
-        if keyword:
-            sql += " WHERE j.title LIKE %s OR j.company LIKE %s OR d.description LIKE %s"
-            params = (f"%{keyword}%", f"%{keyword}%", f"%{keyword}%")
-        sql += " ORDER BY j.created_at DESC"
+        summary = read_job_stats(cursor)
+    finally:
+        cursor.close()
+        conn.close()
+    if summary is None:
+        raise HTTPException(
+            status_code=503,
+            detail="공고 통계가 아직 준비되지 않았습니다. 크롤링 워커가 통계를 만든 뒤 다시 시도해 주세요.",
+            headers={"Retry-After": "60"}
+        )
+    return summary
 
-        cursor.execute(sql, params)
-        return cursor.fetchall()
 
+def search_jobs(keyword: Optional[str] = None) -> List[dict]:
+    """DB에서 키워드 기반 검색 결과 반환"""
+    try:
+        return list(iter_search_jobs(keyword))
     except Exception as e:
         print(f"❌ 검색 오류: {e}")
         return []
-    finally:
-        cursor.close()
-        conn.close()
 
 
-#@app.on_event("startup")
-#def startup_event():
-#    Thread(target=job, daemon=True).start()
+@app.on_event("startup")
+def load_search_engine_on_startup():
+    # 검색 엔진/자동완성 색인은 백그라운드에서 적재 (적재 전까지 검색은 SQL로 처리)
+    generation = get_data_generation()
+    search_engine.refresh_async(generation)
+    suggest_indexes.refresh_async(generation)
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # 버퍼에 남은 크롤링 로그, 조회수 저장
+    flush_logs()
+    view_counter.flush()
 
 
 @app.get("/")
@@ -279,30 +478,104 @@ async def root():
     return {"message": "OKKY 채용공고 검색 API입니다. /jobs 또는 /jobs/export 엔드포인트를 사용하세요."}
 
 
-@app.get("/jobs")
-async def get_jobs(keyword: Optional[str] = Query(None)):
-    rows = search_jobs(keyword)
-    if not rows:
-        return JSONResponse(content={"message": "검색 결과가 없습니다."}, status_code=404)
-    return JSONResponse(content=rows)
+def parse_job_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 파라미터(쉼표 구분)를 검증하여 컬럼 목록으로 변환"""
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    unknown = [f for f in field_list or [] if f not in SEARCH_JOB_COLUMNS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+    return field_list
 
-# 새로운 채용공고 검색 API 엔드포인트들
-@app.get("/search", response_model=SearchResponse)
-async def search_jobs_new(
-    keyword: Optional[str] = Query(None, description="검색 키워드"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
-    category: Optional[str] = Query(None, description="카테고리 필터"),
-    location: Optional[str] = Query(None, description="지역 필터"),
-    experience: Optional[str] = Query(None, description="경력 필터"),
-    deadline: Optional[str] = Query(None, description="마감일 필터 (today, 3days, 1week, 1month)"),
-    sort: str = Query("createdAt", description="정렬 기준 (createdAt, company, deadline, views)")
+
+def encode_cursor(created_at: datetime, job_id: int) -> str:
+    """keyset 페이지네이션 커서 (created_at, id)를 불투명 문자열로 변환"""
+    raw = f"{created_at.isoformat()}|{job_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+    created_at, job_id = raw.split("|", 1)
+    return datetime.fromisoformat(created_at), int(job_id)
+
+
+def _page_rows(rows, limit: Optional[int], state: dict):
+    """커서 컬럼을 떼어 내고 limit건까지 반환, 다음 행이 있으면 state['next']에 커서 기록"""
+    last = None
+    try:
+        for count, row in enumerate(rows):
+            created_at, job_id = row.pop("_created_at"), row.pop("_id")
+            if limit is not None and count >= limit:
+                if last and last[0]:
+                    state["next"] = encode_cursor(*last)
+                break
+            last = (created_at, job_id)
+            yield row
+    finally:
+        rows.close()
+
+
+@app.get("/jobs")
+async def get_jobs(
+    keyword: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, description="페이지당 항목 수 (미지정 시 전체, json은 최대 1000)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="응답 형식 (json, ndjson: 한 줄에 한 건씩 스트리밍)"),
+    fields: Optional[str] = Query(None, description="응답 컬럼 (쉼표 구분, 예: title,company,link)")
 ):
-    """채용공고 검색 API"""
+    field_list = parse_job_fields(fields)
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
+    
+    # 기존 방식 (전체 목록 JSON) - DB 조회는 이벤트 루프를 막지 않도록 스레드풀에서
+    if format == "json" and limit is None and after is None:
+        if field_list is None:
+            rows = await run_in_threadpool(search_jobs, keyword)
+        else:
+            rows = await run_in_threadpool(lambda: list(iter_search_jobs(keyword, fields=field_list)))
+        if not rows:
+            return JSONResponse(content={"message": "검색 결과가 없습니다."}, status_code=404)
+        return FastJSONResponse(content=rows)
+    
+    if format == "json":
+        limit = limit or 100
+        if limit > 1000:
+            raise HTTPException(status_code=400, detail="json 형식의 limit은 최대 1000입니다.")
+    
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    rows = iter_search_jobs(
+        keyword,
+        fields=field_list,
+        limit=limit + 1 if limit is not None else None,
+        after=after,
+        with_cursor=True
+    )
+    state = {}
+    page = _page_rows(rows, limit, state)
+    
+    if format == "ndjson":
+        # 서버 사이드 커서에서 읽는 대로 한 줄씩 전송, 다음 페이지가 있으면 마지막 줄에 nextCursor
+        def stream():
+            for row in page:
+                yield dumps(row) + b"\n"
+            if state.get("next"):
+                yield dumps({"nextCursor": state["next"]}) + b"\n"
+        return StreamingResponse(stream(), media_type="application/x-ndjson")
+    
+    data = await run_in_threadpool(list, page)
+    return FastJSONResponse(content={"data": data, "nextCursor": state.get("next")})
+
+def _search_with_sql(
+    keyword, category, location, experience, deadline, sort, page, limit,
+    skill_list, skills_mode, facet_fields, include_closed
+) -> tuple:
+    """SQL 검색 경로: (총 개수, 결과 행, facet 집계)"""
+    group_fields = [f for f in GROUP_FACETS if f in facet_fields]
+    conn = get_read_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
     try:
-        conn = get_connection()
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
         # 검색 쿼리 빌드
         search_query, count_query, params = build_search_query(
             keyword=keyword,
@@ -312,48 +585,137 @@ async def search_jobs_new(
             deadline=deadline,
             sort=sort,
             page=page,
-            limit=limit
+            limit=limit,
+            skills=skill_list,
+            skills_mode=skills_mode,
+            include_closed=include_closed
         )
         
-        # 총 개수 조회
-        cursor.execute(count_query, params)
-        total = cursor.fetchone()['total']
+        conditions, facet_params = build_search_conditions(
+            keyword=keyword,
+            category=category,
+            location=location,
+            experience=experience,
+            deadline=deadline,
+            skills=skill_list,
+            skills_mode=skills_mode,
+            include_closed=include_closed
+        )
+        facet_counts = {}
+        
+        # 총 개수 조회 (값별 facet을 요청하면 조합별 집계의 합계를 총 개수로 사용)
+        if group_fields:
+            cursor.execute(build_group_facet_query(conditions, include_closed=include_closed), facet_params)
+            groups = cursor.fetchall()
+            total = sum(int(row['count']) for row in groups)
+            facet_counts.update(sum_group_facets(groups, group_fields))
+        else:
+            cursor.execute(count_query, params)
+            total = cursor.fetchone()['total']
         
         # 검색 결과 조회
         cursor.execute(search_query, params)
         results = cursor.fetchall()
         
-        # 결과 변환
-        jobs = []
-        for row in results:
-            jobs.append(JobSearchResult(
-                id=str(row['id']),
-                company=row['company'],
-                title=row['title'],
-                category=row['category'],
-                location=row['location'],
-                experience=row['experience'],  # career as experience로 매핑됨
-                deadline=row['deadline'] if row['deadline'] else None,
-                views=row['views'] or 0,
-                createdAt=row['created_at'].isoformat() if row['created_at'] else None,
-                updatedAt=row['updated_at'].isoformat() if row['updated_at'] else None,
-                originalUrl=row['original_url']
-            ))
-        
-        # 페이지네이션 정보 계산
-        total_pages = (total + limit - 1) // limit
-        has_next = page < total_pages
-        has_prev = page > 1
-        
-        pagination = PaginationInfo(
-            page=page,
-            limit=limit,
-            total=total,
-            totalPages=total_pages,
-            hasNext=has_next,
-            hasPrev=has_prev
+        # 스킬 facet 집계
+        if "skills" in facet_fields:
+            cursor.execute(build_skill_facet_query(conditions, include_closed=include_closed), facet_params)
+            facet_counts["skills"] = {row['skill']: row['count'] for row in cursor.fetchall()}
+        return total, results, facet_counts or None
+    finally:
+        cursor.close()
+        conn.close()
+
+# 새로운 채용공고 검색 API 엔드포인트들
+@app.get("/search", response_model=SearchResponse)
+async def search_jobs_new(
+    request: Request,
+    keyword: Optional[str] = Query(None, description="검색 키워드"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    location: Optional[str] = Query(None, description="지역 필터"),
+    experience: Optional[str] = Query(None, description="경력 필터"),
+    deadline: Optional[str] = Query(None, description="마감일 필터 (today, 3days, 1week, 1month)"),
+    sort: str = Query("createdAt", description="정렬 기준 (createdAt, company, deadline, views)"),
+    skills: Optional[str] = Query(None, description="기술스택 필터 (쉼표 구분, 예: Java,Spring)"),
+    skills_mode: str = Query("or", pattern="^(and|or)$", description="기술스택 조건 (and: 모두 포함, or: 하나 이상 포함)"),
+    facets: Optional[str] = Query(None, description="facet 집계 항목 (쉼표 구분: category, location, experience, skills)"),
+    include_closed: bool = Query(False, description="마감/보관된 공고 포함 여부")
+):
+    """채용공고 검색 API (데이터 세대 + 검색 조건 ETag 일치 시 304)
+    
+    응답은 행을 dict로 바로 옮겨 orjson으로 직렬화 (response_model은 문서용, 모델 생성/검증 생략)
+    """
+    try:
+        skill_list = parse_skill_filter(skills)
+        facet_fields = {f.strip() for f in facets.split(",") if f.strip()} & FACET_FIELDS if facets else set()
+        
+        # 캐시 조회 (정규화된 검색 파라미터 기준)
+        generation = get_data_generation()
+        cache_key = normalize_key(
+            keyword=keyword, page=page, limit=limit, category=category, location=location,
+            experience=experience, deadline=deadline, sort=sort, skills=skill_list,
+            skills_mode=skills_mode, facets=facet_fields, include_closed=include_closed
         )
         
+        # 조건부 요청은 DB 조회 전에 처리 (마감일 필터 기준일이 바뀌도록 날짜 포함)
+        validators = version_validators(
+            "search", generation, datetime.now().date().isoformat(), views_window(SEARCH_CACHE_TTL), cache_key
+        )
+        headers = {}
+        if validators is not None:
+            etag, last_modified, headers = validators
+            if is_not_modified(request.headers, etag, last_modified):
+                return Response(status_code=304, headers=headers)
+        
+        # 캐시에는 직렬화된 본문을 저장하므로 적중 시 그대로 전송
+        cached = search_cache.get(cache_key, generation)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json", headers=headers)
+        
+        # 인메모리 검색 엔진 (마감 공고 포함 검색, 엔진 갱신 중, 비활성화 시에는 SQL)
+        engine = None if include_closed else search_engine.get(generation)
+        if engine is not None and not engine.supports(keyword):
+            engine = None
+        
+        # facet은 검색 조건 조합별로 캐시 (다른 페이지/정렬 요청은 다시 집계하지 않음)
+        facet_key = normalize_key(
+            keyword=keyword, category=category, location=location, experience=experience,
+            deadline=deadline, skills=skill_list, skills_mode=skills_mode,
+            facets=facet_fields, include_closed=include_closed
+        )
+        cached_facets = facet_cache.get(facet_key, generation) if facet_fields else None
+        need_facets = facet_fields if cached_facets is None else set()
+        
+        facet_counts = None
+        if engine is not None:
+            mask = engine.match(
+                keyword=keyword,
+                category=category,
+                location=location,
+                experience=experience,
+                deadline_cutoff=deadline_cutoff(deadline) if deadline else None,
+                skills=skill_list,
+                skills_mode=skills_mode
+            )
+            total = engine.count(mask)
+            results = [engine.row(i) for i in engine.page_rows(mask, sort, (page - 1) * limit, limit)]
+            if need_facets:
+                facet_counts = {field: engine.facet_counts(mask, field) for field in need_facets if field in GROUP_FACETS}
+                if "skills" in need_facets:
+                    facet_counts["skills"] = engine.skill_counts(mask)
+        else:
+            total, results, facet_counts = await run_in_threadpool(
+                _search_with_sql,
+                keyword, category, location, experience, deadline, sort, page, limit,
+                skill_list, skills_mode, need_facets, include_closed
+            )
+        if cached_facets is not None:
+            facet_counts = cached_facets
+        elif facet_fields:
+            facet_cache.set(facet_key, facet_counts, generation)
+        
         # 필터 정보
         filters = {
             "keyword": keyword,
@@ -361,75 +723,76 @@ async def search_jobs_new(
             "location": location,
             "experience": experience,
             "deadline": deadline,
-            "sort": sort
+            "sort": sort,
+            "skills": skill_list,
+            "skillsMode": skills_mode,
+            "includeClosed": include_closed
         }
         
-        cursor.close()
-        conn.close()
-        
-        return SearchResponse(
-            success=True,
-            data=jobs,
-            pagination=pagination,
-            filters=filters
-        )
+        body = dumps(build_search_payload(results, total, page, limit, filters, facet_counts))
+        search_cache.set(cache_key, body, generation)
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색 중 오류가 발생했습니다: {str(e)}")
 
 @app.get("/search/stats", response_model=StatsResponse)
-async def get_stats():
-    """통계 정보 조회"""
+async def get_stats(request: Request, response: Response):
+    """통계 정보 조회 (데이터 세대 + 날짜 ETag 일치 시 304)"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
-        # 전체 채용공고 수
-        cursor.execute("SELECT COUNT(*) as total FROM okky_jobs")
-        total_jobs = cursor.fetchone()['total']
-        
-        # 오늘 등록된 채용공고 수
-        today = datetime.now().date()
-        cursor.execute("SELECT COUNT(*) as today FROM okky_jobs WHERE DATE(created_at) = %s", (today,))
-        today_jobs = cursor.fetchone()['today']
-        
-        # 마지막 업데이트 시간
-        cursor.execute("SELECT MAX(updated_at) as last_update FROM okky_jobs")
-        last_update = cursor.fetchone()['last_update']
-        
-        # 카테고리별 통계
-        cursor.execute("""
-            SELECT category, COUNT(*) as count
-            FROM okky_jobs
-            GROUP BY category
-            ORDER BY count DESC
-        """)
-        category_stats = {row['category']: row['count'] for row in cursor.fetchall()}
+        today = datetime.now().date().isoformat()
+        validators = version_validators("stats", get_data_generation(), today)
+        if validators is not None:
+            etag, last_modified, headers = validators
+            if is_not_modified(request.headers, etag, last_modified):
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+        
+        summary = await run_in_threadpool(load_job_stats)
+        last_update = summary["last_updated_at"]
         
         stats = {
-            "totalJobs": total_jobs,
-            "todayJobs": today_jobs,
+            "totalJobs": summary["open_jobs"],
+            "todayJobs": summary["daily_counts"].get(today, 0),
             "lastUpdate": last_update.isoformat() if last_update else None,
-            "categoryStats": category_stats
+            "categoryStats": dict(sorted(summary["category_counts"].items(), key=lambda item: -item[1])),
+            "locationStats": dict(sorted(summary["location_counts"].items(), key=lambda item: -item[1])),
+            "dailyStats": dict(sorted(summary["daily_counts"].items(), reverse=True))
         }
         
-        cursor.close()
-        conn.close()
-        
         return StatsResponse(success=True, data=stats)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}")
 
-@app.get("/search/{job_id}", response_model=JobDetailResponse)
-async def get_job_detail(job_id: str):
-    """채용공고 상세 정보 조회"""
+@app.get("/cache/stats")
+async def cache_stats():
+    """응답 캐시 적중/미스, 메모리 사용량, 요청 제한 거절/대기 시간 조회"""
+    return {
+        "success": True,
+        "data": {
+            "generation": get_data_generation(),
+            "caches": get_cache_stats(),
+            "searchEngine": search_engine.stats(),
+            "suggest": suggest_indexes.stats(),
+            "viewCounter": view_counter.stats(),
+            "rateLimit": rate_limiter.stats(),
+            "admission": admission_gate.stats()
+        }
+    }
+
+def _load_job_details(job_ids: List[str]) -> Dict[str, dict]:
+    """공고/상세/연락처를 한 번의 조인으로 조회하여 공고 id별 캐시 항목(link, data) 생성"""
+    if not job_ids:
+        return {}
+    placeholders = ", ".join(["%s"] * len(job_ids))
+    conn = get_read_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
     try:
-        conn = get_connection()
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
-        # 기본 정보 조회
-        cursor.execute("""
+        # okky_jobs.id(PK) → okky_job_details.link(UNIQUE) → okky_job_contacts.id(PK)
+        cursor.execute(f"""
             SELECT 
                 j.id,
                 j.company,
@@ -438,50 +801,33 @@ async def get_job_detail(job_id: str):
                 j.location,
                 j.career as experience,
                 j.deadline,
-                COALESCE(d.view_count, 0) as views,
+                (COALESCE(d.view_count, 0) + COALESCE(d.local_view_count, 0)) as views,
                 j.created_at,
                 j.updated_at,
-                j.link as original_url
+                j.link as original_url,
+                d.description,
+                d.skill,
+                c.id as contact_id,
+                c.name as contact_name,
+                c.phone as contact_phone,
+                c.email as contact_email
             FROM okky_jobs j
             LEFT JOIN okky_job_details d ON j.link = d.link
-            WHERE j.id = %s
-        """, (job_id,))
-        
-        job = cursor.fetchone()
-        if not job:
-            raise HTTPException(status_code=404, detail="채용공고를 찾을 수 없습니다.")
-        
-        # 기술 스택 조회 (상세 테이블에서)
-        cursor.execute("""
-            SELECT skill
-            FROM okky_job_details
-            WHERE link = (SELECT link FROM okky_jobs WHERE id = %s)
-        """, (job_id,))
-        
-        tech_stack = [row['skill'] for row in cursor.fetchall() if row['skill']]
-        
-        # 연락처 정보 조회
-        cursor.execute("""
-            SELECT c.name, c.phone, c.email
-            FROM okky_job_contacts c
-            JOIN okky_job_details d ON c.id = d.contact_id
-            WHERE d.link = (SELECT link FROM okky_jobs WHERE id = %s)
-        """, (job_id,))
-        
-        contact_row = cursor.fetchone()
+            LEFT JOIN okky_job_contacts c ON c.id = d.contact_id
+            WHERE j.id IN ({placeholders})
+        """, job_ids)
+        jobs = cursor.fetchall()
+    finally:
+        cursor.close()
+        conn.close()
+    
+    entries = {}
+    for job in jobs:
         contact = {
-            "name": contact_row['name'] if contact_row else None,
-            "phone": contact_row['phone'] if contact_row else None,
-            "email": contact_row['email'] if contact_row else None
-        } if contact_row else {}
-        
-        # 조회수 증가 (okky_job_details 테이블에서)
-        cursor.execute("""
-            UPDATE okky_job_details 
-            SET view_count = view_count + 1 
-            WHERE link = (SELECT link FROM okky_jobs WHERE id = %s)
-        """, (job_id,))
-        conn.commit()
+            "name": job['contact_name'],
+            "phone": job['contact_phone'],
+            "email": job['contact_email']
+        } if job['contact_id'] is not None else {}
         
         job_detail = JobDetail(
             id=str(job['id']),
@@ -491,20 +837,111 @@ async def get_job_detail(job_id: str):
             location=job['location'],
             experience=job['experience'],
             deadline=job['deadline'] if job['deadline'] else None,
-            views=(job['views'] or 0) + 1,
+            # 캐시된 응답을 일괄 조회(조회수 미집계)와 함께 쓰므로 DB 값 그대로 (이번 조회는 view_counter 반영 후 표시)
+            views=job['views'] or 0,
             createdAt=job['created_at'].isoformat() if job['created_at'] else None,
             updatedAt=job['updated_at'].isoformat() if job['updated_at'] else None,
             originalUrl=job['original_url'],
-            description="",  # 기본값
+            description=job['description'] or "",
             requirements="",  # 기본값
-            techStack=tech_stack,
+            techStack=normalize_skills(job['skill']),
             contact=contact
         )
+        # 직렬화된 JobDetail만 저장 (단건/일괄 응답 모두 그대로 이어 붙여 전송)
+        entries[str(job['id'])] = {"link": job['original_url'], "data": job_detail.model_dump_json().encode("utf-8")}
+    return entries
+
+
+def canonical_job_id(job_id: str) -> Optional[str]:
+    """경로의 공고 id를 캐시/ETag 키로 쓸 정수 표기로 변환 (007 → 7, 정수가 아니면 None)"""
+    if not (job_id.isascii() and job_id.isdigit()):
+        return None
+    return str(int(job_id))
+
+
+def _cached_job_details(job_ids: List[str], generation: int) -> Dict[str, dict]:
+    """캐시에 없는 공고만 한 번에 조회하여 캐시에 저장"""
+    entries = {}
+    misses = []
+    for job_id in job_ids:
+        entry = detail_cache.get(job_id, generation)
+        if entry is None:
+            misses.append(job_id)
+        else:
+            entries[job_id] = entry
+    for job_id, entry in _load_job_details(misses).items():
+        detail_cache.set(job_id, entry, generation, size=len(entry["data"]))
+        job_links[job_id] = entry["link"]
+        entries[job_id] = entry
+    return entries
+
+
+@app.get("/search/suggest")
+async def suggest_keywords(
+    q: str = Query(..., min_length=1, description="입력 중인 검색어 (초성 검색 지원, 예: ㅋㅋㅇ)"),
+    limit: int = Query(10, ge=1, le=20, description="종류별 최대 항목 수"),
+    types: Optional[str] = Query(None, description="자동완성 종류 (쉼표 구분: companies, titles, skills)")
+):
+    """검색어 자동완성 (세대별 접두어 색인, 크롤링 적재 후 백그라운드에서 재생성)"""
+    kinds = [t.strip() for t in types.split(",") if t.strip()] if types else ["companies", "titles", "skills"]
+    unknown = [k for k in kinds if k not in ("companies", "titles", "skills")]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 자동완성 종류: {', '.join(unknown)}")
+    
+    indexes = suggest_indexes.current(get_data_generation())
+    if indexes is None:
+        return FastJSONResponse(content={"success": True, "ready": False, "data": {kind: [] for kind in kinds}})
+    return FastJSONResponse(content={
+        "success": True,
+        "ready": True,
+        "data": {kind: indexes[kind].suggest(q, limit) for kind in kinds}
+    })
+
+
+@app.post("/search/batch", response_model=JobBatchResponse)
+async def get_job_details_batch(payload: JobBatchRequest):
+    """여러 공고 상세를 한 번에 조회 (목록 미리보기용, 조회수는 집계하지 않음). 없는 id는 missing으로 반환"""
+    job_ids = [str(job_id) for job_id in dict.fromkeys(payload.ids)]
+    if len(job_ids) > DETAIL_BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {DETAIL_BATCH_MAX_IDS}건까지 조회할 수 있습니다.")
+    try:
+        entries = await run_in_threadpool(_cached_job_details, job_ids, get_data_generation())
+        found = [entries[job_id]["data"] for job_id in job_ids if job_id in entries]
+        missing = [job_id for job_id in job_ids if job_id not in entries]
+        body = b'{"success":true,"data":[' + b",".join(found) + b'],"missing":' + dumps(missing) + b'}'
+        return Response(content=body, media_type="application/json")
         
-        cursor.close()
-        conn.close()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"상세 정보 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.get("/search/{job_id}", response_model=JobDetailResponse)
+async def get_job_detail(job_id: str, request: Request):
+    """채용공고 상세 정보 조회 (공고별 캐시, 데이터 세대 + 공고 id ETag 일치 시 304)"""
+    try:
+        # 캐시 항목은 DB id(str(int))로 저장되므로 같은 표기로 맞추고, 정수가 아니면 DB를 조회하지 않음
+        job_id = canonical_job_id(job_id)
+        if job_id is None:
+            raise HTTPException(status_code=404, detail="채용공고를 찾을 수 없습니다.")
+        generation = get_data_generation()
+        validators = version_validators("detail", generation, views_window(DETAIL_CACHE_TTL), job_id)
+        headers = validators[2] if validators is not None else {}
         
-        return JobDetailResponse(success=True, data=job_detail)
+        # 링크를 알고 있으면 DB 조회 없이 304 (조회수는 메모리에서 합산 후 주기적으로 local_view_count에 반영)
+        not_modified = validators is not None and is_not_modified(request.headers, *validators[:2])
+        if not_modified and job_id in job_links:
+            view_counter.add(job_links[job_id])
+            return Response(status_code=304, headers=headers)
+        
+        entry = (await run_in_threadpool(_cached_job_details, [job_id], generation)).get(job_id)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="채용공고를 찾을 수 없습니다.")
+        
+        view_counter.add(entry["link"])
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        body = b'{"success":true,"data":' + entry["data"] + b'}'
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except HTTPException:
         raise
@@ -513,69 +950,89 @@ async def get_job_detail(job_id: str):
 
 
 @app.get("/jobs/export")
-async def export_jobs(keyword: Optional[str] = Query(None)):
-    rows = search_jobs(keyword)
-    if not rows:
+async def export_jobs(
+    keyword: Optional[str] = Query(None),
+    format: str = Query("xlsx", pattern="^(xlsx|csv)$", description="파일 형식 (xlsx, csv)"),
+    fields: Optional[str] = Query(None, description="내보낼 컬럼 (쉼표 구분, 예: title,company,link)")
+):
+    field_list = parse_job_fields(fields)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    filename = f"okky_jobs_export_{timestamp}.{format}".replace(":", "-").replace(" ", "_")
+    media_type = XLSX_MEDIA_TYPE if format == "xlsx" else CSV_MEDIA_TYPE
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    
+    # 같은 조건의 내보내기는 데이터 세대가 같으면 캐시된 파일 바이트를 그대로 전송
+    generation = get_data_generation()
+    cache_key = (format, keyword, ",".join(field_list or ()))
+    cached = export_cache.get(cache_key, generation)
+    if cached is not None:
+        return Response(content=cached, media_type=media_type, headers=headers)
+    
+    # 서버 사이드 커서에서 한 행씩 받아 파일 없이 청크 단위로 전송
+    # (첫 행이 나올 때까지 쿼리 전체를 기다리므로 스레드풀에서, 이후 청크는 StreamingResponse가 스레드풀에서 순회)
+    rows = iter_search_jobs(keyword, fields=field_list)
+    first = await run_in_threadpool(next, rows, None)
+    if first is None:
         return JSONResponse(content={"message": "검색 결과가 없습니다."}, status_code=404)
+    
+    writer = iter_xlsx_chunks if format == "xlsx" else iter_csv_chunks
+    chunks = writer(chain([first], rows))
+    return StreamingResponse(export_cache.tee(cache_key, chunks, generation), media_type=media_type, headers=headers)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    filename = f"okky_jobs_export_{timestamp}.xlsx".replace(":", "-")
-    export_to_excel(rows, filename)
 
-    return FileResponse(
-        path=filename,
-        filename=filename,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
+@app.post("/exports", status_code=202)
+async def create_export(
+    keyword: Optional[str] = Query(None),
+    format: str = Query("xlsx", pattern="^(xlsx|csv)$", description="파일 형식 (xlsx, csv)"),
+    fields: Optional[str] = Query(None, description="내보낼 컬럼 (쉼표 구분)")
+):
+    """백그라운드 내보내기 시작 (진행률은 GET /exports/{id}로 조회)"""
+    field_list = parse_job_fields(fields)
+    try:
+        export = export_manager.submit(keyword, format, field_list)
+    except ExportQueueFull as e:
+        return JSONResponse(status_code=429, content={"success": False, "message": str(e)}, headers={"Retry-After": "30"})
+    return {"success": True, "data": {**export.to_dict(), "statusUrl": f"/exports/{export.id}"}}
+
 
+@app.get("/exports/{export_id}")
+async def get_export(export_id: str):
+    """내보내기 진행률/건수 조회 (완료 시 downloadUrl 포함)"""
+    export = export_manager.get(export_id)
+    if export is None:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    data = export.to_dict()
+    if export.status == "completed":
+        data["downloadUrl"] = f"/exports/{export.id}/download"
+    return {"success": True, "data": data}
 
-@app.post("/crawl")
+
+@app.get("/exports/{export_id}/download")
+async def download_export(export_id: str):
+    """완료된 내보내기 파일 다운로드"""
+    export = export_manager.get(export_id)
+    if export is None:
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다.")
+    if export.status != "completed" or not export.path or not os.path.exists(export.path):
+        return JSONResponse(status_code=409, content={"success": False, "message": f"내보내기가 완료되지 않았습니다 ({export.status})"})
+    media_type = XLSX_MEDIA_TYPE if export.format == "xlsx" else CSV_MEDIA_TYPE
+    return FileResponse(path=export.path, filename=export.filename, media_type=media_type)
+
+
+@app.post("/crawl", status_code=202)
 async def manual_crawl():
     """
-    수동 크롤링 실행 엔드포인트
-    마스터 크롤링 → 상세 크롤링 → DB 저장을 순차적으로 실행
+    수동 크롤링 요청 엔드포인트
+    크롤링 워커가 마스터 크롤링 → 상세 크롤링 → DB 저장을 실행하며,
+    이미 대기/실행 중인 크롤링이 있으면 새로 등록하지 않고 그 실행을 반환
     """
     try:
-        # 백그라운드에서 크롤링 실행
-        def run_crawling():
-            try:
-                from ..crawler.crawler_master import crawl_all_master_jobs
-                from ..crawler.crawler_detail import crawl_detail_jobs
-                from ..db.db import save_master_jobs, save_detail_jobs
-                
-                print("🕷️ [수동 크롤링] 마스터 크롤링 시작...")
-                master_jobs = crawl_all_master_jobs()
-                
-                if master_jobs:
-                    print(f"✅ [수동 크롤링] {len(master_jobs)}건의 마스터 공고 수집")
-                    save_master_jobs(master_jobs)
-                    print("✅ [수동 크롤링] 마스터 공고 DB 저장 완료")
-                    
-                    print("🕷️ [수동 크롤링] 상세 크롤링 시작...")
-                    detail_jobs = crawl_detail_jobs(master_jobs)
-                    
-                    if detail_jobs:
-                        print(f"✅ [수동 크롤링] {len(detail_jobs)}건의 상세 공고 수집")
-                        save_detail_jobs(detail_jobs)
-                        print("✅ [수동 크롤링] 상세 공고 DB 저장 완료")
-                    else:
-                        print("⚠️ [수동 크롤링] 상세 공고가 없습니다")
-                else:
-                    print("⚠️ [수동 크롤링] 마스터 공고가 없습니다")
-                    
-                print("🎉 [수동 크롤링] 모든 크롤링 작업 완료!")
-                
-            except Exception as e:
-                print(f"❌ [수동 크롤링] 오류 발생: {str(e)}")
-        
-        # 별도 스레드에서 크롤링 실행
-        thread = Thread(target=run_crawling)
-        thread.daemon = True
-        thread.start()
-        
-        return JSONResponse({
-            "message": "크롤링이 백그라운드에서 시작되었습니다",
-            "status": "started",
+        run, created = await run_in_threadpool(enqueue_run, "수동 크롤링")
+        return JSONResponse(status_code=202, content={
+            "message": "크롤링 실행이 등록되었습니다" if created else "이미 진행 중인 크롤링이 있습니다",
+            "status": run["status"],
+            "coalesced": not created,
+            "run": run_to_dict(run),
             "timestamp": datetime.now().isoformat()
         })
         
@@ -590,29 +1047,26 @@ async def manual_crawl():
         )
 
 
+@app.get("/crawl/runs/{run_id}")
+async def get_crawl_run(run_id: int):
+    """크롤링 실행 요청 상태 조회 (queued, running, completed, failed, cancelled)"""
+    run = await run_in_threadpool(get_run, run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="크롤링 실행을 찾을 수 없습니다.")
+    return {"success": True, "data": run_to_dict(run)}
+
+
 @app.get("/crawl/status")
 async def crawl_status():
     """
     크롤링 상태 확인 엔드포인트
     """
     try:
-        # 최근 크롤링된 데이터 개수 확인
-        conn = get_connection()
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
-        # 마스터 공고 개수
-        cursor.execute("SELECT COUNT(*) as count FROM okky_jobs")
-        master_count = cursor.fetchone()['count']
-        
-        # 상세 공고 개수
-        cursor.execute("SELECT COUNT(*) as count FROM okky_job_details")
-        detail_count = cursor.fetchone()['count']
-        
-        # 최근 업데이트 시간
-        cursor.execute("SELECT MAX(created_at) as last_update FROM okky_jobs")
-        last_update = cursor.fetchone()['last_update']
-        
-        conn.close()
+        # 최근 크롤링된 데이터 개수 (job_stats 요약 테이블)
+        summary = await run_in_threadpool(load_job_stats)
+        master_count = summary["master_jobs"]
+        detail_count = summary["detail_jobs"]
+        last_update = summary["last_created_at"]
         
         return JSONResponse({
             "master_jobs_count": master_count,
@@ -622,6 +1076,16 @@ async def crawl_status():
             "timestamp": datetime.now().isoformat()
         })
         
+    except HTTPException as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            headers=e.headers,
+            content={
+                "message": e.detail,
+                "status": "initializing",
+                "timestamp": datetime.now().isoformat()
+            }
+        )
     except Exception as e:
         return JSONResponse(
             status_code=500,
@@ -666,11 +1130,11 @@ async def get_realtime_logs():
     """실시간 크롤링 로그 조회"""
     try:
         logger = CrawlingLogger()
-        is_running = logger.is_crawling_running()
+        history_id = logger.get_running_history_id()
         
-        if is_running:
-            logs = logger.get_recent_logs(50)
-            progress = logger.get_current_progress()
+        if history_id is not None:
+            logs = logger.get_recent_logs(50, history_id=history_id)
+            progress = logger.get_current_progress(history_id=history_id)
             
             return {
                 "success": True,
@@ -703,19 +1167,81 @@ async def get_realtime_logs():
             }
         )
 
+@app.get("/crawl/logs/stream")
+async def stream_crawling_logs(
+    request: Request,
+    last_event_id: Optional[int] = Query(None, alias="lastEventId", description="재연결 시 마지막으로 받은 로그 id (Last-Event-ID 헤더와 같음)")
+):
+    """크롤링 로그/진행 상태 SSE 스트림 (log 이벤트: 로그 한 건, status 이벤트: 진행 상태 변경)"""
+    header = request.headers.get("last-event-id")
+    if header:
+        try:
+            last_event_id = int(header)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 Last-Event-ID 값입니다.")
+    
+    async def events():
+        log_stream_bus.subscribe()
+        try:
+            # 첫 tail이 끝날 때까지 대기
+            for _ in range(50):
+                if log_stream_bus.last_id is not None:
+                    break
+                await asyncio.sleep(0.1)
+            
+            status_version = log_stream_bus.status_version
+            status = log_stream_bus.status
+            yield format_sse("status", status)
+            if last_event_id is None:
+                # 처음 연결: 현재(마지막) 크롤링의 최근 로그부터
+                backlog = log_stream_bus.recent(status.get("historyId"))
+                cursor = log_stream_bus.last_id or 0
+            else:
+                backlog = await run_in_threadpool(log_stream_bus.replay, last_event_id)
+                cursor = last_event_id
+            for event_id, event in backlog:
+                yield format_sse("log", event, event_id)
+                cursor = max(cursor, event_id)
+            
+            last_sent = time.monotonic()
+            while not await request.is_disconnected():
+                pending, complete = log_stream_bus.events_after(cursor)
+                if not complete:
+                    # 폴링 사이에 버퍼 크기보다 많은 로그가 쌓여 밀려났으면 빠진 구간을 DB에서 다시 읽음
+                    pending = await run_in_threadpool(log_stream_bus.replay, cursor)
+                for event_id, event in pending:
+                    yield format_sse("log", event, event_id)
+                    cursor = event_id
+                sent = bool(pending)
+                if log_stream_bus.status_version != status_version:
+                    status_version = log_stream_bus.status_version
+                    yield format_sse("status", log_stream_bus.status)
+                    sent = True
+                if sent:
+                    last_sent = time.monotonic()
+                elif time.monotonic() - last_sent > LOG_STREAM_KEEPALIVE:
+                    yield ": keep-alive\n\n"
+                    last_sent = time.monotonic()
+                await asyncio.sleep(0.5)
+        finally:
+            log_stream_bus.unsubscribe()
+    
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(events(), media_type="text/event-stream", headers=headers)
+
 @app.get("/crawl/history")
-async def get_crawling_history():
-    """크롤링 히스토리 조회"""
+async def get_crawling_history(request: Request):
+    """크롤링 히스토리 조회 (진행 중 상태는 데이터 세대와 무관하게 바뀌므로 본문 ETag로 비교)"""
     try:
         logger = CrawlingLogger()
         history = logger.get_crawling_history(50)
         
-        return {
-            "success": True,
-            "data": {
-                "history": history
-            }
-        }
+        body = dumps({"success": True, "data": {"history": history}})
+        etag = make_etag(body)
+        headers = cache_headers("history", etag)
+        if is_not_modified(request.headers, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
         return JSONResponse(
@@ -732,18 +1258,26 @@ async def get_crawling_history():
 
 @app.post("/crawl/stop")
 async def stop_crawling():
-    """크롤링 중지"""
+    """크롤링 중지 (대기 중이면 바로 취소, 실행 중이면 워커가 다음 페이지 전에 중단)"""
     try:
-        logger = CrawlingLogger()
-        
-        # 진행 중인 크롤링 히스토리를 실패로 업데이트
-        if logger.is_crawling_running():
-            logger.update_crawling_history("실패", 0)
-            logger.log_warning("크롤링이 사용자에 의해 중지되었습니다.")
+        run = await run_in_threadpool(request_cancel)
+        if run is None:
+            # 워커 밖에서 시작되어 남아 있는 진행중 히스토리는 실패로 정리
+            logger = CrawlingLogger()
+            history_id = logger.get_running_history_id()
+            if history_id is not None:
+                logger.current_history_id = history_id
+                logger.log_warning("크롤링이 사용자에 의해 중지되었습니다.")
+                logger.update_crawling_history("실패", 0)
+            return {
+                "success": True,
+                "message": "진행 중인 크롤링 실행이 없습니다."
+            }
         
         return {
             "success": True,
-            "message": "크롤링이 중지되었습니다."
+            "message": "크롤링이 취소되었습니다." if run["status"] == "cancelled" else "크롤링 중지를 요청했습니다.",
+            "data": run_to_dict(run)
         }
         
     except Exception as e:
@@ -0,0 +1,77 @@
+"""
+검색 응답 직렬화 (Pydantic 모델 생성/검증 없이 행 → dict → orjson)
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any):
+    # orjson이 직접 처리하지 못하는 DB 값 (DECIMAL 등)
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def dumps(content: Any) -> bytes:
+    """orjson 직렬화 (datetime은 ISO 8601, 알 수 없는 타입은 문자열)"""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def search_item(row: dict) -> dict:
+    """검색 결과 행(SQL/검색 엔진 공통 키)을 JobSearchResult 형태의 dict로 변환"""
+    created_at = row['created_at']
+    updated_at = row['updated_at']
+    return {
+        "id": str(row['id']),
+        "company": row['company'],
+        "title": row['title'],
+        "category": row['category'],
+        "location": row['location'],
+        "experience": row['experience'],  # career as experience로 매핑됨
+        "deadline": row['deadline'] or None,
+        "views": row['views'] or 0,
+        "createdAt": created_at.isoformat() if created_at else None,
+        "updatedAt": updated_at.isoformat() if updated_at else None,
+        "originalUrl": row['original_url'],
+    }
+
+
+def build_search_payload(
+    rows: Iterable[dict],
+    total: int,
+    page: int,
+    limit: int,
+    filters: Dict[str, Any],
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+) -> dict:
+    """SearchResponse와 같은 구조의 응답 본문"""
+    total_pages = (total + limit - 1) // limit
+    return {
+        "success": True,
+        "data": [search_item(row) for row in rows],
+        "pagination": {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "totalPages": total_pages,
+            "hasNext": page < total_pages,
+            "hasPrev": page > 1,
+        },
+        "filters": filters,
+        "facets": facets,
+    }
@@ -4,10 +4,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from urllib.parse import urljoin
-from typing import List, Optional
+from typing import Callable, List, Optional
 import re, time, os
 
-from .crawler_master import MasterJob
+from .crawler_master import MasterJob, CrawlCancelled
 from ..db.models import DetailJob
 
 from selenium import webdriver
@@ -86,9 +86,11 @@ def crawl_detail_job(link: str) -> Optional[DetailJob]:
     finally:
         driver.quit()
 
-def crawl_detail_jobs(master_jobs: List[MasterJob]) -> List[DetailJob]:
+def crawl_detail_jobs(master_jobs: List[MasterJob], should_cancel: Optional[Callable[[], bool]] = None) -> List[DetailJob]:
     detail_jobs = []
-    for job in master_jobs:
+    for i, job in enumerate(master_jobs):
+        if should_cancel and should_cancel():
+            raise CrawlCancelled(f"상세 크롤링 {i}/{len(master_jobs)}건에서 중단")
         print(f"🔍 상세 크롤링 중: {job.title}")
         detail = crawl_detail_job(job.link)
         if detail:
@@ -1,6 +1,6 @@
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-from typing import List, NamedTuple
+from typing import Callable, List, Optional
 import re, math, time
 
 from selenium import webdriver
@@ -11,20 +11,13 @@ from selenium.common.exceptions import TimeoutException
 
 from ..utils.driver_utils import setup_driver
 from ..utils.crawling_logger import CrawlingLogger
+from ..db.models import MasterJob  # 기존 import 경로 유지 (crawler_master.MasterJob)
 
 JOB_POST_LINK_SELECTOR = 'a[href^="/recruits/"]'
 BASE_URL = "https://jobs.okky.kr/contract"
 
-class MasterJob(NamedTuple):
-    title: str
-    company: str
-    link: str
-    deadline: str
-    category: str
-    position: str
-    location: str
-    career: str
-    salary: str
+class CrawlCancelled(Exception):
+    """취소 요청으로 크롤링을 중단 (페이지 사이에서 확인)"""
 
 def fetch_total_positions(soup: BeautifulSoup) -> int:
     span_tag = soup.select_one("div.sm\\:w-32 span.font-semibold")
@@ -89,12 +82,19 @@ def fetch_master_jobs(driver: webdriver.Chrome, url: str, is_first_page=False):
         print("❌ 마스터 페이지 로딩 시간 초과")
         return [], 0
 
-def crawl_all_master_jobs() -> List[MasterJob]:
-    logger = CrawlingLogger()
-    history_id = logger.start_crawling_history()
+def crawl_all_master_jobs(
+    logger: Optional[CrawlingLogger] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
+) -> List[MasterJob]:
+    """마스터 공고 전체 수집 (logger를 넘기면 크롤링 히스토리는 호출한 쪽에서 관리, should_cancel은 페이지마다 확인)"""
+    owns_history = logger is None
+    if owns_history:
+        logger = CrawlingLogger()
+        history_id = logger.start_crawling_history()
     
     driver = setup_driver()
     all_jobs = []
+    failed = False
     
     try:
         logger.log_info("크롤링 시작: OKKY 채용공고 수집")
@@ -107,6 +107,8 @@ def crawl_all_master_jobs() -> List[MasterJob]:
         logger.log_info(f"총 {total_pages} 페이지 순회 예정")
 
         for page in range(2, total_pages + 1):
+            if should_cancel and should_cancel():
+                raise CrawlCancelled(f"마스터 크롤링 {page - 1}/{total_pages} 페이지에서 중단")
             page_url = f"{BASE_URL}?page={page}"
             progress = int((page - 1) / total_pages * 100)
             logger.log_progress(f"페이지 {page}/{total_pages} 처리 중...", progress)
@@ -120,17 +122,26 @@ def crawl_all_master_jobs() -> List[MasterJob]:
             
             time.sleep(1)
             
+    except CrawlCancelled:
+        failed = True
+        if owns_history:
+            logger.log_warning("크롤링이 사용자에 의해 중지되었습니다.")
+            logger.update_crawling_history("실패", len(all_jobs))
+        raise
     except Exception as e:
+        failed = True
         logger.log_error(f"크롤링 중 오류 발생: {str(e)}")
-        logger.update_crawling_history("실패", len(all_jobs))
+        if owns_history:
+            logger.update_crawling_history("실패", len(all_jobs))
         raise e
     finally:
         driver.quit()
         
-        if history_id:
+        if owns_history and history_id and not failed:
             logger.update_crawling_history("완료", len(all_jobs))
         
-        logger.log_success(f"총 {len(all_jobs)}건 수집 완료")
+        if not failed:
+            logger.log_success(f"총 {len(all_jobs)}건 수집 완료")
         print(f"✅ 총 {len(all_jobs)}건 수집 완료")
     
     return all_jobs
@@ -0,0 +1,81 @@
+"""
+크롤링 파이프라인: 마스터 크롤링 → 상세 크롤링 → DB 적재
+"""
+
+import time
+from typing import Callable, List, Optional
+
+from .crawler_master import crawl_all_master_jobs, MasterJob, CrawlCancelled
+from .crawler_detail import crawl_detail_jobs
+from ..db.db import save_master_jobs, save_detail_jobs
+from ..db.ingest import INGEST_MODE, bulk_ingest
+from ..db.archive import mark_closed_postings, archive_closed_postings
+from ..db.job_stats import recompute_job_stats
+from ..utils.crawling_logger import CrawlingLogger
+
+
+def _prefixed(prefix: str, counts: dict) -> dict:
+    return {f"{prefix}_{key}": value for key, value in counts.items()}
+
+
+def _save_row_by_row(master_jobs: List[MasterJob], should_cancel: Optional[Callable[[], bool]] = None) -> dict:
+    """기존 방식: 마스터 저장 후 상세 크롤링, 상세 저장 (저장 시간만 합산)"""
+    stats = {"ingest_ms": 0}
+    if master_jobs:
+        started = time.monotonic()
+        stats.update(_prefixed("jobs", save_master_jobs(master_jobs)))
+        stats["ingest_ms"] += int((time.monotonic() - started) * 1000)
+
+    detail_jobs = crawl_detail_jobs(master_jobs, should_cancel)
+    if detail_jobs:
+        started = time.monotonic()
+        stats.update(_prefixed("details", save_detail_jobs(detail_jobs)))
+        stats["ingest_ms"] += int((time.monotonic() - started) * 1000)
+    return stats
+
+
+def run_crawl_pipeline(
+    label: str = "크롤링",
+    logger: Optional[CrawlingLogger] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
+) -> List[MasterJob]:
+    """전체 크롤링을 실행하고 크롤링 히스토리에 결과/적재 통계를 기록 (should_cancel이 True가 되면 다음 페이지 전에 중단)"""
+    logger = logger or CrawlingLogger()
+    logger.start_crawling_history()
+    master_jobs = []
+    try:
+        master_jobs = crawl_all_master_jobs(logger=logger, should_cancel=should_cancel)
+        print(f"✅ [{label}] {len(master_jobs)}건의 마스터 공고 수집")
+
+        if INGEST_MODE == "staging":
+            # 크롤링이 끝난 뒤 한 번에 적재하여 운영 테이블 잠금 시간을 최소화
+            detail_jobs = crawl_detail_jobs(master_jobs, should_cancel)
+            stats = bulk_ingest(master_jobs, detail_jobs)
+        else:
+            stats = _save_row_by_row(master_jobs, should_cancel)
+
+        logger.record_ingest_stats(**stats)
+        logger.log_info(
+            f"DB 적재 완료 ({stats.get('ingest_ms')}ms) - "
+            f"마스터 신규 {stats.get('jobs_inserted', 0)}/변경 {stats.get('jobs_changed', 0)}/동일 {stats.get('jobs_unchanged', 0)}, "
+            f"상세 신규 {stats.get('details_inserted', 0)}/변경 {stats.get('details_changed', 0)}/동일 {stats.get('details_unchanged', 0)}"
+        )
+        
+        # 전체 목록에서 사라진 공고 마감 처리 및 오래된 마감 공고 보관 이동
+        closed = mark_closed_postings([j.link for j in master_jobs])
+        archived = archive_closed_postings()
+        logger.log_info(f"마감 처리 {closed['closed']}건, 재게시 {closed['reopened']}건, 보관 이동 {archived}건")
+        
+        # 증분 갱신된 통계를 전체 재계산으로 보정 (마감/카테고리 변경 반영)
+        recompute_job_stats()
+        
+        logger.update_crawling_history("완료", len(master_jobs))
+        return master_jobs
+    except CrawlCancelled as e:
+        logger.log_warning(f"크롤링이 사용자에 의해 중지되었습니다: {e}")
+        logger.update_crawling_history("실패", len(master_jobs))
+        raise
+    except Exception as e:
+        logger.log_error(f"크롤링 파이프라인 오류: {str(e)}")
+        logger.update_crawling_history("실패", len(master_jobs))
+        raise
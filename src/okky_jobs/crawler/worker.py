@@ -0,0 +1,100 @@
+"""
+크롤링 워커 프로세스: crawl_runs에 등록된 실행 요청을 하나씩 가져와 크롤링 파이프라인 실행
+
+실행: python -m src.okky_jobs.crawler.worker
+"""
+
+import os
+import socket
+import threading
+import time
+from typing import Optional
+
+from .crawler_master import CrawlCancelled
+from .pipeline import run_crawl_pipeline
+from ..db.crawl_runs import claim_next_run, heartbeat, finish_run, fail_orphaned_runs
+from ..db.job_stats import ensure_job_stats
+from ..utils.crawling_logger import CrawlingLogger
+
+# 대기 요청 확인 주기(초) / 실행 중 heartbeat 및 취소 요청 확인 주기(초)
+CRAWL_WORKER_POLL_INTERVAL = float(os.getenv("CRAWL_WORKER_POLL_INTERVAL", 5))
+CRAWL_WORKER_HEARTBEAT_INTERVAL = float(os.getenv("CRAWL_WORKER_HEARTBEAT_INTERVAL", 10))
+
+
+class RunMonitor:
+    """실행 중 heartbeat를 기록하고 취소 요청을 받아 두는 스레드 (크롤러는 페이지마다 cancelled()만 확인)"""
+
+    def __init__(self, run_id: int, logger: CrawlingLogger):
+        self.run_id = run_id
+        self.logger = logger
+        self._cancel = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"crawl-run-{run_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=CRAWL_WORKER_HEARTBEAT_INTERVAL + 5)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if heartbeat(self.run_id, self.logger.current_history_id):
+                    self._cancel.set()
+            except Exception as e:
+                print(f"⚠️ [워커] heartbeat 실패: {e}")
+            self._stop.wait(CRAWL_WORKER_HEARTBEAT_INTERVAL)
+
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+
+def run_once(worker: str) -> Optional[int]:
+    """대기 요청 하나를 실행하고 실행한 요청 id를 반환 (대기 요청이 없으면 None)"""
+    run = claim_next_run(worker)
+    if run is None:
+        return None
+
+    run_id = run["id"]
+    logger = CrawlingLogger()
+    print(f"🕷️ [워커] 실행 {run_id} 시작 ({run['label']})")
+    with RunMonitor(run_id, logger) as monitor:
+        try:
+            run_crawl_pipeline(run["label"], logger=logger, should_cancel=monitor.cancelled)
+            finish_run(run_id, "completed", history_id=logger.current_history_id)
+            print(f"🎉 [워커] 실행 {run_id} 완료")
+        except CrawlCancelled as e:
+            finish_run(run_id, "cancelled", error=str(e), history_id=logger.current_history_id)
+            print(f"⏹️ [워커] 실행 {run_id} 취소: {e}")
+        except Exception as e:
+            finish_run(run_id, "failed", error=str(e), history_id=logger.current_history_id)
+            print(f"❌ [워커] 실행 {run_id} 실패: {e}")
+    return run_id
+
+
+def main():
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    print(f"✅ [워커] 크롤링 워커 시작 ({worker})")
+    orphaned = fail_orphaned_runs()
+    if orphaned:
+        print(f"⚠️ [워커] heartbeat가 끊긴 실행 {orphaned}건 실패 처리")
+    # 첫 배포 등으로 통계 행이 없으면 첫 크롤링 전에 만들어 둠 (API는 행을 만들지 않음)
+    try:
+        ensure_job_stats()
+    except Exception as e:
+        print(f"⚠️ [워커] 공고 통계 초기화 실패: {e}")
+
+    while True:
+        try:
+            if run_once(worker) is not None:
+                continue
+        except Exception as e:
+            print(f"❌ [워커] 실행 요청 처리 중 오류: {e}")
+        time.sleep(CRAWL_WORKER_POLL_INTERVAL)
+
+
+if __name__ == "__main__":
+    main()
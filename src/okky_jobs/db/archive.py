@@ -0,0 +1,137 @@
+"""
+마감 공고 감지 및 보관(archive) 테이블 이동
+"""
+
+import os
+from typing import List
+
+from .db import get_connection, mark_primary_write, bump_data_generation
+
+# 마감 후 이 기간(일)이 지나면 okky_jobs_archive로 이동
+CLOSED_ARCHIVE_DAYS = int(os.getenv("CLOSED_ARCHIVE_DAYS", 30))
+# 수집 건수가 현재 게시 중인 공고 수의 이 비율보다 적으면 부분 크롤링으로 보고 마감 처리를 건너뜀
+CLOSED_DETECTION_MIN_RATIO = float(os.getenv("CLOSED_DETECTION_MIN_RATIO", 0.8))
+
+JOB_COLUMNS = (
+    "id, title, company, link, deadline, category, position, location, career, salary, "
+    "content_hash, closed_at, created_at, updated_at"
+)
+DETAIL_COLUMNS = (
+    "id, link, registered_at, view_count, local_view_count, start_date, work_location, pay_date, skill, description, "
+    "contact_id, content_hash, created_at, updated_at"
+)
+
+
+def _prefixed(alias: str, columns: str) -> str:
+    return ", ".join(f"{alias}.{c.strip()}" for c in columns.split(","))
+
+
+def mark_closed_postings(seen_links: List[str], batch_size: int = 1000) -> dict:
+    """이번 전체 마스터 크롤링에서 보이지 않은 공고를 일괄 마감 처리하고, 다시 보인 공고는 재개"""
+    result = {"closed": 0, "reopened": 0}
+    links = list(dict.fromkeys(seen_links))
+    if not links:
+        return result
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT COUNT(*) FROM okky_jobs WHERE closed_at IS NULL")
+        open_count = cursor.fetchone()[0]
+        if len(links) < open_count * CLOSED_DETECTION_MIN_RATIO:
+            print(f"⚠️ 수집 {len(links)}건이 게시 중 {open_count}건에 비해 적어 마감 처리를 건너뜁니다")
+            return result
+
+        cursor.execute("""
+            CREATE TEMPORARY TABLE seen_links (
+                link VARCHAR(500) NOT NULL PRIMARY KEY
+            ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+        """)
+        for i in range(0, len(links), batch_size):
+            cursor.executemany("INSERT IGNORE INTO seen_links (link) VALUES (%s)", [(l,) for l in links[i:i + batch_size]])
+
+        conn.begin()
+        try:
+            # 집합 차이: 저장된 게시 중 공고 - 이번에 본 공고
+            cursor.execute("""
+                UPDATE okky_jobs j
+                LEFT JOIN seen_links s ON s.link = j.link
+                SET j.closed_at = NOW(), j.updated_at = j.updated_at
+                WHERE j.closed_at IS NULL AND s.link IS NULL
+            """)
+            result["closed"] = cursor.rowcount
+            cursor.execute("""
+                UPDATE okky_jobs j
+                JOIN seen_links s ON s.link = j.link
+                SET j.closed_at = NULL, j.updated_at = j.updated_at
+                WHERE j.closed_at IS NOT NULL
+            """)
+            result["reopened"] = cursor.rowcount
+            if result["closed"] or result["reopened"]:
+                bump_data_generation(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        mark_primary_write()
+        print(f"✅ 마감 처리 {result['closed']}건, 재게시 {result['reopened']}건")
+        return result
+    except Exception as e:
+        print(f"❌ 마감 공고 처리 실패: {e}")
+        return result
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def archive_closed_postings(days: int = CLOSED_ARCHIVE_DAYS) -> int:
+    """마감 후 days일이 지난 공고와 상세를 보관 테이블로 옮기고 이동 건수를 반환"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        conn.begin()
+        try:
+            cursor.execute(f"""
+                REPLACE INTO okky_job_details_archive ({DETAIL_COLUMNS})
+                SELECT {_prefixed('d', DETAIL_COLUMNS)}
+                FROM okky_job_details d
+                JOIN okky_jobs j ON j.link = d.link
+                WHERE j.closed_at < NOW() - INTERVAL %s DAY
+            """, (days,))
+            cursor.execute(f"""
+                REPLACE INTO okky_jobs_archive ({JOB_COLUMNS})
+                SELECT {JOB_COLUMNS}
+                FROM okky_jobs
+                WHERE closed_at < NOW() - INTERVAL %s DAY
+            """, (days,))
+            cursor.execute("""
+                DELETE d FROM okky_job_details d
+                JOIN okky_jobs j ON j.link = d.link
+                WHERE j.closed_at < NOW() - INTERVAL %s DAY
+            """, (days,))
+            cursor.execute("DELETE FROM okky_jobs WHERE closed_at < NOW() - INTERVAL %s DAY", (days,))
+            archived = cursor.rowcount
+            # 다시 게시되어 운영 테이블에 있는 공고는 보관본을 제거
+            cursor.execute("""
+                DELETE a FROM okky_jobs_archive a
+                JOIN okky_jobs j ON j.link = a.link
+            """)
+            cursor.execute("""
+                DELETE a FROM okky_job_details_archive a
+                JOIN okky_job_details d ON d.link = a.link
+            """)
+            if archived:
+                bump_data_generation(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        mark_primary_write()
+        print(f"✅ 마감 공고 {archived}건 보관 테이블로 이동")
+        return archived
+    except Exception as e:
+        print(f"❌ 마감 공고 보관 실패: {e}")
+        return 0
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,208 @@
+"""
+크롤링 실행 요청(crawl_runs) 관리
+
+API와 스케줄러는 실행을 등록만 하고, 크롤링 워커 프로세스가 등록 순서대로 하나씩 실행한다.
+대기/실행 중인 요청이 있으면 새로 등록하지 않고 그 요청을 돌려준다 (single-flight).
+"""
+
+import os
+from typing import Optional, Tuple
+
+import pymysql
+
+from .db import get_connection
+
+# 워커 heartbeat가 이 시간(초) 이상 끊긴 실행은 실패 처리 (워커 비정상 종료 대비)
+CRAWL_RUN_STALE_SECONDS = int(os.getenv("CRAWL_RUN_STALE_SECONDS", 600))
+
+ACTIVE_STATUSES = ("queued", "running")
+_ENQUEUE_LOCK = "okky_crawl_runs_enqueue"
+_COLUMNS = (
+    "id, label, status, cancel_requested, worker, history_id, error, "
+    "requested_at, started_at, heartbeat_at, finished_at"
+)
+
+
+def run_to_dict(run: Optional[dict]) -> Optional[dict]:
+    """API 응답 형태로 변환"""
+    if run is None:
+        return None
+    return {
+        "runId": run["id"],
+        "label": run["label"],
+        "status": run["status"],
+        "cancelRequested": bool(run["cancel_requested"]),
+        "historyId": run["history_id"],
+        "error": run["error"],
+        "requestedAt": run["requested_at"].isoformat() if run["requested_at"] else None,
+        "startedAt": run["started_at"].isoformat() if run["started_at"] else None,
+        "finishedAt": run["finished_at"].isoformat() if run["finished_at"] else None,
+    }
+
+
+def _expire_stale_runs(cursor, error: str = "워커 응답 없음") -> int:
+    """heartbeat가 끊긴 실행과 그 크롤링 히스토리를 실패 처리하고 건수 반환"""
+    # 히스토리를 먼저 닫음 (실행 상태가 바뀌면 조인 대상에서 빠지므로)
+    cursor.execute("""
+        UPDATE crawling_history h
+        JOIN crawl_runs r ON r.history_id = h.id
+        SET h.status = '실패', h.ended_at = NOW(),
+            h.duration = TIMESTAMPDIFF(MICROSECOND, h.started_at, NOW()) DIV 1000
+        WHERE r.status = 'running' AND r.heartbeat_at < NOW() - INTERVAL %s SECOND
+          AND h.status = '진행중'
+    """, (CRAWL_RUN_STALE_SECONDS,))
+    cursor.execute("""
+        UPDATE crawl_runs
+        SET status = 'failed', error = %s, finished_at = NOW()
+        WHERE status = 'running' AND heartbeat_at < NOW() - INTERVAL %s SECOND
+    """, (error, CRAWL_RUN_STALE_SECONDS))
+    return cursor.rowcount
+
+
+def _active_run(cursor) -> Optional[dict]:
+    cursor.execute(f"""
+        SELECT {_COLUMNS} FROM crawl_runs
+        WHERE status IN ('queued', 'running')
+        ORDER BY id
+        LIMIT 1
+    """)
+    return cursor.fetchone()
+
+
+def enqueue_run(label: str) -> Tuple[dict, bool]:
+    """실행 등록 (이미 대기/실행 중인 요청이 있으면 그 요청과 False 반환)"""
+    conn = get_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        # 동시에 들어온 요청이 둘 다 등록하지 않도록 이름 잠금으로 직렬화
+        cursor.execute("SELECT GET_LOCK(%s, 10) AS locked", (_ENQUEUE_LOCK,))
+        if not cursor.fetchone()["locked"]:
+            raise RuntimeError("크롤링 실행 등록 잠금을 얻지 못했습니다")
+        try:
+            _expire_stale_runs(cursor)
+            run = _active_run(cursor)
+            if run is not None:
+                return run, False
+            cursor.execute("INSERT INTO crawl_runs (label, status) VALUES (%s, 'queued')", (label,))
+            run_id = cursor.lastrowid
+            conn.commit()
+            cursor.execute(f"SELECT {_COLUMNS} FROM crawl_runs WHERE id = %s", (run_id,))
+            return cursor.fetchone(), True
+        finally:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (_ENQUEUE_LOCK,))
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def get_run(run_id: Optional[int] = None) -> Optional[dict]:
+    """실행 요청 조회 (run_id가 없으면 가장 최근 요청)"""
+    conn = get_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        if run_id is None:
+            cursor.execute(f"SELECT {_COLUMNS} FROM crawl_runs ORDER BY id DESC LIMIT 1")
+        else:
+            cursor.execute(f"SELECT {_COLUMNS} FROM crawl_runs WHERE id = %s", (run_id,))
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def request_cancel(run_id: Optional[int] = None) -> Optional[dict]:
+    """실행 취소 요청 (대기 중이면 바로 취소, 실행 중이면 워커가 다음 페이지 전에 중단)"""
+    conn = get_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        run = _active_run(cursor) if run_id is None else None
+        target = run["id"] if run is not None else run_id
+        if target is None:
+            return None
+        cursor.execute("""
+            UPDATE crawl_runs
+            SET status = 'cancelled', cancel_requested = 1, finished_at = NOW()
+            WHERE id = %s AND status = 'queued'
+        """, (target,))
+        cursor.execute("""
+            UPDATE crawl_runs SET cancel_requested = 1
+            WHERE id = %s AND status = 'running'
+        """, (target,))
+        conn.commit()
+        cursor.execute(f"SELECT {_COLUMNS} FROM crawl_runs WHERE id = %s", (target,))
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def claim_next_run(worker: str) -> Optional[dict]:
+    """가장 오래된 대기 요청을 실행 상태로 가져옴 (다른 워커가 먼저 가져가면 None)"""
+    conn = get_connection()
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        cursor.execute("SELECT id FROM crawl_runs WHERE status = 'queued' ORDER BY id LIMIT 1")
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        cursor.execute("""
+            UPDATE crawl_runs
+            SET status = 'running', worker = %s, started_at = NOW(), heartbeat_at = NOW()
+            WHERE id = %s AND status = 'queued'
+        """, (worker, row["id"]))
+        if cursor.rowcount == 0:
+            return None
+        conn.commit()
+        cursor.execute(f"SELECT {_COLUMNS} FROM crawl_runs WHERE id = %s", (row["id"],))
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def heartbeat(run_id: int, history_id: Optional[int] = None) -> bool:
+    """워커 생존 기록 후 취소 요청 여부 반환"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            UPDATE crawl_runs
+            SET heartbeat_at = NOW(), history_id = COALESCE(%s, history_id)
+            WHERE id = %s
+        """, (history_id, run_id))
+        cursor.execute("SELECT cancel_requested FROM crawl_runs WHERE id = %s", (run_id,))
+        row = cursor.fetchone()
+        conn.commit()
+        return bool(row and row[0])
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def finish_run(run_id: int, status: str, error: Optional[str] = None, history_id: Optional[int] = None):
+    """실행 종료 기록 (completed, failed, cancelled)"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            UPDATE crawl_runs
+            SET status = %s, error = %s, history_id = COALESCE(%s, history_id), finished_at = NOW()
+            WHERE id = %s
+        """, (status, error, history_id, run_id))
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def fail_orphaned_runs() -> int:
+    """워커 시작 시 heartbeat가 끊긴(종료된 워커의) 실행을 실패 처리 (같은 호스트의 다른 워커 실행은 유지)"""
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        count = _expire_stale_runs(cursor)
+        conn.commit()
+        return count
+    finally:
+        cursor.close()
+        conn.close()
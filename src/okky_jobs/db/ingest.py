@@ -0,0 +1,237 @@
+"""
+크롤링 결과 일괄 적재 (스테이징 테이블 적재 → 집합 단위 병합)
+"""
+
+import os
+import time
+from typing import List
+
+from .db import get_connection, mark_primary_write, bump_data_generation
+from .job_stats import apply_job_stats_delta
+from .models import MasterJob, DetailJob, master_content_hash, detail_content_hash
+from ..utils.skill_utils import normalize_skills
+
+# upsert: 행 단위 저장(save_master_jobs/save_detail_jobs), staging: 스테이징 적재 후 병합
+INGEST_MODE = os.getenv("INGEST_MODE", "upsert")
+# 스테이징 테이블 다중 행 INSERT 한 번에 보낼 행 수
+STAGING_BATCH_SIZE = int(os.getenv("STAGING_BATCH_SIZE", 1000))
+
+# 연결 단위 임시 테이블이므로 동시에 여러 적재가 돌아도 충돌하지 않음
+CREATE_STAGING_TABLES = [
+    """
+    CREATE TEMPORARY TABLE okky_jobs_staging (
+        title VARCHAR(255) NOT NULL,
+        company VARCHAR(255),
+        link VARCHAR(500) NOT NULL,
+        deadline VARCHAR(50),
+        category VARCHAR(100),
+        position VARCHAR(100),
+        location VARCHAR(100),
+        career VARCHAR(100),
+        salary VARCHAR(50),
+        content_hash CHAR(40),
+        KEY idx_link (link)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """,
+    """
+    CREATE TEMPORARY TABLE okky_job_details_staging (
+        link VARCHAR(500) NOT NULL,
+        registered_at VARCHAR(100),
+        view_count INT DEFAULT 0,
+        start_date VARCHAR(100),
+        work_location VARCHAR(255),
+        pay_date VARCHAR(50),
+        skill VARCHAR(255),
+        description TEXT,
+        contact_name VARCHAR(100),
+        contact_phone VARCHAR(50),
+        contact_email VARCHAR(100),
+        content_hash CHAR(40),
+        KEY idx_link (link),
+        KEY idx_contact (contact_name, contact_phone, contact_email)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """,
+    """
+    CREATE TEMPORARY TABLE job_skills_staging (
+        link VARCHAR(500) NOT NULL,
+        skill VARCHAR(100) NOT NULL,
+        PRIMARY KEY (link, skill)
+    ) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci
+    """,
+]
+
+# 내용 해시가 같은 행은 병합 대상에서 제외 (updated_at 유지, 쓰기 생략)
+MERGE_MASTER_SQL = """
+INSERT INTO okky_jobs (title, company, link, deadline, category, position, location, career, salary, content_hash)
+SELECT s.title, s.company, s.link, s.deadline, s.category, s.position, s.location, s.career, s.salary, s.content_hash
+FROM okky_jobs_staging s
+WHERE NOT EXISTS (
+    SELECT 1 FROM okky_jobs j WHERE j.link = s.link AND j.content_hash = s.content_hash
+)
+ON DUPLICATE KEY UPDATE
+    updated_at = IF(okky_jobs.content_hash <=> VALUES(content_hash), okky_jobs.updated_at, CURRENT_TIMESTAMP),
+    title = VALUES(title),
+    company = VALUES(company),
+    deadline = VALUES(deadline),
+    category = VALUES(category),
+    position = VALUES(position),
+    location = VALUES(location),
+    career = VALUES(career),
+    salary = VALUES(salary),
+    content_hash = VALUES(content_hash)
+"""
+
+MERGE_CONTACTS_SQL = """
+INSERT INTO okky_job_contacts (name, phone, email)
+SELECT DISTINCT contact_name, contact_phone, contact_email
+FROM okky_job_details_staging
+WHERE contact_name <> '' OR contact_phone <> '' OR contact_email <> ''
+ON DUPLICATE KEY UPDATE
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+MERGE_DETAILS_SQL = """
+INSERT INTO okky_job_details (
+    link, registered_at, view_count, start_date, work_location,
+    pay_date, skill, description, contact_id, content_hash
+)
+SELECT
+    s.link, s.registered_at, s.view_count, s.start_date, s.work_location,
+    s.pay_date, s.skill, s.description, c.id, s.content_hash
+FROM okky_job_details_staging s
+LEFT JOIN okky_job_contacts c
+    ON c.name = s.contact_name AND c.phone = s.contact_phone AND c.email = s.contact_email
+LEFT JOIN okky_job_details cur ON cur.link = s.link
+WHERE NOT (cur.content_hash <=> s.content_hash AND cur.view_count <=> s.view_count)
+ON DUPLICATE KEY UPDATE
+    updated_at = IF(okky_job_details.content_hash <=> VALUES(content_hash), okky_job_details.updated_at, CURRENT_TIMESTAMP),
+    registered_at = VALUES(registered_at),
+    view_count = VALUES(view_count),
+    start_date = VALUES(start_date),
+    work_location = VALUES(work_location),
+    pay_date = VALUES(pay_date),
+    skill = VALUES(skill),
+    description = VALUES(description),
+    contact_id = VALUES(contact_id),
+    content_hash = VALUES(content_hash)
+"""
+
+# 병합 전 링크별 신규/변경/동일 건수 집계
+COUNT_CHANGES_SQL = """
+SELECT
+    COALESCE(SUM(cur.link IS NULL), 0) AS inserted,
+    COALESCE(SUM(cur.link IS NOT NULL AND NOT (cur.content_hash <=> s.content_hash)), 0) AS changed,
+    COALESCE(SUM(cur.link IS NOT NULL AND cur.content_hash <=> s.content_hash), 0) AS unchanged
+FROM (SELECT link, MAX(content_hash) AS content_hash FROM {staging} GROUP BY link) s
+LEFT JOIN {table} cur ON cur.link = s.link
+"""
+
+# 신규 공고의 (category, location) - 통계 증분 갱신용
+NEW_MASTER_SQL = """
+SELECT s.category, s.location
+FROM okky_jobs_staging s
+LEFT JOIN okky_jobs j ON j.link = s.link
+WHERE j.link IS NULL
+"""
+
+# 내용이 같은 상세 공고의 스킬은 스테이징에서 제외 (병합 전에 실행)
+PRUNE_UNCHANGED_SKILLS_SQL = """
+DELETE ss FROM job_skills_staging ss
+JOIN okky_job_details d ON d.link = ss.link
+JOIN okky_job_details_staging s ON s.link = ss.link
+WHERE d.content_hash = s.content_hash
+"""
+
+# 스킬은 내용이 바뀐(또는 새로운) 상세 공고만 교체
+MERGE_SKILLS_SQL = [
+    """
+    DELETE js FROM job_skills js
+    JOIN (SELECT DISTINCT link FROM job_skills_staging) s ON s.link = js.link
+    """,
+    """
+    INSERT IGNORE INTO job_skills (link, skill)
+    SELECT link, skill FROM job_skills_staging
+    """,
+]
+
+
+def _insert_batches(cursor, sql: str, rows: List[tuple]):
+    # pymysql은 INSERT ... VALUES executemany를 다중 행 INSERT로 변환
+    for i in range(0, len(rows), STAGING_BATCH_SIZE):
+        cursor.executemany(sql, rows[i:i + STAGING_BATCH_SIZE])
+
+
+def bulk_ingest(master_jobs: List[MasterJob], detail_jobs: List[DetailJob]) -> dict:
+    """크롤링 결과를 스테이징 테이블에 적재한 뒤 짧은 트랜잭션 안에서 운영 테이블에 병합"""
+    started = time.monotonic()
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        # 1) 스테이징 적재 (운영 테이블 잠금 없음)
+        for sql in CREATE_STAGING_TABLES:
+            cursor.execute(sql)
+        _insert_batches(
+            cursor,
+            "INSERT INTO okky_jobs_staging (title, company, link, deadline, category, position, location, career, salary, content_hash) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            [(*j, master_content_hash(j)) for j in master_jobs]
+        )
+        _insert_batches(
+            cursor,
+            "INSERT INTO okky_job_details_staging (link, registered_at, view_count, start_date, work_location, "
+            "pay_date, skill, description, contact_name, contact_phone, contact_email, content_hash) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+            [(*d, detail_content_hash(d)) for d in detail_jobs]
+        )
+        _insert_batches(
+            cursor,
+            "INSERT IGNORE INTO job_skills_staging (link, skill) VALUES (%s, %s)",
+            [(d.link, skill) for d in detail_jobs for skill in normalize_skills(d.skill)]
+        )
+        cursor.execute(PRUNE_UNCHANGED_SKILLS_SQL)
+
+        # 신규/변경/동일 건수 집계
+        stats = {}
+        for prefix, staging, table in (("jobs", "okky_jobs_staging", "okky_jobs"),
+                                       ("details", "okky_job_details_staging", "okky_job_details")):
+            cursor.execute(COUNT_CHANGES_SQL.format(staging=staging, table=table))
+            inserted, changed, unchanged = cursor.fetchone()
+            stats.update({
+                f"{prefix}_inserted": int(inserted),
+                f"{prefix}_changed": int(changed),
+                f"{prefix}_unchanged": int(unchanged),
+            })
+
+        cursor.execute(NEW_MASTER_SQL)
+        new_masters = cursor.fetchall()
+
+        # 2) 집합 단위 병합 (운영 테이블 잠금 구간)
+        lock_started = time.monotonic()
+        conn.begin()
+        try:
+            cursor.execute(MERGE_MASTER_SQL)
+            cursor.execute(MERGE_CONTACTS_SQL)
+            cursor.execute(MERGE_DETAILS_SQL)
+            for sql in MERGE_SKILLS_SQL:
+                cursor.execute(sql)
+            bump_data_generation(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        merge_lock_ms = int((time.monotonic() - lock_started) * 1000)
+        apply_job_stats_delta(
+            conn, new_masters,
+            details_inserted=stats["details_inserted"],
+            updated=bool(stats["jobs_changed"])
+        )
+        mark_primary_write()
+
+        ingest_ms = int((time.monotonic() - started) * 1000)
+        print(f"✅ 스테이징 적재 완료: 마스터 {len(master_jobs)}건, 상세 {len(detail_jobs)}건 "
+              f"(전체 {ingest_ms}ms, 병합 {merge_lock_ms}ms)")
+        stats.update({"ingest_ms": ingest_ms, "merge_lock_ms": merge_lock_ms})
+        return stats
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,204 @@
+"""
+공고 통계 요약 테이블(job_stats) 관리
+
+적재 경로에서 신규 공고만큼 증분 갱신하고, 크롤링이 끝나면 전체 재계산하여
+마감/변경으로 생긴 오차를 바로잡는다. API는 기본키 조회 한 번으로 읽기만 하고
+행 생성(재계산)은 크롤링 파이프라인과 워커 시작 시에만 한다.
+"""
+
+import json
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+# 일자별 집계 보관 기간(일)
+JOB_STATS_DAYS = int(os.getenv("JOB_STATS_DAYS", 90))
+
+STATS_ID = 1
+_COUNT_COLUMNS = ("category_counts", "location_counts", "daily_counts")
+
+
+def _key(value) -> str:
+    return "" if value is None else str(value)
+
+
+def merge_counts(current: Optional[Dict[str, int]], delta: Dict[str, int]) -> Dict[str, int]:
+    """집계 dict에 증감분을 더하고 0 이하가 된 항목은 제거"""
+    merged = Counter(current or {})
+    for key, value in delta.items():
+        merged[_key(key)] += value
+    return {key: value for key, value in merged.items() if value > 0}
+
+
+def prune_days(daily: Dict[str, int], today: date, days: int = JOB_STATS_DAYS) -> Dict[str, int]:
+    """보관 기간이 지난 일자 집계 제거"""
+    cutoff = (today - timedelta(days=days)).isoformat()
+    return {day: count for day, count in daily.items() if day >= cutoff}
+
+
+def _load_json(value) -> dict:
+    if not value:
+        return {}
+    return json.loads(value) if isinstance(value, (str, bytes)) else dict(value)
+
+
+def read_job_stats(cursor) -> Optional[dict]:
+    """통계 행 조회 (DictCursor 필요, 행이 없으면 None)"""
+    cursor.execute("SELECT * FROM job_stats WHERE id = %s", (STATS_ID,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    for column in _COUNT_COLUMNS:
+        row[column] = _load_json(row[column])
+    return row
+
+
+def apply_job_stats_delta(
+    conn,
+    inserted: Iterable[tuple] = (),
+    details_inserted: int = 0,
+    updated: bool = False
+):
+    """신규 공고 (category, location) 목록만큼 통계를 증분 갱신 (등록일은 오늘, updated: 기존 공고 변경 여부)"""
+    from .db import bump_data_generation
+
+    inserted = list(inserted)
+    if not inserted and not details_inserted and not updated:
+        return
+    today = datetime.now().date()
+    cursor = conn.cursor()
+    try:
+        conn.begin()
+        try:
+            cursor.execute(
+                "SELECT category_counts, location_counts, daily_counts FROM job_stats WHERE id = %s FOR UPDATE",
+                (STATS_ID,)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                # 아직 재계산 전이면 증분 갱신하지 않음 (크롤링 종료 시 재계산으로 생성)
+                conn.rollback()
+                return
+            categories = merge_counts(_load_json(row[0]), Counter(_key(c) for c, _ in inserted))
+            locations = merge_counts(_load_json(row[1]), Counter(_key(l) for _, l in inserted))
+            daily = prune_days(merge_counts(_load_json(row[2]), {today.isoformat(): len(inserted)}), today)
+            cursor.execute("""
+                UPDATE job_stats
+                SET open_jobs = open_jobs + %s,
+                    master_jobs = master_jobs + %s,
+                    detail_jobs = detail_jobs + %s,
+                    category_counts = %s,
+                    location_counts = %s,
+                    daily_counts = %s,
+                    last_updated_at = IF(%s, NOW(), last_updated_at),
+                    last_created_at = IF(%s, NOW(), last_created_at)
+                WHERE id = %s
+            """, (
+                len(inserted), len(inserted), details_inserted,
+                json.dumps(categories, ensure_ascii=False),
+                json.dumps(locations, ensure_ascii=False),
+                json.dumps(daily),
+                bool(updated or inserted), bool(inserted), STATS_ID
+            ))
+            # 세대 증가 후 통계 갱신 전에 읽힌 응답이 새 세대로 캐시되지 않도록 통계와 같은 트랜잭션에서 다시 증가
+            bump_data_generation(cursor)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    except Exception as e:
+        print(f"⚠️ 공고 통계 증분 갱신 실패: {e}")
+    finally:
+        cursor.close()
+
+
+def recompute_job_stats(days: int = JOB_STATS_DAYS) -> Optional[dict]:
+    """운영 테이블에서 통계를 전체 재계산하여 저장하고 반환"""
+    from .db import get_connection, bump_data_generation
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT
+                COALESCE(SUM(closed_at IS NULL), 0),
+                COUNT(*),
+                MAX(updated_at),
+                MAX(created_at)
+            FROM okky_jobs
+        """)
+        open_jobs, master_jobs, last_updated_at, last_created_at = cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM okky_job_details")
+        detail_jobs = cursor.fetchone()[0]
+
+        counts = {}
+        for column, expression in (("category_counts", "category"), ("location_counts", "location")):
+            cursor.execute(f"""
+                SELECT {expression}, COUNT(*) FROM okky_jobs
+                WHERE closed_at IS NULL
+                GROUP BY {expression}
+            """)
+            counts[column] = merge_counts({}, dict(cursor.fetchall()))
+        # created_at 범위 조건으로 조회 (DATE(created_at) = ? 비교는 인덱스를 쓰지 못함)
+        cursor.execute("""
+            SELECT DATE(created_at), COUNT(*) FROM okky_jobs
+            WHERE closed_at IS NULL AND created_at >= CURDATE() - INTERVAL %s DAY
+            GROUP BY DATE(created_at)
+        """, (days,))
+        counts["daily_counts"] = {day.isoformat(): count for day, count in cursor.fetchall() if day}
+
+        cursor.execute("""
+            INSERT INTO job_stats (
+                id, open_jobs, master_jobs, detail_jobs, category_counts, location_counts, daily_counts,
+                last_updated_at, last_created_at, recomputed_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+            ON DUPLICATE KEY UPDATE
+                open_jobs = VALUES(open_jobs),
+                master_jobs = VALUES(master_jobs),
+                detail_jobs = VALUES(detail_jobs),
+                category_counts = VALUES(category_counts),
+                location_counts = VALUES(location_counts),
+                daily_counts = VALUES(daily_counts),
+                last_updated_at = VALUES(last_updated_at),
+                last_created_at = VALUES(last_created_at),
+                recomputed_at = VALUES(recomputed_at)
+        """, (
+            STATS_ID, int(open_jobs), master_jobs, detail_jobs,
+            json.dumps(counts["category_counts"], ensure_ascii=False),
+            json.dumps(counts["location_counts"], ensure_ascii=False),
+            json.dumps(counts["daily_counts"]),
+            last_updated_at, last_created_at
+        ))
+        # 마감 처리(세대 증가)와 재계산 사이에 읽힌 통계가 최종 세대로 캐시되지 않도록 다시 증가
+        bump_data_generation(cursor)
+        print(f"✅ 공고 통계 재계산 완료: 게시 중 {int(open_jobs)}건")
+        return {
+            "open_jobs": int(open_jobs),
+            "master_jobs": master_jobs,
+            "detail_jobs": detail_jobs,
+            "last_updated_at": last_updated_at,
+            "last_created_at": last_created_at,
+            **counts,
+        }
+    except Exception as e:
+        print(f"❌ 공고 통계 재계산 실패: {e}")
+        return None
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def ensure_job_stats() -> bool:
+    """통계 행이 없으면 재계산하여 생성 (워커 시작 시 호출, 있으면 그대로 둠)"""
+    from .db import get_connection
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1 FROM job_stats WHERE id = %s", (STATS_ID,))
+        exists = cursor.fetchone() is not None
+    finally:
+        cursor.close()
+        conn.close()
+    return exists or recompute_job_stats() is not None
@@ -1,6 +1,7 @@
 # okky_job/db/models.py
 
-from typing import NamedTuple, Optional
+import hashlib
+from typing import Iterable, NamedTuple, Optional
 from datetime import datetime
 
 class MasterJob(NamedTuple):
@@ -43,3 +44,21 @@ class CrawlingHistory(NamedTuple):
     duration: Optional[int]  # 밀리초
     processed: int
     created_at: datetime
+
+# ✅ 변경 감지용 내용 해시 (링크와 크롤링마다 바뀌는 조회수는 제외)
+MASTER_HASH_FIELDS = ("title", "company", "deadline", "category", "position", "location", "career", "salary")
+DETAIL_HASH_FIELDS = (
+    "registered_at", "start_date", "work_location", "pay_date", "skill", "description",
+    "contact_name", "contact_phone", "contact_email"
+)
+
+def content_hash(values: Iterable) -> str:
+    """필드 값들로 SHA-1 해시(40자) 계산"""
+    joined = "\x1f".join("" if v is None else str(v) for v in values)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+def master_content_hash(job) -> str:
+    return content_hash(getattr(job, f) for f in MASTER_HASH_FIELDS)
+
+def detail_content_hash(detail) -> str:
+    return content_hash(getattr(detail, f) for f in DETAIL_HASH_FIELDS)
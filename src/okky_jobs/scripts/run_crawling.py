@@ -1,28 +1,26 @@
 import sys
 import os
+import socket
 
 # ✅ 프로젝트 루트 경로 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from ..crawler.crawler_master import crawl_all_master_jobs
-from ..crawler.crawler_detail import crawl_detail_jobs
-from ..db.db import save_master_jobs, save_detail_jobs
+from ..crawler.worker import run_once
+from ..db.crawl_runs import enqueue_run
 
 
 def run():
     print("\n=== [수동 실행] OKKY 전체 크롤링 시작 ===")
     try:
-        # ✅ 1) 마스터 크롤링 및 저장
-        master_jobs = crawl_all_master_jobs()
-        if master_jobs:
-            save_master_jobs(master_jobs)
-
-        # ✅ 2) 상세 크롤링 및 저장
-        detail_jobs = crawl_detail_jobs(master_jobs)
-        if detail_jobs:
-            save_detail_jobs(detail_jobs)
-
-        print("✅ [수동 실행] 크롤링 및 DB 저장 완료")
+        # ✅ 워커와 같은 실행 등록(single-flight)을 거쳐 이 프로세스에서 바로 실행 (진행 중인 크롤링과 겹치지 않음)
+        run, created = enqueue_run("수동 실행")
+        if not created:
+            print(f"⏭️ [수동 실행] 이미 {run['status']} 상태인 실행 {run['id']}이 있어 실행하지 않음")
+            return
+
+        # ✅ 마스터 크롤링 → 상세 크롤링 → 저장 (INGEST_MODE에 따라 행 단위/스테이징 병합)
+        if run_once(f"{socket.gethostname()}:{os.getpid()}") is None:
+            print(f"⏭️ [수동 실행] 실행 {run['id']}을 크롤링 워커가 먼저 가져감")
     except Exception as e:
         print(f"❌ [수동 실행] 오류 발생: {e}")
 
@@ -4,39 +4,38 @@ import os
 # ✅ 프로젝트 루트 경로 추가
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from ..db.db import get_all_jobs, get_all_details
+from ..db.db import iter_all_jobs, iter_all_details
 from ..utils.excel_utils import save_jobs_to_excel, save_details_to_excel
 
+def preview(rows, describe, size: int = 5):
+    """스트리밍 중 앞쪽 size건만 출력하고 그대로 흘려보냄"""
+    for i, row in enumerate(rows):
+        if i == 0:
+            print(f"📋 최근 {size}건:")
+        if i < size:
+            print(f"  {i+1}. {describe(row)}")
+        yield row
+
 def main():
     print("=== OKKY JOBS 데이터 뷰어 ===")
     
     try:
-        # 마스터 공고 조회
+        # 마스터 공고 조회 (서버 사이드 커서로 읽으면서 바로 엑셀 저장)
         print("\n1. 마스터 공고 조회 중...")
-        jobs = get_all_jobs()
-        print(f"총 {len(jobs)}건의 마스터 공고 조회됨")
+        jobs = preview(iter_all_jobs(), lambda job: f"{job.title} - {job.company}")
+        job_count = save_jobs_to_excel(jobs)
+        print(f"총 {job_count}건의 마스터 공고 조회됨")
         
-        if jobs:
-            print("📋 최근 5건의 마스터 공고:")
-            for i, job in enumerate(jobs[:5]):
-                print(f"  {i+1}. {job.title} - {job.company}")
-            save_jobs_to_excel(jobs)
-            print("📁 마스터 공고 엑셀 저장 완료")
-        else:
+        if not job_count:
             print("❌ 마스터 공고 데이터가 없습니다.")
         
         # 상세 공고 조회
         print("\n2. 상세 공고 조회 중...")
-        details = get_all_details()
-        print(f"총 {len(details)}건의 상세 공고 조회됨")
+        details = preview(iter_all_details(), lambda detail: f"{detail.link} - {detail.skill}")
+        detail_count = save_details_to_excel(details)
+        print(f"총 {detail_count}건의 상세 공고 조회됨")
         
-        if details:
-            print("📋 최근 5건의 상세 공고:")
-            for i, detail in enumerate(details[:5]):
-                print(f"  {i+1}. {detail.link} - {detail.skill}")
-            save_details_to_excel(details)
-            print("📁 상세 공고 엑셀 저장 완료")
-        else:
+        if not detail_count:
             print("❌ 상세 공고 데이터가 없습니다.")
             
     except Exception as e:
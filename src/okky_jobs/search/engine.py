@@ -0,0 +1,347 @@
+"""
+인메모리 검색 엔진 (컬럼 배열 + n-gram 역색인 + 값별 비트셋)
+
+게시 중인 공고 전체를 메모리에 올려 /search의 필터/정렬/페이지네이션을 처리한다.
+행 번호는 기본 정렬(created_at DESC) 순서로 부여하므로, 비트셋의 하위 비트부터
+읽으면 곧 기본 정렬 결과가 된다.
+"""
+
+import heapq
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from .loader import GenerationLoader
+
+# 인메모리 검색 사용 여부 (0이면 항상 SQL)
+SEARCH_ENGINE_ENABLED = os.getenv("SEARCH_ENGINE_ENABLED", "1") == "1"
+# 세대가 같아도 이 시간(초)이 지나면 백그라운드에서 다시 적재 (조회수 등 세대를 바꾸지 않는 변경 반영)
+SEARCH_ENGINE_MAX_AGE = float(os.getenv("SEARCH_ENGINE_MAX_AGE", 600))
+# 상세 설명(description)까지 색인할지 여부 (메모리 사용량 대부분을 차지)
+SEARCH_ENGINE_INDEX_DESCRIPTION = os.getenv("SEARCH_ENGINE_INDEX_DESCRIPTION", "1") == "1"
+
+NGRAM = 2
+FILTER_FIELDS = ("category", "location", "experience")
+# 일치 건수가 이 값 이하이면 정렬 배열을 훑는 대신 일치 행만 정렬
+SMALL_MATCH = 2000
+_KEYWORD_CACHE_SIZE = 256
+_ONE_BIT = re.compile("1")
+
+
+def _ngrams(text: str) -> set:
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def _fold(value: Optional[str]) -> Optional[str]:
+    # MySQL utf8mb4_general_ci 비교와 비슷하게 대소문자/뒤 공백 무시
+    return value.rstrip().casefold() if value is not None else None
+
+
+def bits_from_rows(rows: Iterable[int], size: int) -> int:
+    """행 번호 목록을 비트셋(int)으로 변환"""
+    buf = bytearray((size >> 3) + 1)
+    for row in rows:
+        buf[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buf, "little")
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """비트셋의 행 번호를 작은 번호부터 순회"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def rows_from_bits(mask: int) -> List[int]:
+    """비트셋의 모든 행 번호 (이진 문자열에서 '1' 위치를 찾아 C 수준으로 처리)"""
+    return [m.start() for m in _ONE_BIT.finditer(format(mask, "b")[::-1])]
+
+
+def drop_lowest_bits(mask: int, n: int) -> int:
+    """하위 n개의 1비트를 제거 (OFFSET 건너뛰기, 이진 탐색으로 O(log N)번의 popcount)"""
+    if n <= 0:
+        return mask
+    if mask.bit_count() <= n:
+        return 0
+    lo, hi = 0, mask.bit_length()
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (mask & ((1 << mid) - 1)).bit_count() >= n:
+            hi = mid
+        else:
+            lo = mid + 1
+    return mask >> lo << lo
+
+
+class SearchEngine:
+    """게시 중 공고 스냅샷에 대한 읽기 전용 검색 엔진 (교체 방식으로 갱신)"""
+
+    def __init__(self, rows: List[dict], skills_by_link: Optional[Dict[str, List[str]]] = None,
+                 generation: Optional[int] = None, index_description: bool = SEARCH_ENGINE_INDEX_DESCRIPTION):
+        skills_by_link = skills_by_link or {}
+        self.generation = generation
+        self.index_description = index_description
+        rows = sorted(rows, key=lambda r: (r["created_at"] is not None, r["created_at"], r["id"]), reverse=True)
+        self.size = n = len(rows)
+
+        # 컬럼 배열
+        self.ids = array("q", (r["id"] for r in rows))
+        self.views = array("q", (r.get("views") or 0 for r in rows))
+        self.titles = [r["title"] for r in rows]
+        self.companies = [r["company"] for r in rows]
+        self.deadlines = [r["deadline"] for r in rows]
+        self.created = [r["created_at"] for r in rows]
+        self.updated = [r["updated_at"] for r in rows]
+        self.urls = [r["original_url"] for r in rows]
+        # 범주형 컬럼은 사전 인코딩 (코드 배열 + 값 목록)
+        self.values: Dict[str, List[Optional[str]]] = {}
+        self.codes: Dict[str, array] = {}
+        self.bitsets: Dict[str, Dict[Optional[str], int]] = {}
+        self.labels: Dict[str, Dict[Optional[str], Optional[str]]] = {}
+        for field in FILTER_FIELDS:
+            dictionary: Dict[Optional[str], int] = {}
+            codes = array("I", (dictionary.setdefault(r[field], len(dictionary)) for r in rows))
+            self.values[field] = list(dictionary)
+            self.codes[field] = codes
+            members: Dict[Optional[str], List[int]] = {}
+            for row, code in enumerate(codes):
+                members.setdefault(_fold(self.values[field][code]), []).append(row)
+            self.bitsets[field] = {value: bits_from_rows(m, n) for value, m in members.items()}
+            # facet 응답에 쓸 표시 값 (대소문자만 다른 값은 처음 나온 값으로)
+            labels: Dict[Optional[str], Optional[str]] = {}
+            for value in self.values[field]:
+                labels.setdefault(_fold(value), value)
+            self.labels[field] = labels
+
+        # 기술스택 비트셋 (job_skills.skill 비교와 같게 대소문자 무시 키, 표시 값은 처음 나온 표기)
+        skill_members: Dict[str, List[int]] = {}
+        self.skill_labels: Dict[str, str] = {}
+        for row, r in enumerate(rows):
+            for skill in skills_by_link.get(r["original_url"], ()):
+                key = _fold(skill)
+                self.skill_labels.setdefault(key, skill)
+                skill_members.setdefault(key, []).append(row)
+        self.skill_bitsets = {key: bits_from_rows(m, n) for key, m in skill_members.items()}
+
+        # n-gram 역색인 (필드 사이에 구분 문자를 넣어 필드 경계를 넘는 일치 방지)
+        self.texts: List[str] = []
+        postings: Dict[str, List[int]] = {}
+        for row, r in enumerate(rows):
+            parts = [r["title"] or "", r["company"] or ""]
+            if index_description:
+                parts.append(r.get("description") or "")
+            text = "\x00".join(parts).casefold()
+            self.texts.append(text)
+            for gram in _ngrams(text):
+                postings.setdefault(gram, []).append(row)
+        self.postings = {gram: array("I", rows_) for gram, rows_ in postings.items()}
+
+        # 정렬 순서 (createdAt은 행 번호 순서 그대로)
+        deadline_rows = sorted(range(n), key=lambda i: (self.deadlines[i] is not None, self.deadlines[i] or ""))
+        self.orders = {
+            "company": array("I", sorted(range(n), key=lambda i: (_fold(self.companies[i]) or ""))),
+            "deadline": array("I", deadline_rows),
+            "views": array("I", sorted(range(n), key=lambda i: -self.views[i])),
+        }
+        self.ranks: Dict[str, array] = {}
+        for sort, order in self.orders.items():
+            rank = array("I", bytes(4 * n))
+            for position, row in enumerate(order):
+                rank[row] = position
+            self.ranks[sort] = rank
+        # 마감일 문자열 비교(deadline <= 기준일)용 정렬 배열 (NULL 제외)
+        self._deadline_rows = array("I", (i for i in deadline_rows if self.deadlines[i] is not None))
+        self._deadline_keys = [self.deadlines[i] for i in self._deadline_rows]
+
+        self.all_mask = (1 << n) - 1
+        self._keyword_cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def supports(self, keyword: Optional[str]) -> bool:
+        """LIKE 와일드카드가 들어간 키워드, 설명 미색인 시의 키워드 검색은 SQL로 처리"""
+        if not keyword:
+            return True
+        return self.index_description and not any(c in keyword for c in "%_\\")
+
+    def _keyword_mask(self, keyword: str) -> int:
+        needle = keyword.casefold()
+        with self._lock:
+            mask = self._keyword_cache.get(needle)
+            if mask is not None:
+                self._keyword_cache.move_to_end(needle)
+                return mask
+
+        grams = _ngrams(needle)
+        if grams:
+            lists = sorted((self.postings.get(g, ()) for g in grams), key=len)
+            candidates = set(lists[0])
+            for rows in lists[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(rows)
+        else:
+            # 한 글자 검색은 색인 없이 전체 확인
+            candidates = range(self.size)
+        # n-gram 후보를 실제 부분 문자열 일치로 확인 (LIKE '%keyword%'와 동일한 결과)
+        mask = bits_from_rows((row for row in candidates if needle in self.texts[row]), self.size)
+
+        with self._lock:
+            self._keyword_cache[needle] = mask
+            if len(self._keyword_cache) > _KEYWORD_CACHE_SIZE:
+                self._keyword_cache.popitem(last=False)
+        return mask
+
+    def _deadline_mask(self, cutoff: str) -> int:
+        end = bisect_right(self._deadline_keys, cutoff)
+        return bits_from_rows(self._deadline_rows[:end], self.size)
+
+    def match(
+        self,
+        keyword: Optional[str] = None,
+        category: Optional[str] = None,
+        location: Optional[str] = None,
+        experience: Optional[str] = None,
+        deadline_cutoff: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        skills_mode: str = "or"
+    ) -> int:
+        """검색 조건에 일치하는 행의 비트셋"""
+        mask = self.all_mask
+        for field, value in (("category", category), ("location", location), ("experience", experience)):
+            if value:
+                mask &= self.bitsets[field].get(_fold(value), 0)
+        if skills:
+            skill_masks = [self.skill_bitsets.get(_fold(s), 0) for s in skills]
+            if skills_mode == "and":
+                for m in skill_masks:
+                    mask &= m
+            else:
+                any_mask = 0
+                for m in skill_masks:
+                    any_mask |= m
+                mask &= any_mask
+        if deadline_cutoff and mask:
+            mask &= self._deadline_mask(deadline_cutoff)
+        if keyword and mask:
+            mask &= self._keyword_mask(keyword)
+        return mask
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    def page_rows(self, mask: int, sort: str = "createdAt", offset: int = 0, limit: int = 20) -> List[int]:
+        """정렬/페이지네이션된 행 번호 목록"""
+        if sort not in self.orders:
+            mask = drop_lowest_bits(mask, offset)
+            rows = []
+            for row in iter_bits(mask):
+                if len(rows) >= limit:
+                    break
+                rows.append(row)
+            return rows
+
+        if mask.bit_count() <= SMALL_MATCH:
+            rank = self.ranks[sort].__getitem__
+            return heapq.nsmallest(offset + limit, rows_from_bits(mask), key=rank)[offset:]
+        bits = mask.to_bytes((self.size >> 3) + 1, "little")
+        rows = []
+        skipped = 0
+        for row in self.orders[sort]:
+            if bits[row >> 3] >> (row & 7) & 1:
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+        return rows
+
+    def row(self, i: int) -> dict:
+        """SQL 검색 결과와 같은 키의 행"""
+        return {
+            "id": self.ids[i],
+            "company": self.companies[i],
+            "title": self.titles[i],
+            "category": self.values["category"][self.codes["category"][i]],
+            "location": self.values["location"][self.codes["location"][i]],
+            "experience": self.values["experience"][self.codes["experience"][i]],
+            "deadline": self.deadlines[i],
+            "views": self.views[i],
+            "created_at": self.created[i],
+            "updated_at": self.updated[i],
+            "original_url": self.urls[i],
+        }
+
+    def facet_counts(self, mask: int, field: str) -> Dict[str, int]:
+        """일치 행의 category/location/experience 값별 공고 수 (값이 없는 행 제외)"""
+        counts = [
+            (self.labels[field][value], (mask & bits).bit_count())
+            for value, bits in self.bitsets[field].items() if value
+        ]
+        counts = [c for c in counts if c[1]]
+        counts.sort(key=lambda c: -c[1])
+        return dict(counts)
+
+    def skill_counts(self, mask: int, limit: int = 30) -> Dict[str, int]:
+        """일치 행의 스킬별 공고 수 (상위 limit개)"""
+        counts = [(self.skill_labels[key], (mask & bits).bit_count()) for key, bits in self.skill_bitsets.items()]
+        counts = [c for c in counts if c[1]]
+        counts.sort(key=lambda c: -c[1])
+        return dict(counts[:limit])
+
+
+def load_search_engine(generation: Optional[int] = None) -> SearchEngine:
+    """게시 중인 공고(마감 제외)를 읽어 검색 엔진 생성"""
+    from ..db.db import iter_query
+
+    rows = list(iter_query("""
+        SELECT
+            j.id, j.company, j.title, j.category, j.location, j.career AS experience, j.deadline,
+            (COALESCE(d.view_count, 0) + COALESCE(d.local_view_count, 0)) AS views, j.created_at, j.updated_at, j.link AS original_url,
+            d.description
+        FROM okky_jobs j
+        LEFT JOIN okky_job_details d ON j.link = d.link
+        WHERE j.closed_at IS NULL
+    """, dict_rows=True))
+    skills_by_link: Dict[str, List[str]] = {}
+    for link, skill in iter_query("""
+        SELECT s.link, s.skill
+        FROM job_skills s
+        JOIN okky_jobs j ON j.link = s.link
+        WHERE j.closed_at IS NULL
+    """):
+        skills_by_link.setdefault(link, []).append(skill)
+    return SearchEngine(rows, skills_by_link, generation=generation)
+
+
+class SearchEngineHolder(GenerationLoader):
+    """현재 엔진 보관 및 데이터 세대가 바뀌면 백그라운드에서 새 엔진으로 교체 (적재 실패 시 백오프 후 재시도)"""
+
+    def __init__(self, enabled: bool = SEARCH_ENGINE_ENABLED, **kwargs):
+        super().__init__("검색 엔진", load_search_engine, enabled=enabled, max_age=SEARCH_ENGINE_MAX_AGE, **kwargs)
+
+    @property
+    def engine(self) -> Optional[SearchEngine]:
+        return self.value
+
+    @engine.setter
+    def engine(self, engine: Optional[SearchEngine]):
+        self.value = engine
+        self.generation = engine.generation if engine is not None else None
+
+    def describe(self, engine: SearchEngine) -> str:
+        return f"{engine.size}건"
+
+    def stats(self) -> dict:
+        engine = self.engine
+        return {
+            **super().stats(),
+            "size": engine.size if engine else 0,
+            "ngrams": len(engine.postings) if engine else 0,
+        }
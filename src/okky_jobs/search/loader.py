@@ -0,0 +1,101 @@
+"""
+데이터 세대별 인메모리 색인 백그라운드 적재
+
+요청 경로에서는 적재를 기다리지 않고 현재 보관 중인 색인을 쓰거나 None(SQL 처리)을 돌려준다.
+적재에 실패하면 재시도 간격을 지수적으로 늘려 DB(특히 장애 중인 replica)를 요청마다 두드리지 않는다.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# 적재 실패 후 첫 재시도 대기(초) / 최대 대기(초) - 실패할 때마다 두 배
+SEARCH_LOAD_RETRY_BASE = float(os.getenv("SEARCH_LOAD_RETRY_BASE", 5))
+SEARCH_LOAD_RETRY_MAX = float(os.getenv("SEARCH_LOAD_RETRY_MAX", 300))
+
+
+class GenerationLoader:
+    """데이터 세대가 바뀌거나 max_age가 지나면 백그라운드에서 다시 적재해 교체"""
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[Optional[int]], Any],
+        enabled: bool = True,
+        max_age: Optional[float] = None,
+        retry_base: float = SEARCH_LOAD_RETRY_BASE,
+        retry_max: float = SEARCH_LOAD_RETRY_MAX
+    ):
+        self.name = name
+        self._load = load
+        self.enabled = enabled
+        self.max_age = max_age
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.value: Any = None
+        self.generation: Optional[int] = None
+        self.loaded_at: Optional[float] = None
+        self.failures = 0
+        self.failed_at: Optional[float] = None
+        self._loading = False
+        self._lock = threading.Lock()
+
+    def get(self, generation: Optional[int]):
+        """현재 세대의 값 (없거나 갱신 중이면 None)"""
+        if not self.enabled:
+            return None
+        value = self.value
+        if value is not None and self.generation == generation:
+            if self.max_age is not None and self.loaded_at is not None and time.time() - self.loaded_at > self.max_age:
+                # 다시 적재하는 동안에는 기존 값으로 응답
+                self.refresh_async(generation)
+            return value
+        self.refresh_async(generation)
+        return None
+
+    def retry_in(self) -> float:
+        """다음 적재 시도까지 남은 시간(초), 0이면 바로 시도 가능"""
+        if not self.failures or self.failed_at is None:
+            return 0.0
+        delay = min(self.retry_base * 2 ** (self.failures - 1), self.retry_max)
+        return max(0.0, self.failed_at + delay - time.monotonic())
+
+    def refresh_async(self, generation: Optional[int]):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._loading or self.retry_in() > 0:
+                return
+            self._loading = True
+        threading.Thread(target=self._refresh, args=(generation,), name=f"{self.name}-loader", daemon=True).start()
+
+    def _refresh(self, generation: Optional[int]):
+        started = time.monotonic()
+        try:
+            value = self._load(generation)
+            self.value, self.generation = value, generation
+            self.loaded_at = time.time()
+            self.failures = 0
+            print(f"✅ {self.name} 적재 완료: {self.describe(value)}, 세대 {generation} "
+                  f"({int((time.monotonic() - started) * 1000)}ms)")
+        except Exception as e:
+            self.failures += 1
+            self.failed_at = time.monotonic()
+            print(f"❌ {self.name} 적재 실패 ({self.failures}회, {self.retry_in():.0f}초 후 재시도): {e}")
+        finally:
+            with self._lock:
+                self._loading = False
+
+    def describe(self, value) -> str:
+        return f"{len(value)}건"
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "loading": self._loading,
+            "generation": self.generation if self.value is not None else None,
+            "loadedAt": self.loaded_at,
+            "failures": self.failures,
+            "retryIn": round(self.retry_in(), 1),
+        }
@@ -0,0 +1,212 @@
+"""
+검색어 자동완성 (접두어 정렬 배열 + 자모/초성 색인)
+
+한글은 자모 단위로 풀어서 비교하므로 입력 중인 글자("삼ㅅ", "사")도 접두어로 일치하고,
+초성만 입력한 경우("ㅅㅅ")는 초성 키로 비교한다. 짧은 접두어는 상위 결과를 미리 계산해 둔다.
+색인은 검색 엔진과 별도로 데이터 세대별로 적재하므로 SEARCH_ENGINE_ENABLED와 무관하게 동작한다.
+"""
+
+import heapq
+import os
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .loader import GenerationLoader
+
+# 자동완성 사용 여부 / 세대가 같아도 다시 적재할 주기(초, 제목 점수인 조회수 반영)
+SUGGEST_ENABLED = os.getenv("SUGGEST_ENABLED", "1") == "1"
+SUGGEST_MAX_AGE = float(os.getenv("SUGGEST_MAX_AGE", 600))
+
+# 미리 상위 결과를 계산해 둘 접두어 최대 길이 (자모 기준) / 접두어별 보관 건수
+PRECOMPUTE_PREFIX = 6
+MAX_SUGGESTIONS = 20
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 겹모음/겹받침은 입력 순서대로 나눔 (예: "고" 입력 중에도 "과"와 일치)
+_COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+_CONSONANTS = set("ㄱㄲㄳㄴㄵㄶㄷㄸㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅃㅄㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+
+
+def _normalize(text: str) -> str:
+    # 공백 제거 + 대소문자 무시
+    return "".join(text.split()).casefold()
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 (겹모음/겹받침도 분해)"""
+    out = []
+    for ch in _normalize(text):
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            code -= _HANGUL_BASE
+            out.append(CHOSEONG[code // 588])
+            out.append(_COMPOUND.get(JUNGSEONG[code % 588 // 28], JUNGSEONG[code % 588 // 28]))
+            final = JONGSEONG[code % 28]
+            out.append(_COMPOUND.get(final, final))
+        else:
+            out.append(_COMPOUND.get(ch, ch))
+    return "".join(out)
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 변환 (한글 외 문자는 그대로)"""
+    out = []
+    for ch in _normalize(text):
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(CHOSEONG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(query: str) -> bool:
+    """한글이 자음으로만 입력된 검색어인지 (예: "ㅅㅅ", "ㄴㅇㅂ")"""
+    hangul = [ch for ch in _normalize(query) if ch in _CONSONANTS or _HANGUL_BASE <= ord(ch) <= _HANGUL_LAST]
+    return bool(hangul) and all(ch in _CONSONANTS for ch in hangul)
+
+
+def _word_starts(text: str) -> Iterable[str]:
+    # 제목은 단어 시작 위치마다 접두어 검색이 되도록 접미 문자열을 색인
+    words = text.split()
+    for i in range(len(words)):
+        yield " ".join(words[i:])
+
+
+class _PrefixKeys:
+    """정렬된 키 배열 + 짧은 접두어별 상위 항목"""
+
+    def __init__(self, keyed: List[Tuple[str, int]], order: Dict[int, int]):
+        keyed.sort()
+        self.keys = [k for k, _ in keyed]
+        self.items = [i for _, i in keyed]
+        # 점수 순으로 훑으면서 접두어별로 앞의 MAX_SUGGESTIONS개만 보관
+        self.top: Dict[str, List[int]] = {}
+        for key, item in sorted(keyed, key=lambda ki: order[ki[1]]):
+            for length in range(1, min(len(key), PRECOMPUTE_PREFIX) + 1):
+                bucket = self.top.setdefault(key[:length], [])
+                if len(bucket) < MAX_SUGGESTIONS and item not in bucket:
+                    bucket.append(item)
+
+    def lookup(self, prefix: str, limit: int, score) -> List[int]:
+        if len(prefix) <= PRECOMPUTE_PREFIX:
+            return self.top.get(prefix, [])[:limit]
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return heapq.nsmallest(limit, set(self.items[lo:hi]), key=score)
+
+
+class SuggestIndex:
+    """(문자열, 점수, 참조) 목록에 대한 접두어 자동완성"""
+
+    def __init__(self, entries: Iterable[Tuple[str, int, Optional[int]]], words: bool = False):
+        self.texts: List[str] = []
+        self.scores: List[int] = []
+        self.refs: List[Optional[int]] = []
+        for text, score, ref in entries:
+            if text and text.strip():
+                self.texts.append(text.strip())
+                self.scores.append(score)
+                self.refs.append(ref)
+        # 점수 내림차순, 같으면 짧은 문자열 우선
+        ranked = sorted(range(len(self.texts)), key=lambda i: (-self.scores[i], len(self.texts[i]), self.texts[i]))
+        self._order = {item: position for position, item in enumerate(ranked)}
+
+        jamo_keys, cho_keys = [], []
+        for item, text in enumerate(self.texts):
+            for part in (_word_starts(text) if words else (text,)):
+                jamo_keys.append((to_jamo(part), item))
+                cho_keys.append((to_choseong(part), item))
+        self._jamo = _PrefixKeys(jamo_keys, self._order)
+        self._choseong = _PrefixKeys(cho_keys, self._order)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """접두어가 일치하는 항목을 점수 순으로 최대 limit개"""
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        if is_choseong_query(query):
+            keys, prefix = self._choseong, to_choseong(query)
+        else:
+            keys, prefix = self._jamo, to_jamo(query)
+        if not prefix:
+            return []
+        items = keys.lookup(prefix, limit, self._order.__getitem__)
+        results = []
+        for item in items:
+            result = {"text": self.texts[item], "score": self.scores[item]}
+            if self.refs[item] is not None:
+                result["id"] = self.refs[item]
+            results.append(result)
+        return results
+
+
+def build_suggestions(
+    companies: Iterable[Tuple[str, int]],
+    titles: Iterable[Tuple[int, str, int]],
+    skills: Iterable[Tuple[str, int]]
+) -> Dict[str, SuggestIndex]:
+    """종류별 자동완성 색인 (회사명: 공고 수, 제목: 조회수, 기술스택: 공고 수)"""
+    company_counts = Counter()
+    for company, count in companies:
+        if company and company.strip():
+            company_counts[company.strip()] += count
+    return {
+        "companies": SuggestIndex((c, count, None) for c, count in company_counts.items()),
+        "titles": SuggestIndex(((title, views or 0, job_id) for job_id, title, views in titles), words=True),
+        "skills": SuggestIndex((skill, count, None) for skill, count in skills),
+    }
+
+
+def load_suggestions(generation: Optional[int] = None) -> Dict[str, SuggestIndex]:
+    """게시 중인 공고(마감 제외)의 회사명/제목/기술스택으로 자동완성 색인 생성"""
+    from ..db.db import iter_query
+
+    companies = iter_query("""
+        SELECT company, COUNT(*) FROM okky_jobs
+        WHERE closed_at IS NULL
+        GROUP BY company
+    """)
+    titles = iter_query("""
+        SELECT j.id, j.title, (COALESCE(d.view_count, 0) + COALESCE(d.local_view_count, 0))
+        FROM okky_jobs j
+        LEFT JOIN okky_job_details d ON j.link = d.link
+        WHERE j.closed_at IS NULL
+    """)
+    skills = iter_query("""
+        SELECT s.skill, COUNT(*)
+        FROM job_skills s
+        JOIN okky_jobs j ON j.link = s.link
+        WHERE j.closed_at IS NULL
+        GROUP BY s.skill
+    """)
+    return build_suggestions(list(companies), list(titles), list(skills))
+
+
+class SuggestIndexHolder(GenerationLoader):
+    """데이터 세대별 자동완성 색인 (적재 중에는 이전 세대 색인으로 응답)"""
+
+    def __init__(self, enabled: bool = SUGGEST_ENABLED, **kwargs):
+        super().__init__("자동완성 색인", load_suggestions, enabled=enabled, max_age=SUGGEST_MAX_AGE, **kwargs)
+
+    def current(self, generation: Optional[int]) -> Optional[Dict[str, SuggestIndex]]:
+        """현재 세대 색인, 새 세대 적재 중이면 이전 색인 (자동완성은 약간 오래된 데이터도 무방)"""
+        return self.get(generation) or self.value
+
+    def describe(self, indexes: Dict[str, SuggestIndex]) -> str:
+        return ", ".join(f"{kind} {len(index)}건" for kind, index in indexes.items())
+
+    def stats(self) -> dict:
+        indexes = self.value or {}
+        return {**super().stats(), "sizes": {kind: len(index) for kind, index in indexes.items()}}
@@ -4,9 +4,26 @@
 
 import pymysql
 import os
+import atexit
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+# 로그 일괄 저장 설정: 건수(LOG_BATCH_SIZE) 또는 시간(LOG_FLUSH_INTERVAL초) 중 먼저 도달 시 저장
+LOG_BATCH_SIZE = int(os.getenv("CRAWLING_LOG_BATCH_SIZE", 50))
+LOG_FLUSH_INTERVAL = float(os.getenv("CRAWLING_LOG_FLUSH_INTERVAL", 2))
+# 저장 실패 시 다시 보관할 최대 로그 건수 (DB 장애가 길어지면 가장 오래된 로그부터 버림)
+LOG_MAX_PENDING = int(os.getenv("CRAWLING_LOG_MAX_PENDING", 10000))
+# 실시간 조회용 메모리 보관 건수
+RECENT_LOG_LIMIT = 100
+# crawling_history에 기록 가능한 적재 통계 컬럼
+INGEST_STAT_COLUMNS = (
+    "ingest_ms", "merge_lock_ms",
+    "jobs_inserted", "jobs_changed", "jobs_unchanged",
+    "details_inserted", "details_changed", "details_unchanged",
+)
+
 
 def get_connection():
     """데이터베이스 연결 생성"""
@@ -21,11 +38,139 @@ def get_connection():
     )
 
 
+class _LogWriter:
+    """crawling_logs INSERT와 진행중 히스토리 UPDATE를 모아 백그라운드 스레드에서 일괄 저장"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending_logs = []
+        self._pending_history = {}  # history_id -> (status, processed), 마지막 값만 유지
+        self._thread = None
+        self._stopped = False
+        self.failures = 0
+        self.dropped = 0
+        # 프로세스 전체의 최근 로그 (DB 조회 없이 실시간 조회용)
+        self.recent = deque(maxlen=RECENT_LOG_LIMIT)
+    
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="crawling-log-writer", daemon=True)
+            self._thread.start()
+    
+    def add_log(self, row: tuple, entry: Dict[str, Any]):
+        self.recent.append(entry)
+        with self._lock:
+            self._pending_logs.append(row)
+            should_flush = len(self._pending_logs) >= LOG_BATCH_SIZE
+        self._ensure_started()
+        if should_flush:
+            self._wakeup.set()
+    
+    def set_history_progress(self, history_id: int, status: str, processed: int):
+        with self._lock:
+            self._pending_history[history_id] = (status, processed)
+        self._ensure_started()
+    
+    def discard_history_progress(self, history_id: int):
+        with self._lock:
+            self._pending_history.pop(history_id, None)
+    
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait(LOG_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+    
+    def flush(self):
+        """대기 중인 로그/히스토리를 한 트랜잭션으로 저장 (실패 시 대기열 앞에 되돌려 다음 주기에 재시도)"""
+        with self._flush_lock:
+            with self._lock:
+                logs, self._pending_logs = self._pending_logs, []
+                history, self._pending_history = self._pending_history, {}
+            if not logs and not history:
+                return
+            
+            conn = None
+            cursor = None
+            try:
+                conn = get_connection()
+                cursor = conn.cursor()
+                # 로그와 히스토리를 함께 커밋해야 재시도 시 로그가 중복 저장되지 않음
+                conn.begin()
+                if logs:
+                    # pymysql은 INSERT ... VALUES executemany를 다중 행 INSERT로 변환
+                    cursor.executemany(
+                        "INSERT INTO crawling_logs (history_id, type, message, timestamp, progress) VALUES (%s, %s, %s, %s, %s)",
+                        logs
+                    )
+                for history_id, (status, processed) in history.items():
+                    cursor.execute(
+                        "UPDATE crawling_history SET status = %s, processed = %s WHERE id = %s AND status = '진행중'",
+                        (status, processed, history_id)
+                    )
+                conn.commit()
+            except Exception as e:
+                self.failures += 1
+                print(f"❌ 로그 일괄 저장 실패 ({len(logs)}건, 다음 주기에 재시도): {e}")
+                if conn:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                self._requeue(logs, history)
+            finally:
+                if cursor:
+                    cursor.close()
+                if conn:
+                    conn.close()
+    
+    def _requeue(self, logs: list, history: dict):
+        with self._lock:
+            # 저장 순서 유지를 위해 실패한 로그를 앞에 두고, 그 사이 들어온 진행 상태는 최신 값을 유지
+            self._pending_logs = logs + self._pending_logs
+            overflow = len(self._pending_logs) - LOG_MAX_PENDING
+            if overflow > 0:
+                del self._pending_logs[:overflow]
+                self.dropped += overflow
+                print(f"⚠️ 로그 대기열 상한 초과로 오래된 로그 {overflow}건 버림")
+            for history_id, progress in history.items():
+                self._pending_history.setdefault(history_id, progress)
+    
+    def close(self):
+        """백그라운드 스레드를 멈추고 남은 항목을 모두 저장"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=LOG_FLUSH_INTERVAL + 5)
+        self.flush()
+
+
+_writer = _LogWriter()
+atexit.register(_writer.close)
+
+
+def flush_logs():
+    """버퍼에 남은 크롤링 로그를 즉시 저장"""
+    _writer.flush()
+
+
+def get_buffered_logs(limit: int = 50) -> List[Dict[str, Any]]:
+    """현재 프로세스에서 기록된 최근 로그 (최신순, DB 조회 없음)"""
+    return list(_writer.recent)[-limit:][::-1]
+
+
 class CrawlingLogger:
     """크롤링 로그 관리 클래스"""
     
     def __init__(self):
-        self.logs = []
+        self.logs = deque(maxlen=RECENT_LOG_LIMIT)
         self.current_history_id = None
     
     def log_info(self, message: str):
@@ -49,37 +194,17 @@ class CrawlingLogger:
         self.add_log("warning", message)
     
     def add_log(self, log_type: str, message: str, progress: Optional[int] = None):
-        """로그 추가"""
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # 데이터베이스에 로그 저장
-            sql = """
-            INSERT INTO crawling_logs (type, message, timestamp, progress)
-            VALUES (%s, %s, %s, %s)
-            """
-            now = datetime.now()
-            cursor.execute(sql, (log_type, message, now, progress))
-            conn.commit()
-            
-            # 메모리에도 저장 (실시간 조회용)
-            self.logs.append({
-                "type": log_type,
-                "message": message,
-                "timestamp": now.isoformat(),
-                "progress": progress
-            })
-            
-            # 최근 100개만 유지
-            if len(self.logs) > 100:
-                self.logs = self.logs[-100:]
-                
-        except Exception as e:
-            print(f"❌ 로그 저장 실패: {e}")
-        finally:
-            cursor.close()
-            conn.close()
+        """로그 추가 (DB 저장은 백그라운드에서 일괄 처리)"""
+        now = datetime.now()
+        entry = {
+            "type": log_type,
+            "message": message,
+            "timestamp": now.isoformat(),
+            "progress": progress
+        }
+        # 메모리에도 저장 (실시간 조회용, 최근 100개만 유지)
+        self.logs.append(entry)
+        _writer.add_log((self.current_history_id, log_type, message, now, progress), entry)
     
     def start_crawling_history(self) -> int:
         """크롤링 히스토리 시작"""
@@ -110,9 +235,17 @@ class CrawlingLogger:
             conn.close()
     
     def update_crawling_history(self, status: str, processed: int = 0):
-        """크롤링 히스토리 업데이트"""
+        """크롤링 히스토리 업데이트 (진행중 갱신은 일괄 저장, 종료 상태는 즉시 저장)"""
         if not self.current_history_id:
             return
+        
+        if status not in ["완료", "실패"]:
+            _writer.set_history_progress(self.current_history_id, status, processed)
+            return
+        
+        # 종료 기록 전에 대기 중인 로그를 먼저 저장해 순서를 보장
+        _writer.discard_history_progress(self.current_history_id)
+        _writer.flush()
             
         conn = get_connection()
         cursor = conn.cursor()
@@ -120,37 +253,29 @@ class CrawlingLogger:
         try:
             now = datetime.now()
             
-            if status in ["완료", "실패"]:
-                # 시작 시간 가져오기
-                cursor.execute(
-                    "SELECT started_at FROM crawling_history WHERE id = %s",
-                    (self.current_history_id,)
-                )
-                result = cursor.fetchone()
-                if result:
-                    started_at = result[0]
-                    duration = int((now - started_at).total_seconds() * 1000)
-                    
-                    sql = """
-                    UPDATE crawling_history 
-                    SET status = %s, ended_at = %s, duration = %s, processed = %s
-                    WHERE id = %s
-                    """
-                    cursor.execute(sql, (status, now, duration, processed, self.current_history_id))
-                else:
-                    sql = """
-                    UPDATE crawling_history 
-                    SET status = %s, ended_at = %s, processed = %s
-                    WHERE id = %s
-                    """
-                    cursor.execute(sql, (status, now, processed, self.current_history_id))
+            # 시작 시간 가져오기
+            cursor.execute(
+                "SELECT started_at FROM crawling_history WHERE id = %s",
+                (self.current_history_id,)
+            )
+            result = cursor.fetchone()
+            if result:
+                started_at = result[0]
+                duration = int((now - started_at).total_seconds() * 1000)
+                
+                sql = """
+                UPDATE crawling_history 
+                SET status = %s, ended_at = %s, duration = %s, processed = %s
+                WHERE id = %s
+                """
+                cursor.execute(sql, (status, now, duration, processed, self.current_history_id))
             else:
                 sql = """
                 UPDATE crawling_history 
-                SET status = %s, processed = %s
+                SET status = %s, ended_at = %s, processed = %s
                 WHERE id = %s
                 """
-                cursor.execute(sql, (status, processed, self.current_history_id))
+                cursor.execute(sql, (status, now, processed, self.current_history_id))
             
             conn.commit()
             
@@ -160,19 +285,52 @@ class CrawlingLogger:
             cursor.close()
             conn.close()
     
-    def get_recent_logs(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """최근 로그 조회"""
+    def record_ingest_stats(self, **stats):
+        """적재 통계(전체 적재 시간, 운영 테이블 잠금 시간 등)를 현재 크롤링 히스토리에 기록"""
+        columns = {k: v for k, v in stats.items() if k in INGEST_STAT_COLUMNS}
+        if not self.current_history_id or not columns:
+            return
+        
         conn = get_connection()
         cursor = conn.cursor()
         
         try:
-            sql = """
-            SELECT type, message, timestamp, progress
-            FROM crawling_logs
-            ORDER BY timestamp DESC
-            LIMIT %s
-            """
-            cursor.execute(sql, (limit,))
+            assignments = ", ".join(f"{column} = %s" for column in columns)
+            sql = f"UPDATE crawling_history SET {assignments} WHERE id = %s"
+            cursor.execute(sql, (*columns.values(), self.current_history_id))
+            conn.commit()
+            
+        except Exception as e:
+            print(f"❌ 적재 통계 기록 실패: {e}")
+        finally:
+            cursor.close()
+            conn.close()
+    
+    def get_recent_logs(self, limit: int = 50, history_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 로그 조회 (기본: 가장 최근 크롤링 히스토리의 로그)"""
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            # idx_crawling_logs_history(history_id, id) 역순 스캔으로 LIMIT 건만 읽음
+            if history_id is None:
+                sql = """
+                SELECT type, message, timestamp, progress
+                FROM crawling_logs
+                WHERE history_id = (SELECT MAX(id) FROM crawling_history)
+                ORDER BY id DESC
+                LIMIT %s
+                """
+                cursor.execute(sql, (limit,))
+            else:
+                sql = """
+                SELECT type, message, timestamp, progress
+                FROM crawling_logs
+                WHERE history_id = %s
+                ORDER BY id DESC
+                LIMIT %s
+                """
+                cursor.execute(sql, (history_id, limit))
             rows = cursor.fetchall()
             
             return [
@@ -199,7 +357,9 @@ class CrawlingLogger:
         
         try:
             sql = """
-            SELECT id, status, started_at, ended_at, duration, processed
+            SELECT id, status, started_at, ended_at, duration, processed, ingest_ms, merge_lock_ms,
+                   jobs_inserted, jobs_changed, jobs_unchanged,
+                   details_inserted, details_changed, details_unchanged
             FROM crawling_history
             ORDER BY started_at DESC
             LIMIT %s
@@ -214,7 +374,11 @@ class CrawlingLogger:
                     "startedAt": row[2].isoformat(),
                     "endedAt": row[3].isoformat() if row[3] else None,
                     "duration": row[4],
-                    "processed": row[5]
+                    "processed": row[5],
+                    "ingestMs": row[6],
+                    "mergeLockMs": row[7],
+                    "jobs": {"inserted": row[8], "changed": row[9], "unchanged": row[10]},
+                    "details": {"inserted": row[11], "changed": row[12], "unchanged": row[13]}
                 }
                 for row in rows
             ]
@@ -226,40 +390,56 @@ class CrawlingLogger:
             cursor.close()
             conn.close()
     
-    def is_crawling_running(self) -> bool:
-        """크롤링 실행 중인지 확인"""
+    def get_running_history_id(self) -> Optional[int]:
+        """진행 중인 크롤링 히스토리 ID 조회"""
         conn = get_connection()
         cursor = conn.cursor()
         
         try:
             sql = """
-            SELECT COUNT(*) FROM crawling_history 
+            SELECT id FROM crawling_history 
             WHERE status = '진행중'
+            ORDER BY id DESC
+            LIMIT 1
             """
             cursor.execute(sql)
-            count = cursor.fetchone()[0]
-            return count > 0
+            result = cursor.fetchone()
+            return result[0] if result else None
             
         except Exception as e:
             print(f"❌ 크롤링 상태 확인 실패: {e}")
-            return False
+            return None
         finally:
             cursor.close()
             conn.close()
     
-    def get_current_progress(self) -> int:
-        """현재 진행률 조회"""
+    def is_crawling_running(self) -> bool:
+        """크롤링 실행 중인지 확인"""
+        return self.get_running_history_id() is not None
+    
+    def get_current_progress(self, history_id: Optional[int] = None) -> int:
+        """현재 진행률 조회 (idx_crawling_logs_history_type으로 최신 1건만 읽음)"""
         conn = get_connection()
         cursor = conn.cursor()
         
         try:
-            sql = """
-            SELECT progress FROM crawling_logs 
-            WHERE type = 'progress' 
-            ORDER BY timestamp DESC 
-            LIMIT 1
-            """
-            cursor.execute(sql)
+            if history_id is None:
+                sql = """
+                SELECT progress FROM crawling_logs 
+                WHERE history_id = (SELECT MAX(id) FROM crawling_history)
+                AND type = 'progress' 
+                ORDER BY id DESC 
+                LIMIT 1
+                """
+                cursor.execute(sql)
+            else:
+                sql = """
+                SELECT progress FROM crawling_logs 
+                WHERE history_id = %s AND type = 'progress' 
+                ORDER BY id DESC 
+                LIMIT 1
+                """
+                cursor.execute(sql, (history_id,))
             result = cursor.fetchone()
             return result[0] if result and result[0] is not None else 0
             
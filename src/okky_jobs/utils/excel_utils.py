@@ -1,8 +1,11 @@
-import pandas as pd
-from typing import List
-from datetime import datetime
-from ..crawler.crawler_master import MasterJob
-from ..db.models import DetailJob
+import csv
+import io
+import re
+import zipfile
+from typing import Iterable, Iterator, List, Optional, Sequence
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+from ..db.models import MasterJob, DetailJob
 
 
 def timestamped_filename(base: str, ext: str = "xlsx") -> str:
@@ -11,43 +14,236 @@ def timestamped_filename(base: str, ext: str = "xlsx") -> str:
     return f"{base}_{timestamp}.{ext}"
 
 
-def save_jobs_to_excel(jobs: List[MasterJob], filename: str = None):
+def _row_values(row, headers: Sequence[str]) -> list:
+    if isinstance(row, dict):
+        return [row.get(h) for h in headers]
+    return list(row)
+
+
+def _row_headers(row) -> List[str]:
+    if isinstance(row, dict):
+        return list(row.keys())
+    return list(row._fields)
+
+
+def write_rows_to_excel(rows: Iterable, filename: str, headers: Optional[Sequence[str]] = None) -> int:
+    """행(dict 또는 NamedTuple)을 하나씩 받아 write-only 모드로 엑셀 저장, 저장 건수 반환"""
+    # openpyxl은 파일 저장 시에만 로드 (API 내보내기는 iter_xlsx_chunks로 직접 작성)
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    count = 0
+    for row in rows:
+        if headers is None:
+            headers = _row_headers(row)
+        if count == 0:
+            sheet.append(list(headers))
+        sheet.append(_row_values(row, headers))
+        count += 1
+    if count:
+        workbook.save(filename)
+    return count
+
+
+def save_jobs_to_excel(jobs: Iterable[MasterJob], filename: str = None) -> int:
     """마스터 공고 데이터를 엑셀로 저장"""
     if not filename:
         filename = timestamped_filename("okky_jobs_export")
-    data = [job._asdict() for job in jobs]
-    df = pd.DataFrame(data)
-    df.to_excel(filename, index=False)
-    print(f"📁 마스터 공고 {len(jobs)}건 엑셀 저장 완료: {filename}")
+    count = write_rows_to_excel(jobs, filename, MasterJob._fields)
+    print(f"📁 마스터 공고 {count}건 엑셀 저장 완료: {filename}")
+    return count
 
 
-def save_details_to_excel(details: List[DetailJob], filename: str = None):
+def save_details_to_excel(details: Iterable[DetailJob], filename: str = None) -> int:
     """상세 공고 데이터를 엑셀로 저장"""
     if not filename:
         filename = timestamped_filename("okky_details_export")
-    data = [detail._asdict() for detail in details]
-    df = pd.DataFrame(data)
-
-    # ✅ datetime 포맷 지정
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    df.attrs["exported_at"] = now_str  # 엑셀 파일 자체에는 메타 데이터 못 들어감, 기록만 가능
+    count = write_rows_to_excel(details, filename, DetailJob._fields)
+    print(f"📁 상세 공고 {count}건 엑셀 저장 완료: {filename}")
+    return count
 
-    df.to_excel(filename, index=False)
-    print(f"📁 상세 공고 {len(details)}건 엑셀 저장 완료: {filename}")
 
-
-def export_to_excel(rows: List[dict], filename: str = None):
+def export_to_excel(rows: Iterable[dict], filename: str = None) -> int:
     """검색 결과 데이터를 엑셀로 저장"""
-    if not rows:
-        print("❌ 저장할 데이터가 없습니다.")
-        return
     if not filename:
         filename = timestamped_filename("okky_search_export")
-    df = pd.DataFrame(rows)
+    count = write_rows_to_excel(rows, filename)
+    if not count:
+        print("❌ 저장할 데이터가 없습니다.")
+        return 0
+    print(f"📁 검색 결과 {count}건 엑셀 저장 완료: {filename}")
+    return count
+
+
+# ==================== 스트리밍 내보내기 (임시 파일 없이 응답으로 바로 전송) ====================
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+# 응답으로 내보낼 청크 크기(바이트)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# XML 1.0에서 허용되지 않는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    # 셀 서식: 0 기본, 1 날짜(yyyy-mm-dd), 2 날짜+시각(yyyy-mm-dd hh:mm:ss)
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="2">'
+        '<numFmt numFmtId="164" formatCode="yyyy-mm-dd"/>'
+        '<numFmt numFmtId="165" formatCode="yyyy-mm-dd hh:mm:ss"/>'
+        '</numFmts>'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="3">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        '</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ),
+}
+# 엑셀 날짜 일련번호 기준일 (1900 날짜 체계)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """zipfile이 쓰는 바이트를 모아 두었다가 꺼내 가는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        self._chunks = []
+        self._size = 0
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def pending(self) -> int:
+        return self._size
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        return data
+
+
+def _xlsx_cell(value) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    if isinstance(value, datetime):
+        # 시간대 정보는 버리고 벽시계 시각 그대로 저장 (엑셀 날짜는 시간대가 없음)
+        serial = (value.replace(tzinfo=None) - _EXCEL_EPOCH).total_seconds() / 86400
+        return f'<c s="2"><v>{serial!r}</v></c>'
+    if isinstance(value, date):
+        return f'<c s="1"><v>{(value - _EXCEL_EPOCH.date()).days}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(values: Sequence) -> str:
+    return "<row>" + "".join(_xlsx_cell(v) for v in values) + "</row>"
+
+
+def iter_xlsx_chunks(rows: Iterable, headers: Optional[Sequence[str]] = None,
+                     chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """행을 하나씩 받아 XLSX(zip) 바이트를 청크 단위로 생성 (시트 XML을 압축하며 바로 내보냄)"""
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+        with archive.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            if headers is not None:
+                sheet.write(_xlsx_row(headers).encode("utf-8"))
+            for row in rows:
+                if headers is None:
+                    headers = _row_headers(row)
+                    sheet.write(_xlsx_row(headers).encode("utf-8"))
+                sheet.write(_xlsx_row(_row_values(row, headers)).encode("utf-8"))
+                if buffer.pending() >= chunk_size:
+                    yield buffer.take()
+            sheet.write(b"</sheetData></worksheet>")
+    yield buffer.take()
 
-    # ✅ datetime 포맷 지정
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    df.attrs["exported_at"] = now_str
 
-    df.to_excel(filename, index=False)
-    print(f"📁 검색 결과 {len(rows)}건 엑셀 저장 완료: {filename}")
+def iter_csv_chunks(rows: Iterable, headers: Optional[Sequence[str]] = None,
+                    chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """행을 하나씩 받아 CSV 바이트를 청크 단위로 생성 (엑셀 호환을 위해 UTF-8 BOM 포함)"""
+    text = io.StringIO()
+    writer = csv.writer(text)
+    yield "\ufeff".encode("utf-8")
+    if headers is not None:
+        writer.writerow(headers)
+    for row in rows:
+        if headers is None:
+            headers = _row_headers(row)
+            writer.writerow(headers)
+        writer.writerow(["" if v is None else v for v in _row_values(row, headers)])
+        if text.tell() >= chunk_size:
+            yield text.getvalue().encode("utf-8")
+            text.seek(0)
+            text.truncate()
+    if text.tell():
+        yield text.getvalue().encode("utf-8")
@@ -0,0 +1,167 @@
+"""
+백그라운드 내보내기 작업 관리 (진행률 조회, 완료 파일 다운로드, TTL 기반 정리)
+"""
+
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from .excel_utils import iter_xlsx_chunks, iter_csv_chunks
+
+# 내보내기 파일 저장 경로 / 동시 실행 수 / 대기 포함 최대 작업 수 / 완료 파일 보관 시간(초)
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+EXPORT_MAX_WORKERS = int(os.getenv("EXPORT_MAX_WORKERS", 2))
+EXPORT_MAX_PENDING = int(os.getenv("EXPORT_MAX_PENDING", 10))
+EXPORT_TTL = float(os.getenv("EXPORT_TTL", 3600))
+
+EXPORT_WRITERS = {"xlsx": iter_xlsx_chunks, "csv": iter_csv_chunks}
+# 이 모듈이 만드는 파일 이름 (<uuid hex>.xlsx|csv[.part]) - EXPORT_DIR의 다른 파일은 정리하지 않음
+_EXPORT_FILE = re.compile(r"([0-9a-f]{32})\.(?:xlsx|csv)(?:\.part)?")
+
+
+class ExportQueueFull(Exception):
+    """대기 중인 내보내기 작업이 너무 많음"""
+
+
+class ExportJob:
+    """내보내기 작업 상태"""
+
+    def __init__(self, keyword: Optional[str], format: str, fields: Optional[List[str]]):
+        self.id = uuid.uuid4().hex
+        self.keyword = keyword
+        self.format = format
+        self.fields = fields
+        self.status = "queued"  # queued → running → completed / failed
+        self.rows = 0
+        self.total: Optional[int] = None
+        self.error: Optional[str] = None
+        self.path: Optional[str] = None
+        self.size = 0
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+
+    @property
+    def filename(self) -> str:
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime(self.created_at))
+        return f"okky_jobs_export_{timestamp}.{self.format}"
+
+    @property
+    def progress(self) -> float:
+        if self.status == "completed":
+            return 1.0
+        if not self.total:
+            return 0.0
+        return round(min(self.rows / self.total, 1.0), 4)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "format": self.format,
+            "keyword": self.keyword,
+            "fields": self.fields,
+            "rows": self.rows,
+            "total": self.total,
+            "progress": self.progress,
+            "size": self.size,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+            "expiresAt": self.expires_at,
+        }
+
+
+class ExportManager:
+    """전용 스레드 풀에서 내보내기를 실행 (API 요청 처리 스레드와 분리, 동시 실행 수 제한)"""
+
+    def __init__(self, directory: str = EXPORT_DIR, max_workers: int = EXPORT_MAX_WORKERS,
+                 max_pending: int = EXPORT_MAX_PENDING, ttl: float = EXPORT_TTL):
+        self.directory = directory
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, keyword: Optional[str], format: str, fields: Optional[List[str]] = None) -> ExportJob:
+        self.cleanup()
+        job = ExportJob(keyword, format, fields)
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j.status in ("queued", "running"))
+            if pending >= self.max_pending:
+                raise ExportQueueFull(f"대기 중인 내보내기 작업이 {pending}건입니다")
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        self.cleanup()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _counted(self, rows: Iterable[dict], job: ExportJob) -> Iterable[dict]:
+        for row in rows:
+            job.rows += 1
+            yield row
+
+    def _run(self, job: ExportJob):
+        from ..db.db import iter_search_jobs, count_search_jobs
+
+        job.status = "running"
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{job.id}.{job.format}")
+        partial = path + ".part"
+        try:
+            job.total = count_search_jobs(job.keyword)
+            rows = self._counted(iter_search_jobs(job.keyword, fields=job.fields), job)
+            with open(partial, "wb") as f:
+                for chunk in EXPORT_WRITERS[job.format](rows):
+                    f.write(chunk)
+            os.replace(partial, path)
+            job.path = path
+            job.size = os.path.getsize(path)
+            job.status = "completed"
+            print(f"📁 내보내기 완료: {job.id} ({job.rows}건, {job.size} bytes)")
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            print(f"❌ 내보내기 실패: {job.id} - {e}")
+            if os.path.exists(partial):
+                os.remove(partial)
+        finally:
+            job.finished_at = time.time()
+            job.expires_at = job.finished_at + self.ttl
+
+    def cleanup(self):
+        """보관 시간이 지난 작업과 파일 삭제 (이전 프로세스가 남긴 파일 포함)"""
+        now = time.time()
+        with self._lock:
+            expired = [j for j in self._jobs.values() if j.expires_at and now > j.expires_at]
+            for job in expired:
+                del self._jobs[job.id]
+            active_ids = set(self._jobs)
+        for job in expired:
+            if job.path and os.path.exists(job.path):
+                os.remove(job.path)
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            match = _EXPORT_FILE.fullmatch(name)
+            if match is None or match.group(1) in active_ids:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.isfile(path) and now - os.path.getmtime(path) > self.ttl:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            statuses = [j.status for j in self._jobs.values()]
+        return {status: statuses.count(status) for status in ("queued", "running", "completed", "failed")}
@@ -0,0 +1,77 @@
+"""
+HTTP 조건부 요청(ETag / If-None-Match, Last-Modified / If-Modified-Since) 처리
+"""
+
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional
+
+# 엔드포인트별 Cache-Control 정책 (데이터는 하루 한 번 정도 바뀌므로 짧게 캐시 후 재검증)
+CACHE_CONTROL = {
+    "search": os.getenv("CACHE_CONTROL_SEARCH", "public, max-age=60, stale-while-revalidate=300"),
+    # 조회수 집계를 위해 매번 재검증 (변경 없으면 304)
+    "detail": os.getenv("CACHE_CONTROL_DETAIL", "no-cache"),
+    "stats": os.getenv("CACHE_CONTROL_STATS", "public, max-age=300, stale-while-revalidate=600"),
+    "history": os.getenv("CACHE_CONTROL_HISTORY", "no-cache"),
+}
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문으로 강한 ETag 생성"""
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def make_version_etag(*parts) -> str:
+    """데이터 세대 번호와 요청 파라미터로 강한 ETag 생성 (본문 없이 계산 가능)"""
+    return make_etag(repr(parts).encode("utf-8"))
+
+
+def http_date(timestamp: float) -> str:
+    """UNIX timestamp를 HTTP 날짜 형식(GMT)으로 변환"""
+    return formatdate(timestamp, usegmt=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값이 현재 ETag와 일치하는지 (약한 비교, 목록과 * 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: Optional[float]) -> bool:
+    """If-Modified-Since 이후 변경이 없는지 (초 단위 비교, 잘못된 날짜는 변경된 것으로 처리)"""
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since is None or since.tzinfo is None:
+        return False
+    return int(last_modified) <= since.timestamp()
+
+
+def is_not_modified(headers, etag: str, last_modified: Optional[float] = None) -> bool:
+    """조건부 요청 판정 (If-None-Match가 있으면 If-Modified-Since는 무시)"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    return not_modified_since(headers.get("if-modified-since"), last_modified)
+
+
+def cache_headers(policy: str, etag: str, last_modified: Optional[float] = None) -> Dict[str, str]:
+    """ETag / Last-Modified / Cache-Control 응답 헤더"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL[policy]}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
@@ -0,0 +1,102 @@
+"""
+crawling_logs 일자별 파티션 관리 (미리 생성 + 보관 기간 지난 파티션 DROP)
+"""
+
+import os
+import re
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+LOG_TABLE = "crawling_logs"
+FUTURE_PARTITION = "p_future"
+# 보관 기간(일)과 미리 만들어 둘 파티션 수(일)
+LOG_RETENTION_DAYS = int(os.getenv("CRAWLING_LOG_RETENTION_DAYS", 14))
+LOG_PARTITION_DAYS_AHEAD = int(os.getenv("CRAWLING_LOG_PARTITION_DAYS_AHEAD", 3))
+
+_PARTITION_NAME = re.compile(r"^p(\d{8})$")
+
+
+def partition_name(day: date) -> str:
+    """일자 파티션 이름 (p20250101: 해당 일자 이전까지의 행 보관)"""
+    return f"p{day.strftime('%Y%m%d')}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """파티션 이름에서 일자 추출 (p_future 등은 None)"""
+    match = _PARTITION_NAME.match(name or "")
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y%m%d").date()
+
+
+def plan_partition_maintenance(
+    existing: List[str],
+    today: date,
+    retention_days: int = LOG_RETENTION_DAYS,
+    days_ahead: int = LOG_PARTITION_DAYS_AHEAD
+) -> Tuple[List[date], List[str]]:
+    """기존 파티션 목록으로부터 (추가할 일자 목록, DROP할 파티션 이름 목록) 계산"""
+    days = sorted(d for d in (partition_day(name) for name in existing) if d)
+
+    start = today if not days else max(days[-1] + timedelta(days=1), today)
+    last = today + timedelta(days=days_ahead)
+    to_add = []
+    day = start
+    while day <= last:
+        to_add.append(day)
+        day += timedelta(days=1)
+
+    cutoff = today - timedelta(days=retention_days)
+    to_drop = [partition_name(d) for d in days if d < cutoff]
+    return to_add, to_drop
+
+
+def _partition_clause(day: date) -> str:
+    # pYYYYMMDD 파티션에는 해당 일자까지의 행이 들어감 (다음날 0시 미만)
+    upper = (day + timedelta(days=1)).strftime("%Y-%m-%d")
+    return f"PARTITION {partition_name(day)} VALUES LESS THAN (TO_DAYS('{upper}'))"
+
+
+def maintain_log_partitions(
+    retention_days: int = LOG_RETENTION_DAYS,
+    days_ahead: int = LOG_PARTITION_DAYS_AHEAD
+) -> Tuple[List[str], List[str]]:
+    """파티션 추가/삭제를 수행하고 (추가된 이름, 삭제된 이름)을 반환"""
+    from ..db.db import get_connection
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            SELECT PARTITION_NAME FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+        """, (LOG_TABLE,))
+        existing = [row[0] for row in cursor.fetchall()]
+        if FUTURE_PARTITION not in existing:
+            print(f"⚠️ {LOG_TABLE} 파티션이 없습니다. sql/crawling_logs_migration.sql을 먼저 적용하세요")
+            return [], []
+
+        to_add, to_drop = plan_partition_maintenance(existing, datetime.now().date(), retention_days, days_ahead)
+
+        if to_add:
+            clauses = ", ".join(_partition_clause(day) for day in to_add)
+            cursor.execute(f"""
+                ALTER TABLE {LOG_TABLE} REORGANIZE PARTITION {FUTURE_PARTITION} INTO (
+                    {clauses},
+                    PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE
+                )
+            """)
+        if to_drop:
+            # 행 단위 DELETE 대신 파티션 단위로 제거
+            cursor.execute(f"ALTER TABLE {LOG_TABLE} DROP PARTITION {', '.join(to_drop)}")
+
+        added = [partition_name(day) for day in to_add]
+        print(f"✅ 로그 파티션 정리 완료: 추가 {len(added)}개, 삭제 {len(to_drop)}개")
+        return added, to_drop
+    except Exception as e:
+        print(f"❌ 로그 파티션 정리 실패: {e}")
+        return [], []
+    finally:
+        cursor.close()
+        conn.close()
@@ -0,0 +1,224 @@
+"""
+크롤링 로그/진행 상태 실시간 전송 (SSE)
+
+크롤링은 API 프로세스 밖(스케줄러 컨테이너)에서도 실행되므로 crawling_logs를 tail 한다.
+구독자가 있는 동안 백그라운드 스레드 하나가 주기적으로 새 로그와 진행 상태를 읽어
+메모리 버퍼에 쌓고, 각 SSE 연결은 DB 조회 없이 버퍼에서 자기 위치 이후의 이벤트만 읽는다.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# DB tail 주기(초) / 메모리에 보관할 로그 이벤트 수 / SSE keep-alive 주기(초)
+LOG_STREAM_POLL_INTERVAL = float(os.getenv("LOG_STREAM_POLL_INTERVAL", 1))
+LOG_STREAM_BUFFER_SIZE = int(os.getenv("LOG_STREAM_BUFFER_SIZE", 2000))
+LOG_STREAM_KEEPALIVE = float(os.getenv("LOG_STREAM_KEEPALIVE", 15))
+# 구독자가 없으면 이 시간(초) 후 tail 스레드 종료
+LOG_STREAM_IDLE_TIMEOUT = float(os.getenv("LOG_STREAM_IDLE_TIMEOUT", 30))
+_FETCH_LIMIT = 500
+
+
+def format_sse(event: str, data: Any, event_id: Optional[int] = None) -> str:
+    """SSE 메시지 한 건 (id가 없으면 클라이언트의 Last-Event-ID는 유지됨)"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    lines.extend(f"data: {line}" for line in payload.splitlines())
+    return "\n".join(lines) + "\n\n"
+
+
+def _log_event(row) -> Tuple[int, Dict[str, Any]]:
+    log_id, history_id, log_type, message, timestamp, progress = row
+    return int(log_id), {
+        "historyId": history_id,
+        "type": log_type,
+        "message": message,
+        "timestamp": timestamp.isoformat() if timestamp else None,
+        "progress": progress,
+    }
+
+
+def fetch_logs_after(after_id: Optional[int], limit: int = _FETCH_LIMIT) -> List[Tuple[int, Dict[str, Any]]]:
+    """after_id 이후의 로그 (None이면 최근 limit건), id 오름차순"""
+    from .crawling_logger import get_connection
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        # 최근 일자 파티션만 읽도록 timestamp 조건 추가
+        since = datetime.now() - timedelta(days=1)
+        if after_id is None:
+            cursor.execute("""
+                SELECT id, history_id, type, message, timestamp, progress
+                FROM crawling_logs
+                WHERE timestamp >= %s
+                ORDER BY id DESC
+                LIMIT %s
+            """, (since, limit))
+            rows = cursor.fetchall()[::-1]
+        else:
+            cursor.execute("""
+                SELECT id, history_id, type, message, timestamp, progress
+                FROM crawling_logs
+                WHERE id > %s AND timestamp >= %s
+                ORDER BY id
+                LIMIT %s
+            """, (after_id, since, limit))
+            rows = cursor.fetchall()
+        return [_log_event(row) for row in rows]
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def fetch_status() -> Dict[str, Any]:
+    """가장 최근 크롤링 히스토리의 상태 (기본키 역순 1건)"""
+    from .crawling_logger import get_connection
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT id, status, processed FROM crawling_history ORDER BY id DESC LIMIT 1")
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+    if not row:
+        return {"historyId": None, "status": None, "processed": 0, "isRunning": False}
+    return {"historyId": row[0], "status": row[1], "processed": row[2], "isRunning": row[1] == "진행중"}
+
+
+class LogStreamBus:
+    """crawling_logs tail 결과를 여러 SSE 연결이 공유하는 버퍼"""
+
+    def __init__(
+        self,
+        fetch_logs: Callable[[Optional[int]], List[Tuple[int, Dict[str, Any]]]] = fetch_logs_after,
+        fetch_state: Callable[[], Dict[str, Any]] = fetch_status,
+        buffer_size: int = LOG_STREAM_BUFFER_SIZE
+    ):
+        self._fetch_logs = fetch_logs
+        self._fetch_state = fetch_state
+        self._events: "deque[Tuple[int, Dict[str, Any]]]" = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._subscribers = 0
+        self._idle_since = time.monotonic()
+        self.last_id: Optional[int] = None
+        self.status: Dict[str, Any] = {}
+        self.status_version = 0
+        self.polls = 0
+        self.failures = 0
+
+    def subscribe(self):
+        with self._lock:
+            self._subscribers += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="crawl-log-tail", daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self):
+        with self._lock:
+            self._subscribers -= 1
+            if self._subscribers <= 0:
+                self._idle_since = time.monotonic()
+
+    def _run(self):
+        while True:
+            self.poll()
+            time.sleep(LOG_STREAM_POLL_INTERVAL)
+            with self._lock:
+                if self._subscribers <= 0 and time.monotonic() - self._idle_since > LOG_STREAM_IDLE_TIMEOUT:
+                    self._thread = None
+                    return
+
+    def poll(self):
+        """새 로그와 진행 상태를 읽어 버퍼에 추가 (모든 구독자가 공유하는 조회)"""
+        self.polls += 1
+        try:
+            events = self._fetch_logs(self.last_id)
+            while events:
+                with self._lock:
+                    self._events.extend(events)
+                    self.last_id = events[-1][0]
+                if len(events) < _FETCH_LIMIT:
+                    break
+                events = self._fetch_logs(self.last_id)
+            if self.last_id is None:
+                # 로그가 하나도 없으면 0부터 tail
+                self.last_id = 0
+            status = self._fetch_state()
+            progress = self.latest_progress(status.get("historyId"))
+            status = {**status, "progress": progress}
+            if status != self.status:
+                self.status = status
+                self.status_version += 1
+        except Exception as e:
+            self.failures += 1
+            print(f"⚠️ 크롤링 로그 tail 실패: {e}")
+
+    def latest_progress(self, history_id: Optional[int]) -> int:
+        """버퍼에 있는 해당 히스토리의 마지막 진행률"""
+        with self._lock:
+            for _, event in reversed(self._events):
+                if event["historyId"] == history_id and event["type"] == "progress" and event["progress"] is not None:
+                    return event["progress"]
+        return 0
+
+    def events_after(self, after_id: Optional[int]) -> Tuple[List[Tuple[int, Dict[str, Any]]], bool]:
+        """after_id 이후 이벤트와 버퍼만으로 충분한지 여부 (버퍼보다 오래된 위치면 False)"""
+        if after_id is None:
+            return [], True
+        with self._lock:
+            # 뒤에서부터 새 이벤트만 훑음 (연결마다 버퍼 전체를 보지 않도록)
+            events = []
+            for event in reversed(self._events):
+                if event[0] <= after_id:
+                    break
+                events.append(event)
+            events.reverse()
+            # 버퍼보다 앞선 위치면 중간에 빠진 로그가 있을 수 있으므로 DB에서 다시 읽어야 함
+            complete = not self._events or after_id >= self._events[0][0] - 1
+        return events, complete
+
+    def replay(self, after_id: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """Last-Event-ID 이후 이벤트 (버퍼에서 빠진 구간만 DB에서 다시 읽음)"""
+        events, complete = self.events_after(after_id)
+        if complete:
+            return events
+        replayed = []
+        cursor = after_id
+        while True:
+            batch = self._fetch_logs(cursor)
+            replayed.extend(batch)
+            if len(batch) < _FETCH_LIMIT:
+                break
+            cursor = batch[-1][0]
+        cursor = replayed[-1][0] if replayed else after_id
+        return replayed + [e for e in events if e[0] > cursor]
+
+    def recent(self, history_id: Optional[int], limit: int = 50) -> List[Tuple[int, Dict[str, Any]]]:
+        """해당 히스토리의 최근 이벤트 (연결 직후 초기 화면용)"""
+        with self._lock:
+            events = [e for e in self._events if e[1]["historyId"] == history_id]
+        return events[-limit:]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "subscribers": self._subscribers,
+                "buffered": len(self._events),
+                "lastId": self.last_id,
+                "polls": self.polls,
+                "failures": self.failures,
+            }
+
+
+log_stream_bus = LogStreamBus()
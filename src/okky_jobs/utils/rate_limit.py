@@ -0,0 +1,270 @@
+"""
+API 요청 제한 (클라이언트별 토큰 버킷 + 무거운 엔드포인트 동시 실행 수 제한)
+
+토큰 버킷은 클라이언트(API 키 또는 IP)와 경로 규칙별로 따로 두고, 무거운 엔드포인트는
+전체 동시 실행 수를 제한해 잠시 대기시킨 뒤에도 자리가 나지 않으면 429로 거절한다.
+스트리밍 응답은 본문 전송이 끝날 때까지 자리를 차지하므로 순수 ASGI 미들웨어로 감싼다.
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+# 기본 토큰 버킷 (초당 요청 수, 순간 최대 요청 수)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "1") != "0"
+RATE_LIMIT_DEFAULT_RATE = float(os.getenv("RATE_LIMIT_DEFAULT_RATE", 10))
+RATE_LIMIT_DEFAULT_BURST = int(os.getenv("RATE_LIMIT_DEFAULT_BURST", 30))
+# 경로별 규칙 "경로=초당요청수:버스트" 목록 (쉼표 구분)
+RATE_LIMIT_ROUTES = os.getenv("RATE_LIMIT_ROUTES", "/jobs=0.5:5,/jobs/export=0.2:3,/exports=0.2:3")
+# 메모리에 보관할 클라이언트 버킷 수 (오래 안 쓴 버킷부터 제거)
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", 10000))
+# 등록된 API 키(쉼표 구분)는 IP 대신 키별 버킷 사용 (임의 키로 제한을 피하지 못하도록 등록된 키만)
+RATE_LIMIT_API_KEYS = {key.strip() for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()}
+# 신뢰하는 리버스 프록시 뒤에서만 켬: 프록시가 넣은 X-Real-IP, 없으면 X-Forwarded-For의 마지막 IP를 사용
+# (X-Forwarded-For 앞쪽 값은 클라이언트가 임의로 보낼 수 있으므로 사용하지 않음)
+RATE_LIMIT_TRUST_FORWARDED = os.getenv("RATE_LIMIT_TRUST_FORWARDED", "0") == "1"
+# 토큰 버킷을 적용하지 않을 경로 (장시간 연결되는 SSE 스트림 등, 쉼표 구분) - CORS preflight(OPTIONS)도 제외
+RATE_LIMIT_EXEMPT_PATHS = os.getenv("RATE_LIMIT_EXEMPT_PATHS", "/crawl/logs/stream")
+
+# 무거운 엔드포인트 전체 동시 실행 수 / 자리가 날 때까지 기다리는 최대 시간(초)
+ADMISSION_ROUTES = os.getenv("ADMISSION_ROUTES", "/jobs,/jobs/export,/exports")
+ADMISSION_MAX_CONCURRENT = int(os.getenv("ADMISSION_MAX_CONCURRENT", 4))
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", 2))
+
+
+def parse_route_rules(spec: str) -> Dict[str, Tuple[float, int]]:
+    """"/jobs=0.5:5,/exports=0.2:3" → {"/jobs": (0.5, 5), "/exports": (0.2, 3)}"""
+    rules = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        path, _, limit = item.strip().partition("=")
+        rate, _, burst = limit.partition(":")
+        rules[path.strip()] = (float(rate), int(burst or max(1, math.ceil(float(rate)))))
+    return rules
+
+
+def parse_paths(spec: str) -> list:
+    return [path.strip() for path in spec.split(",") if path.strip()]
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+
+    def take(self, cost: float = 1) -> Tuple[bool, float]:
+        """토큰 사용 (허용 여부, 거절 시 토큰이 찰 때까지 기다릴 초)"""
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True, 0.0
+        if self.rate <= 0:
+            return False, float("inf")
+        return False, (cost - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """(클라이언트, 경로 규칙)별 토큰 버킷 (이벤트 루프 안에서만 사용하므로 잠금 없음)"""
+
+    def __init__(
+        self,
+        routes: Optional[Dict[str, Tuple[float, int]]] = None,
+        default: Tuple[float, int] = (RATE_LIMIT_DEFAULT_RATE, RATE_LIMIT_DEFAULT_BURST),
+        max_clients: int = RATE_LIMIT_MAX_CLIENTS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.routes = parse_route_rules(RATE_LIMIT_ROUTES) if routes is None else routes
+        self.default = default
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self.allowed = 0
+        self.rejected: Dict[str, int] = {}
+
+    def check(self, client: str, path: str) -> Tuple[bool, float]:
+        """요청 허용 여부와 거절 시 Retry-After(초)"""
+        rule = path if path in self.routes else "*"
+        key = (client, rule)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.routes.get(rule, self.default)
+            bucket = self._buckets[key] = TokenBucket(rate, burst, self._clock)
+            # 오래 안 쓴 버킷은 이미 가득 찼을 것이므로 지워도 제한이 느슨해지지 않음
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        allowed, retry_after = bucket.take()
+        if allowed:
+            self.allowed += 1
+        else:
+            self.rejected[rule] = self.rejected.get(rule, 0) + 1
+        return allowed, retry_after
+
+    def stats(self) -> dict:
+        return {
+            "clients": len(self._buckets),
+            "allowed": self.allowed,
+            "rejected": dict(self.rejected),
+            "routes": {path: {"rate": rate, "burst": burst} for path, (rate, burst) in self.routes.items()},
+            "default": {"rate": self.default[0], "burst": self.default[1]},
+        }
+
+
+class ConcurrencyGate:
+    """무거운 엔드포인트 전체 동시 실행 수 제한 (자리가 없으면 queue_timeout초까지 대기)"""
+
+    def __init__(self, max_concurrent: int = ADMISSION_MAX_CONCURRENT, queue_timeout: float = ADMISSION_QUEUE_TIMEOUT):
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.in_flight = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.queued = 0
+        self.queue_time_total = 0.0
+        self.queue_time_max = 0.0
+        self.hold_time_total = 0.0
+
+    async def acquire(self) -> bool:
+        """자리를 얻으면 True (release 필요), 대기 시간 초과면 False"""
+        started = time.monotonic()
+        if self._semaphore.locked():
+            self.waiting += 1
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                return False
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        waited = time.monotonic() - started
+        self.queue_time_total += waited
+        self.queue_time_max = max(self.queue_time_max, waited)
+        self.admitted += 1
+        self.in_flight += 1
+        return True
+
+    def release(self, held: float):
+        self.in_flight -= 1
+        self.hold_time_total += held
+        self._semaphore.release()
+
+    def retry_after(self) -> int:
+        """평균 처리 시간 기준으로 다시 시도할 시각(초)"""
+        completed = self.admitted - self.in_flight
+        average = self.hold_time_total / completed if completed else 1.0
+        return max(1, math.ceil(average))
+
+    def stats(self) -> dict:
+        return {
+            "maxConcurrent": self.max_concurrent,
+            "queueTimeout": self.queue_timeout,
+            "inFlight": self.in_flight,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "avgQueueMs": round(self.queue_time_total / self.admitted * 1000, 2) if self.admitted else 0.0,
+            "maxQueueMs": round(self.queue_time_max * 1000, 2),
+        }
+
+
+def client_key(scope: dict, trust_forwarded: Optional[bool] = None) -> str:
+    """등록된 API 키(X-API-Key)면 키, 아니면 클라이언트 IP"""
+    headers = {name.lower(): value for name, value in scope.get("headers", [])}
+    api_key = headers.get(b"x-api-key", b"").decode("latin-1")
+    if api_key in RATE_LIMIT_API_KEYS:
+        return "key:" + api_key
+    if RATE_LIMIT_TRUST_FORWARDED if trust_forwarded is None else trust_forwarded:
+        # nginx 설정: X-Real-IP = $remote_addr, X-Forwarded-For = $proxy_add_x_forwarded_for (맨 뒤에 실제 주소 추가)
+        real_ip = headers.get(b"x-real-ip", b"").decode("latin-1").strip()
+        if real_ip:
+            return "ip:" + real_ip
+        hops = [hop.strip() for hop in headers.get(b"x-forwarded-for", b"").decode("latin-1").split(",") if hop.strip()]
+        if hops:
+            return "ip:" + hops[-1]
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+class AdmissionControlMiddleware:
+    """토큰 버킷 → 동시 실행 수 제한 순서로 확인하고 초과 시 429 + Retry-After 응답"""
+
+    def __init__(
+        self,
+        app,
+        limiter: RateLimiter,
+        gate: ConcurrencyGate,
+        gated_routes: Iterable[str] = None,
+        exempt_paths: Iterable[str] = None
+    ):
+        self.app = app
+        self.limiter = limiter
+        self.gate = gate
+        self.gated_routes = set(parse_paths(ADMISSION_ROUTES) if gated_routes is None else gated_routes)
+        self.exempt_paths = set(parse_paths(RATE_LIMIT_EXEMPT_PATHS) if exempt_paths is None else exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):] or "/"
+
+        # CORS preflight는 본 요청과 같은 버킷을 이중으로 소모하지 않도록, SSE는 재연결이 막히지 않도록 제외
+        if scope.get("method") == "OPTIONS" or path in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        allowed, retry_after = self.limiter.check(client_key(scope), path)
+        if not allowed:
+            await _reject(send, "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.", retry_after)
+            return
+
+        if path not in self.gated_routes:
+            await self.app(scope, receive, send)
+            return
+
+        if not await self.gate.acquire():
+            await _reject(send, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.", self.gate.retry_after())
+            return
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.gate.release(time.monotonic() - started)
+
+
+async def _reject(send, message: str, retry_after: float):
+    body = json.dumps({"success": False, "message": message}, ensure_ascii=False).encode("utf-8")
+    retry = str(max(1, math.ceil(retry_after))) if math.isfinite(retry_after) else "60"
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", retry.encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
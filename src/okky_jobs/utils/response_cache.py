@@ -0,0 +1,140 @@
+"""
+API 응답 캐시 (LRU + TTL, 메모리 바이트 상한, 데이터 세대 기반 무효화)
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional
+
+# 이름별 캐시 목록 (메트릭 조회용)
+CACHES: Dict[str, "ResponseCache"] = {}
+
+
+def estimate_size(value: Any) -> int:
+    """캐시 항목의 대략적인 메모리 크기 (직렬화 바이트 수 기준)"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if hasattr(value, "model_dump_json"):
+        return len(value.model_dump_json())
+    return len(json.dumps(value, default=str, ensure_ascii=False).encode("utf-8"))
+
+
+def normalize_key(**params) -> tuple:
+    """요청 파라미터를 캐시 키로 변환 (빈 값은 None, 목록은 순서 무관)"""
+    items = []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = tuple(sorted(str(v) for v in value))
+        if value in ("", ()):
+            value = None
+        items.append((name, value))
+    return tuple(items)
+
+
+class ResponseCache:
+    """LRU + TTL 캐시. 전체 크기를 바이트로 제한하고 데이터 세대가 바뀌면 모두 비움"""
+
+    def __init__(self, name: str, max_bytes: int, ttl: float, max_entry_bytes: Optional[int] = None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes or max(max_bytes // 8, 1)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._generation = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        CACHES[name] = self
+
+    def _check_generation(self, generation):
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._generation = generation
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key: Hashable, generation=None) -> Optional[Any]:
+        with self._lock:
+            self._check_generation(generation)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, generation=None, size: Optional[int] = None) -> bool:
+        """항목 저장 (항목 하나가 max_entry_bytes를 넘으면 저장하지 않음)"""
+        size = estimate_size(value) if size is None else size
+        if size > self.max_entry_bytes:
+            return False
+        with self._lock:
+            self._check_generation(generation)
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            return True
+
+    def tee(self, key: Hashable, chunks: Iterable[bytes], generation=None) -> Iterator[bytes]:
+        """청크를 그대로 내보내면서 모아 두었다가, 끝까지 전송되고 max_entry_bytes 이하이면 캐시에 저장"""
+        parts: Optional[List[bytes]] = []
+        size = 0
+        for chunk in chunks:
+            if parts is not None:
+                size += len(chunk)
+                if size > self.max_entry_bytes:
+                    parts = None
+                else:
+                    parts.append(chunk)
+            yield chunk
+        if parts is not None:
+            self.set(key, b"".join(parts), generation, size=size)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "ttl": self.ttl,
+                "generation": self._generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: cache.stats() for name, cache in CACHES.items()}
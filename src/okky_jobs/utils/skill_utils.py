@@ -0,0 +1,122 @@
+"""
+보유스킬 문자열 토큰화/정규화 유틸리티
+"""
+
+import re
+from typing import List, Optional
+
+# ✅ 정규화 키 → 대표 표기
+# 키는 normalize_key() 결과(소문자, 공백/마침표/슬래시 제거) 기준
+SKILL_ALIASES = {
+    "javascript": "JavaScript", "js": "JavaScript", "자바스크립트": "JavaScript",
+    "typescript": "TypeScript", "ts": "TypeScript", "타입스크립트": "TypeScript",
+    "java": "Java", "자바": "Java",
+    "python": "Python", "py": "Python", "파이썬": "Python",
+    "spring": "Spring", "스프링": "Spring",
+    "springboot": "Spring Boot", "스프링부트": "Spring Boot",
+    "springframework": "Spring",
+    "egovframe": "eGovFrame", "egov": "eGovFrame", "전자정부프레임워크": "eGovFrame", "전자정부": "eGovFrame",
+    "react": "React", "reactjs": "React", "리액트": "React",
+    "reactnative": "React Native",
+    "vue": "Vue.js", "vuejs": "Vue.js", "뷰": "Vue.js",
+    "angular": "Angular", "angularjs": "Angular",
+    "node": "Node.js", "nodejs": "Node.js", "노드": "Node.js",
+    "nextjs": "Next.js", "next": "Next.js",
+    "jquery": "jQuery",
+    "html": "HTML", "html5": "HTML",
+    "css": "CSS", "css3": "CSS",
+    "jsp": "JSP",
+    "php": "PHP",
+    "c": "C",
+    "c++": "C++", "cpp": "C++",
+    "c#": "C#", "csharp": "C#",
+    "net": ".NET", "dotnet": ".NET", "aspnet": ".NET",
+    "go": "Go", "golang": "Go",
+    "kotlin": "Kotlin", "코틀린": "Kotlin",
+    "swift": "Swift",
+    "android": "Android", "안드로이드": "Android",
+    "ios": "iOS",
+    "flutter": "Flutter", "플러터": "Flutter",
+    "django": "Django",
+    "flask": "Flask",
+    "fastapi": "FastAPI",
+    "mybatis": "MyBatis", "ibatis": "MyBatis",
+    "jpa": "JPA",
+    "oracle": "Oracle", "오라클": "Oracle",
+    "mysql": "MySQL",
+    "mariadb": "MariaDB",
+    "postgresql": "PostgreSQL", "postgres": "PostgreSQL",
+    "mssql": "MSSQL", "sqlserver": "MSSQL",
+    "plsql": "PL/SQL",
+    "redis": "Redis",
+    "kafka": "Kafka",
+    "aws": "AWS",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes", "k8s": "Kubernetes",
+    "linux": "Linux", "리눅스": "Linux",
+    "git": "Git",
+    "sap": "SAP",
+    "abap": "ABAP",
+    "unity": "Unity", "유니티": "Unity",
+    "nexacro": "Nexacro", "넥사크로": "Nexacro",
+    "websquare": "WebSquare", "웹스퀘어": "WebSquare",
+    "miplatform": "MiPlatform", "마이플랫폼": "MiPlatform",
+}
+
+# 스킬 구분자 (슬래시는 PL/SQL 같은 표기 때문에 별도 처리)
+_SEPARATORS = re.compile(r"[,|·•;\n\r\t]+")
+MAX_SKILL_LENGTH = 100
+
+
+def normalize_key(token: str) -> str:
+    """별칭 조회용 키 (소문자, 공백/마침표/하이픈/슬래시 제거)"""
+    return re.sub(r"[\s.\-_/]+", "", token.strip().lower())
+
+
+def normalize_skill(token: str) -> Optional[str]:
+    """단일 스킬 표기를 대표 표기로 변환 (알 수 없는 스킬은 공백만 정리)"""
+    token = re.sub(r"\s+", " ", token or "").strip(" -")
+    if not token:
+        return None
+    canonical = SKILL_ALIASES.get(normalize_key(token))
+    if canonical:
+        return canonical
+    return token[:MAX_SKILL_LENGTH]
+
+
+def tokenize_skills(skill: Optional[str]) -> List[str]:
+    """보유스킬 원문을 개별 스킬 토큰으로 분리"""
+    if not skill:
+        return []
+    tokens = []
+    for part in _SEPARATORS.split(skill):
+        part = part.strip()
+        if not part:
+            continue
+        # "PL/SQL"처럼 알려진 표기는 그대로, 그 외 슬래시는 구분자로 처리
+        if "/" in part and normalize_key(part) not in SKILL_ALIASES:
+            tokens.extend(p.strip() for p in part.split("/") if p.strip())
+        else:
+            tokens.append(part)
+    return tokens
+
+
+def normalize_skills(skill: Optional[str]) -> List[str]:
+    """보유스킬 원문 → 중복 없는 대표 표기 목록 (원래 순서 유지)"""
+    result = []
+    seen = set()
+    for token in tokenize_skills(skill):
+        normalized = normalize_skill(token)
+        if not normalized:
+            continue
+        key = normalized.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        result.append(normalized)
+    return result
+
+
+def parse_skill_filter(skills: Optional[str]) -> List[str]:
+    """검색 파라미터(skills=java,Spring Boot)를 정규화된 스킬 목록으로 변환"""
+    return normalize_skills(skills)
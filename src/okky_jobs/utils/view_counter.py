@@ -0,0 +1,122 @@
+"""
+공고 조회수 쓰기 지연(write-behind) 집계
+"""
+
+import atexit
+import os
+import threading
+from collections import Counter
+from typing import Dict, Tuple
+
+# 조회수 반영 주기(초) / 대기 중인 조회가 이 건수에 도달하면 즉시 반영
+VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", 5))
+VIEW_COUNT_FLUSH_SIZE = int(os.getenv("VIEW_COUNT_FLUSH_SIZE", 1000))
+
+
+def build_flush_statement(counts: Dict[str, int]) -> Tuple[str, list]:
+    """링크별 증가분을 다중 행 UPDATE 한 문장으로 변환 (API 조회수는 local_view_count에 누적)"""
+    rows = " UNION ALL ".join(["SELECT %s AS link, %s AS views"] * len(counts))
+    params = []
+    for link, views in counts.items():
+        params.extend([link, views])
+    sql = f"""
+        UPDATE okky_job_details d
+        JOIN ({rows}) v ON v.link = d.link
+        SET d.local_view_count = d.local_view_count + v.views, d.updated_at = d.updated_at
+    """
+    return sql, params
+
+
+class ViewCountBuffer:
+    """링크별 조회수를 메모리에서 합산하고 백그라운드 스레드에서 주기적으로 한 번에 반영"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending = Counter()
+        self._pending_total = 0
+        self._thread = None
+        self._stopped = False
+        self.flushed = 0
+        self.failures = 0
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="view-count-writer", daemon=True)
+            self._thread.start()
+
+    def add(self, link: str, views: int = 1):
+        with self._lock:
+            self._pending[link] += views
+            self._pending_total += views
+            should_flush = self._pending_total >= VIEW_COUNT_FLUSH_SIZE
+        self._ensure_started()
+        if should_flush:
+            self._wakeup.set()
+
+    def pending(self, link: str) -> int:
+        """아직 반영되지 않은 조회수"""
+        with self._lock:
+            return self._pending.get(link, 0)
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait(VIEW_COUNT_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """대기 중인 조회수를 UPDATE 한 문장, 커밋 한 번으로 반영 (실패 시 다음 주기에 재시도)"""
+        with self._flush_lock:
+            with self._lock:
+                counts, self._pending = self._pending, Counter()
+                self._pending_total = 0
+            if not counts:
+                return
+
+            from ..db.db import get_connection
+
+            conn = None
+            try:
+                conn = get_connection()
+                sql, params = build_flush_statement(counts)
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, params)
+                conn.commit()
+                self.flushed += sum(counts.values())
+            except Exception as e:
+                self.failures += 1
+                print(f"❌ 조회수 반영 실패 ({len(counts)}건): {e}")
+                with self._lock:
+                    self._pending.update(counts)
+                    self._pending_total += sum(counts.values())
+            finally:
+                if conn:
+                    conn.close()
+
+    def close(self):
+        """백그라운드 스레드를 멈추고 남은 조회수를 반영"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=VIEW_COUNT_FLUSH_INTERVAL + 5)
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pendingLinks": len(self._pending),
+                "pendingViews": self._pending_total,
+                "flushedViews": self.flushed,
+                "failures": self.failures,
+            }
+
+
+view_counter = ViewCountBuffer()
+atexit.register(view_counter.close)
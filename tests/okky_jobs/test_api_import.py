@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 모듈 import 시간/메모리 테스트 (크롤러, Selenium, openpyxl을 불러오지 않는지 확인)
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+# import 시간(밀리초)/최대 RSS(MB) 상한 (느린 CI에서는 환경 변수로 조정)
+IMPORT_TIME_BUDGET_MS = float(os.getenv("API_IMPORT_TIME_BUDGET_MS", 1500))
+IMPORT_RSS_BUDGET_MB = float(os.getenv("API_IMPORT_RSS_BUDGET_MB", 100))
+# API 프로세스에서 지연 로드되어야 하는 모듈
+LAZY_MODULES = ("selenium", "bs4", "openpyxl", "schedule", "webdriver_manager")
+
+PROBE = """
+import json, resource, sys
+import src.okky_jobs.api.api_main
+loaded = sorted(name for name in sys.modules
+                if name.split('.')[0] in %r or name.startswith(('src.okky_jobs.crawler', 'src.okky_jobs.scheduler')))
+print(json.dumps({"rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, "loaded": loaded}))
+""" % (LAZY_MODULES,)
+
+@unittest.skipUnless(
+    importlib.util.find_spec("fastapi") and importlib.util.find_spec("pymysql") and sys.platform.startswith("linux"),
+    "fastapi/pymysql가 없거나 Linux가 아님"
+)
+class TestApiImport(unittest.TestCase):
+    """API 시작 비용 회귀 테스트"""
+
+    def test_import_budget(self):
+        """새 인터프리터에서 api_main import 시간/RSS가 상한 이내이고 크롤러 모듈을 불러오지 않음"""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(probe["loaded"], [], "API import 시 불러오면 안 되는 모듈")
+
+        # -X importtime 출력: "import time: self [us] | cumulative | 모듈"
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[2].strip() == "src.okky_jobs.api.api_main":
+                cumulative_us = int(parts[1])
+        self.assertIsNotNone(cumulative_us)
+        self.assertLess(cumulative_us / 1000, IMPORT_TIME_BUDGET_MS)
+        self.assertLess(probe["rss_kb"] / 1024, IMPORT_RSS_BUDGET_MB)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 로그 일괄 저장 테스트
+"""
+
+import importlib.util
+import unittest
+import sys
+import os
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def executemany(self, sql, rows):
+        if self.conn.fail:
+            raise RuntimeError("connection lost")
+        self.conn.inserted.extend(rows)
+
+    def execute(self, sql, params=None):
+        self.conn.updated.append(params)
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.inserted = []
+        self.updated = []
+        self.rolled_back = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        self.rolled_back = True
+        self.inserted = []
+
+    def close(self):
+        pass
+
+@unittest.skipUnless(importlib.util.find_spec("pymysql"), "pymysql가 없음")
+class TestLogWriter(unittest.TestCase):
+    """저장 실패 시 재시도 테스트"""
+
+    def setUp(self):
+        from src.okky_jobs.utils import crawling_logger
+        self.module = crawling_logger
+        self.writer = crawling_logger._LogWriter()
+        self.writer._ensure_started = lambda: None
+
+    def add(self, i):
+        self.writer.add_log((1, "info", f"log {i}", None, None), {"message": f"log {i}"})
+
+    def test_requeue_on_failure(self):
+        """실패한 로그는 순서대로 대기열 앞에 되돌려 다음 저장에 포함"""
+        self.add(1)
+        self.add(2)
+        self.writer.set_history_progress(1, "진행중", 10)
+        failing = FakeConnection(fail=True)
+        with mock.patch.object(self.module, "get_connection", return_value=failing):
+            self.writer.flush()
+        self.assertTrue(failing.rolled_back)
+        self.assertEqual(self.writer.failures, 1)
+
+        # 실패 후 들어온 로그/진행 상태는 뒤에, 진행 상태는 최신 값 유지
+        self.add(3)
+        self.writer.set_history_progress(1, "진행중", 20)
+        conn = FakeConnection()
+        with mock.patch.object(self.module, "get_connection", return_value=conn):
+            self.writer.flush()
+        self.assertEqual([row[2] for row in conn.inserted], ["log 1", "log 2", "log 3"])
+        self.assertEqual(conn.updated, [("진행중", 20, 1)])
+
+    def test_pending_bound(self):
+        """DB 장애가 길어지면 상한을 넘는 오래된 로그부터 버림"""
+        with mock.patch.object(self.module, "LOG_MAX_PENDING", 3), \
+                mock.patch.object(self.module, "get_connection", return_value=FakeConnection(fail=True)):
+            for i in range(5):
+                self.add(i)
+            self.writer.flush()
+        self.assertEqual([row[2] for row in self.writer._pending_logs], ["log 2", "log 3", "log 4"])
+        self.assertEqual(self.writer.dropped, 2)
+
+if __name__ == '__main__':
+    unittest.main()
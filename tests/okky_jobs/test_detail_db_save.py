@@ -4,9 +4,11 @@
 상세 공고 DB 저장 테스트
 """
 
+import importlib.util
 import unittest
 import sys
 import os
+from unittest import mock
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -25,5 +27,28 @@ class TestDetailDbSave(unittest.TestCase):
         print("===== 배치 상세 공고 저장 테스트 (스킵됨) =====")
         self.skipTest("OKKY 모듈 테스트는 외부 의존성으로 인해 스킵")
 
+@unittest.skipUnless(
+    importlib.util.find_spec("pymysql") and importlib.util.find_spec("dotenv"), "pymysql/python-dotenv가 없음"
+)
+class TestRebuildJobSkills(unittest.TestCase):
+    """기존 상세 공고 스킬 재구성 테스트"""
+    
+    def test_rebuild_includes_archive(self):
+        """게시 중/보관 공고 모두 정규화 스킬로 다시 채우고 데이터 세대 증가"""
+        from src.okky_jobs.db import db
+        conn = mock.MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [("https://okky.kr/recruit/1", "java, 스프링"), ("https://okky.kr/recruit/2", None)]
+        with mock.patch.object(db, "get_connection", return_value=conn):
+            db.rebuild_job_skills()
+        
+        select = cursor.execute.call_args_list[0][0][0]
+        self.assertIn("okky_job_details_archive", select)
+        deletes = [c[0][1] for c in cursor.execute.call_args_list if "DELETE FROM job_skills" in c[0][0]]
+        self.assertEqual(deletes, [("https://okky.kr/recruit/1",), ("https://okky.kr/recruit/2",)])
+        inserted = cursor.executemany.call_args[0][1]
+        self.assertEqual(inserted, [("https://okky.kr/recruit/1", "Java"), ("https://okky.kr/recruit/1", "Spring")])
+        self.assertIn("data_generation", cursor.execute.call_args_list[-1][0][0])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 XLSX/CSV 내보내기 테스트 (생성한 바이트를 openpyxl/csv로 다시 읽어 확인)
+"""
+
+import csv
+import importlib.util
+import io
+import tempfile
+import time
+import unittest
+import uuid
+import sys
+import os
+from datetime import date, datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.excel_utils import iter_xlsx_chunks, iter_csv_chunks
+from src.okky_jobs.utils.export_jobs import ExportManager
+
+ROWS = [
+    {"id": 1, "company": "오키 주식회사", "title": "백엔드 개발자 <Java & Spring>", "deadline": date(2025, 3, 31),
+     "createdAt": datetime(2025, 3, 1, 9, 30, 15), "views": 12, "location": None},
+    {"id": 2, "company": "회사\x01둘", "title": "프론트엔드", "deadline": None,
+     "createdAt": datetime(2025, 3, 2, 0, 0, 0), "views": 0, "location": "서울"},
+]
+HEADERS = ["id", "company", "title", "deadline", "createdAt", "views", "location"]
+
+def load_xlsx(chunks):
+    from openpyxl import load_workbook
+    workbook = load_workbook(io.BytesIO(b"".join(chunks)), read_only=True)
+    return [list(row) for row in workbook.active.iter_rows(values_only=True)]
+
+def load_csv(chunks):
+    data = b"".join(chunks)
+    has_bom = data.startswith("\ufeff".encode("utf-8"))
+    return has_bom, list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))
+
+@unittest.skipUnless(importlib.util.find_spec("openpyxl"), "openpyxl가 없음")
+class TestXlsxChunks(unittest.TestCase):
+    """XLSX 스트리밍 생성 테스트"""
+
+    def test_round_trip(self):
+        """헤더, 한글, 빈 값, 날짜/시각 셀이 그대로 읽힘 (작은 청크로 나눠 생성해도 동일)"""
+        rows = load_xlsx(iter_xlsx_chunks(iter(ROWS), chunk_size=64))
+        self.assertEqual(rows[0], HEADERS)
+        self.assertEqual(rows[1], [1, "오키 주식회사", "백엔드 개발자 <Java & Spring>",
+                                   datetime(2025, 3, 31), datetime(2025, 3, 1, 9, 30, 15), 12, None])
+        # XML에 허용되지 않는 제어 문자는 제거
+        self.assertEqual(rows[2], [2, "회사둘", "프론트엔드", None, datetime(2025, 3, 2), 0, "서울"])
+        self.assertEqual(len(rows), 3)
+
+    def test_empty(self):
+        """결과가 없어도 열리는 파일 생성 (헤더를 주면 헤더 행만)"""
+        self.assertEqual(load_xlsx(iter_xlsx_chunks(iter([]))), [])
+        self.assertEqual(load_xlsx(iter_xlsx_chunks(iter([]), headers=HEADERS)), [HEADERS])
+
+class TestCsvChunks(unittest.TestCase):
+    """CSV 스트리밍 생성 테스트"""
+
+    def test_round_trip(self):
+        """BOM + 헤더, 한글, 빈 값은 빈 문자열, 날짜는 ISO 형식"""
+        has_bom, rows = load_csv(iter_csv_chunks(iter(ROWS), chunk_size=16))
+        self.assertTrue(has_bom)
+        self.assertEqual(rows[0], HEADERS)
+        self.assertEqual(rows[1], ["1", "오키 주식회사", "백엔드 개발자 <Java & Spring>",
+                                   "2025-03-31", "2025-03-01 09:30:15", "12", ""])
+        self.assertEqual(rows[2][3], "")
+        self.assertEqual(len(rows), 3)
+
+    def test_empty(self):
+        """결과가 없으면 BOM만 (헤더를 주면 헤더 행만)"""
+        self.assertEqual(load_csv(iter_csv_chunks(iter([]))), (True, []))
+        self.assertEqual(load_csv(iter_csv_chunks(iter([]), headers=HEADERS)), (True, [HEADERS]))
+
+class TestExportCleanup(unittest.TestCase):
+    """백그라운드 내보내기 파일 정리 테스트"""
+
+    def test_only_own_files(self):
+        """보관 시간이 지난 내보내기 파일만 삭제 (EXPORT_DIR의 다른 파일은 유지)"""
+        with tempfile.TemporaryDirectory() as directory:
+            manager = ExportManager(directory=directory, max_workers=1, ttl=60)
+            own = [f"{uuid.uuid4().hex}.xlsx", f"{uuid.uuid4().hex}.csv.part"]
+            others = ["report.csv", "backup.xlsx", "notes.txt", f"{uuid.uuid4().hex}.sql"]
+            old = time.time() - 120
+            for name in own + others:
+                path = os.path.join(directory, name)
+                open(path, "w").close()
+                os.utime(path, (old, old))
+            manager.cleanup()
+            manager._executor.shutdown()
+            self.assertEqual(sorted(os.listdir(directory)), sorted(others))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 조건부 요청 처리 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.http_cache import (
+    make_version_etag, etag_matches, is_not_modified, cache_headers, http_date
+)
+
+class TestHttpCache(unittest.TestCase):
+    """ETag / Last-Modified 판정 테스트"""
+    
+    def test_version_etag(self):
+        """같은 세대 + 같은 조건이면 같은 ETag, 세대가 바뀌면 다른 ETag"""
+        etag = make_version_etag("search", 3, (("keyword", "java"),))
+        self.assertEqual(etag, make_version_etag("search", 3, (("keyword", "java"),)))
+        self.assertNotEqual(etag, make_version_etag("search", 4, (("keyword", "java"),)))
+        self.assertTrue(etag_matches(f'W/{etag}, "other"', etag))
+        self.assertFalse(etag_matches('"other"', etag))
+    
+    def test_conditional_request(self):
+        """If-None-Match가 우선하고, 없으면 If-Modified-Since로 판정"""
+        etag = make_version_etag("stats", 1)
+        last_modified = 1700000000.5
+        headers = cache_headers("stats", etag, last_modified)
+        self.assertEqual(headers["Last-Modified"], http_date(last_modified))
+        self.assertIn("max-age", headers["Cache-Control"])
+        
+        self.assertTrue(is_not_modified({"if-none-match": etag}, etag, last_modified))
+        self.assertFalse(is_not_modified({"if-none-match": '"old"', "if-modified-since": headers["Last-Modified"]}, etag, last_modified))
+        self.assertTrue(is_not_modified({"if-modified-since": headers["Last-Modified"]}, etag, last_modified))
+        self.assertFalse(is_not_modified({"if-modified-since": http_date(last_modified - 60)}, etag, last_modified))
+        self.assertFalse(is_not_modified({"if-modified-since": "invalid"}, etag, last_modified))
+        self.assertFalse(is_not_modified({}, etag, last_modified))
+
+if __name__ == '__main__':
+    unittest.main()
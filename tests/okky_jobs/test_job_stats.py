@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+공고 통계 증분 집계 테스트
+"""
+
+import importlib.util
+import json
+import unittest
+import sys
+import os
+from datetime import date, datetime
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.db.job_stats import merge_counts, prune_days, apply_job_stats_delta, recompute_job_stats
+
+HAS_DB_DEPS = bool(importlib.util.find_spec("pymysql") and importlib.util.find_spec("dotenv"))
+
+class FakeCursor:
+    """실행한 SQL을 기록하고 조회마다 정해진 결과를 순서대로 돌려주는 커서"""
+    
+    def __init__(self, log, results):
+        self.log = log
+        self.results = results
+    
+    def execute(self, sql, params=None):
+        self.log.append((" ".join(sql.split()), params))
+    
+    def fetchone(self):
+        return self.results.pop(0)
+    
+    def fetchall(self):
+        return self.results.pop(0)
+    
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, *results):
+        self.log = []
+        self.results = list(results)
+    
+    def cursor(self):
+        return FakeCursor(self.log, self.results)
+    
+    def begin(self):
+        self.log.append(("BEGIN", None))
+    
+    def commit(self):
+        self.log.append(("COMMIT", None))
+    
+    def rollback(self):
+        self.log.append(("ROLLBACK", None))
+    
+    def close(self):
+        pass
+
+class TestJobStats(unittest.TestCase):
+    """집계 dict 병합/정리 테스트"""
+    
+    def test_merge_counts(self):
+        """증감분 합산, None 키는 빈 문자열, 0 이하 항목 제거"""
+        merged = merge_counts({"개발": 3, "디자인": 1}, {"개발": 2, "디자인": -1, None: 1})
+        self.assertEqual(merged, {"개발": 5, "": 1})
+    
+    def test_prune_days(self):
+        """보관 기간이 지난 일자 제거"""
+        daily = {"2025-01-01": 2, "2025-03-01": 1, "2025-03-31": 4}
+        self.assertEqual(prune_days(daily, date(2025, 3, 31), days=30), {"2025-03-01": 1, "2025-03-31": 4})
+
+@unittest.skipUnless(HAS_DB_DEPS, "pymysql/python-dotenv가 없음")
+class TestJobStatsDelta(unittest.TestCase):
+    """통계 증분 갱신 테스트"""
+    
+    def test_apply_delta(self):
+        """신규 공고만큼 합산하고 같은 트랜잭션 안에서 데이터 세대 증가"""
+        conn = FakeConnection((json.dumps({"개발": 2}), json.dumps({"서울": 2}), json.dumps({})))
+        apply_job_stats_delta(conn, [("개발", "서울"), ("디자인", None)], details_inserted=1)
+        
+        statements = [sql for sql, _ in conn.log]
+        update = next(params for sql, params in conn.log if sql.startswith("UPDATE job_stats"))
+        self.assertEqual(update[:3], (2, 2, 1))
+        self.assertEqual(json.loads(update[3]), {"개발": 3, "디자인": 1})
+        self.assertEqual(json.loads(update[4]), {"서울": 3, "": 1})
+        self.assertEqual(json.loads(update[5]), {date.today().isoformat(): 2})
+        bump = next(i for i, sql in enumerate(statements) if "data_generation" in sql)
+        self.assertLess(statements.index(next(s for s in statements if s.startswith("UPDATE job_stats"))), bump)
+        self.assertEqual(statements[bump + 1:], ["COMMIT"])
+    
+    def test_apply_delta_without_row(self):
+        """재계산 전(행 없음)이면 갱신하지 않음"""
+        conn = FakeConnection(None)
+        apply_job_stats_delta(conn, [("개발", "서울")])
+        statements = [sql for sql, _ in conn.log]
+        self.assertEqual(statements[-1], "ROLLBACK")
+        self.assertFalse(any(s.startswith("UPDATE") or "data_generation" in s for s in statements))
+    
+    def test_recompute(self):
+        """운영 테이블 집계로 통계 행을 upsert하고 데이터 세대 증가"""
+        today = date.today()
+        last_updated = datetime(2025, 3, 31, 12, 0, 0)
+        conn = FakeConnection(
+            (5, 8, last_updated, last_updated),
+            (6,),
+            [("개발", 4), ("디자인", 1)],
+            [("서울", 5), (None, 0)],
+            [(today, 2), (None, 1)],
+        )
+        with mock.patch("src.okky_jobs.db.db.get_connection", return_value=conn):
+            summary = recompute_job_stats()
+        
+        self.assertEqual((summary["open_jobs"], summary["master_jobs"], summary["detail_jobs"]), (5, 8, 6))
+        self.assertEqual(summary["category_counts"], {"개발": 4, "디자인": 1})
+        self.assertEqual(summary["location_counts"], {"서울": 5})
+        self.assertEqual(summary["daily_counts"], {today.isoformat(): 2})
+        
+        statements = [sql for sql, _ in conn.log]
+        upsert = next(i for i, sql in enumerate(statements) if sql.startswith("INSERT INTO job_stats"))
+        params = conn.log[upsert][1]
+        self.assertEqual(params[:4], (1, 5, 8, 6))
+        self.assertEqual(json.loads(params[4]), {"개발": 4, "디자인": 1})
+        self.assertEqual(params[7:], (last_updated, last_updated))
+        self.assertIn("data_generation", statements[upsert + 1])
+    
+    def test_recompute_failure(self):
+        """집계 중 오류가 나면 None (행을 쓰지 않음)"""
+        conn = FakeConnection()
+        with mock.patch("src.okky_jobs.db.db.get_connection", return_value=conn):
+            self.assertIsNone(recompute_job_stats())
+        self.assertFalse(any(sql.startswith("INSERT") for sql, _ in conn.log))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 로그 파티션 관리 테스트
+"""
+
+import unittest
+import sys
+import os
+from datetime import date
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.log_partitions import partition_name, partition_day, plan_partition_maintenance
+
+class TestLogPartitions(unittest.TestCase):
+    """파티션 추가/삭제 계획 테스트"""
+    
+    def test_partition_name(self):
+        """일자 ↔ 파티션 이름 변환"""
+        self.assertEqual(partition_name(date(2025, 1, 2)), "p20250102")
+        self.assertEqual(partition_day("p20250102"), date(2025, 1, 2))
+        self.assertIsNone(partition_day("p_future"))
+    
+    def test_initial_plan(self):
+        """파티션이 없으면 오늘부터 미리 생성"""
+        to_add, to_drop = plan_partition_maintenance(["p_future"], date(2025, 1, 10), retention_days=7, days_ahead=2)
+        self.assertEqual(to_add, [date(2025, 1, 10), date(2025, 1, 11), date(2025, 1, 12)])
+        self.assertEqual(to_drop, [])
+    
+    def test_retention(self):
+        """보관 기간이 지난 파티션만 삭제, 이미 있는 일자는 다시 만들지 않음"""
+        existing = ["p20250101", "p20250102", "p20250103", "p20250111", "p_future"]
+        to_add, to_drop = plan_partition_maintenance(existing, date(2025, 1, 10), retention_days=8, days_ahead=2)
+        self.assertEqual(to_add, [date(2025, 1, 12)])
+        self.assertEqual(to_drop, ["p20250101"])
+
+if __name__ == '__main__':
+    unittest.main()
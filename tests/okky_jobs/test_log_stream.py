@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 로그 SSE 버퍼 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.log_stream import LogStreamBus, format_sse
+
+def make_event(log_id, history_id=1, log_type="info", progress=None):
+    return log_id, {"historyId": history_id, "type": log_type, "message": f"log {log_id}",
+                    "timestamp": None, "progress": progress}
+
+class FakeLogs:
+    """crawling_logs tail 대용 (id 오름차순)"""
+    
+    def __init__(self, events):
+        self.events = events
+        self.calls = []
+    
+    def __call__(self, after_id):
+        self.calls.append(after_id)
+        if after_id is None:
+            return self.events[-3:]
+        return [e for e in self.events if e[0] > after_id]
+
+class TestLogStream(unittest.TestCase):
+    """DB tail 버퍼 공유 및 Last-Event-ID 재전송 테스트"""
+    
+    def test_format_sse(self):
+        """id/event/data 줄과 빈 줄로 구분"""
+        self.assertEqual(format_sse("log", {"a": "한글"}, 7), 'id: 7\nevent: log\ndata: {"a": "한글"}\n\n')
+        self.assertEqual(format_sse("status", {}), "event: status\ndata: {}\n\n")
+    
+    def test_poll_and_resume(self):
+        """새 로그만 버퍼에 추가, 진행 상태 변경 시 버전 증가, 버퍼보다 오래된 위치는 DB에서 재조회"""
+        logs = FakeLogs([make_event(i) for i in range(1, 6)])
+        state = {"historyId": 1, "status": "진행중", "processed": 0, "isRunning": True}
+        bus = LogStreamBus(fetch_logs=logs, fetch_state=lambda: dict(state), buffer_size=10)
+        
+        bus.poll()
+        self.assertEqual(bus.last_id, 5)
+        self.assertEqual([e[0] for e in bus.recent(1)], [3, 4, 5])
+        version = bus.status_version
+        
+        logs.events.append(make_event(6, log_type="progress", progress=40))
+        bus.poll()
+        self.assertEqual(logs.calls[-1], 5)
+        self.assertEqual(bus.status["progress"], 40)
+        self.assertGreater(bus.status_version, version)
+        
+        events, complete = bus.events_after(4)
+        self.assertEqual([e[0] for e in events], [5, 6])
+        self.assertTrue(complete)
+        
+        # 버퍼 시작(3)보다 앞선 위치에서 재연결하면 빠진 구간을 DB에서 읽음
+        self.assertFalse(bus.events_after(1)[1])
+        self.assertEqual([e[0] for e in bus.replay(1)], [2, 3, 4, 5, 6])
+        self.assertEqual(logs.calls[-1], 1)
+    
+    def test_live_overflow(self):
+        """폴링 사이에 버퍼보다 많은 로그가 쌓이면 연결 중인 구독자도 빠진 구간 없이 받음"""
+        logs = FakeLogs([make_event(i) for i in range(1, 4)])
+        bus = LogStreamBus(fetch_logs=logs, fetch_state=dict, buffer_size=5)
+        bus.poll()
+        cursor = bus.last_id
+        
+        logs.events.extend(make_event(i) for i in range(4, 13))
+        bus.poll()
+        events, complete = bus.events_after(cursor)
+        self.assertFalse(complete)
+        self.assertEqual([e[0] for e in events], [8, 9, 10, 11, 12])
+        self.assertEqual([e[0] for e in bus.replay(cursor)], list(range(4, 13)))
+
+if __name__ == '__main__':
+    unittest.main()
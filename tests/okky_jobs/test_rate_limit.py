@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 요청 제한 (토큰 버킷, 동시 실행 수 제한) 테스트
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.rate_limit import (
+    TokenBucket, RateLimiter, ConcurrencyGate, AdmissionControlMiddleware, parse_route_rules, client_key
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestRateLimit(unittest.TestCase):
+    """요청 제한 테스트"""
+
+    def test_token_bucket(self):
+        """버스트만큼 허용 후 거절, 시간이 지나면 초당 rate개씩 다시 허용"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.5, burst=2, clock=clock)
+
+        self.assertEqual(bucket.take(), (True, 0.0))
+        self.assertEqual(bucket.take(), (True, 0.0))
+        allowed, retry_after = bucket.take()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 2.0)
+
+        clock.now = 1.0
+        allowed, retry_after = bucket.take()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(retry_after, 1.0)
+
+        clock.now = 2.0
+        self.assertTrue(bucket.take()[0])
+
+        # 오래 쉬어도 burst 이상 쌓이지 않음
+        clock.now = 100.0
+        self.assertTrue(bucket.take()[0])
+        self.assertTrue(bucket.take()[0])
+        self.assertFalse(bucket.take()[0])
+
+    def test_rate_limiter_routes(self):
+        """경로 규칙별/클라이언트별로 버킷을 따로 두고 거절 수를 규칙별로 집계"""
+        self.assertEqual(parse_route_rules("/jobs=0.5:5, /exports=2"), {"/jobs": (0.5, 5), "/exports": (2.0, 2)})
+
+        clock = FakeClock()
+        limiter = RateLimiter(routes={"/jobs": (1, 1)}, default=(1, 3), clock=clock)
+        self.assertTrue(limiter.check("ip:a", "/jobs")[0])
+        self.assertFalse(limiter.check("ip:a", "/jobs")[0])
+        # 다른 클라이언트, 다른 경로는 영향 없음
+        self.assertTrue(limiter.check("ip:b", "/jobs")[0])
+        for _ in range(3):
+            self.assertTrue(limiter.check("ip:a", "/search")[0])
+        self.assertFalse(limiter.check("ip:a", "/search/stats")[0])
+        self.assertEqual(limiter.stats()["rejected"], {"/jobs": 1, "*": 1})
+
+    def test_spoofed_forwarded_for(self):
+        """클라이언트가 보낸 X-Forwarded-For로는 새 버킷을 얻지 못함"""
+        def scope(forwarded, real_ip=None):
+            headers = [(b"x-forwarded-for", forwarded.encode())]
+            if real_ip:
+                headers.append((b"x-real-ip", real_ip.encode()))
+            return {"headers": headers, "client": ("10.0.0.1", 5000)}
+
+        # 프록시 헤더를 신뢰하지 않으면 연결 주소 사용
+        self.assertEqual(client_key(scope("1.2.3.4"), trust_forwarded=False), "ip:10.0.0.1")
+        # 프록시 뒤: 앞쪽(클라이언트가 보낸) 값이 아니라 프록시가 붙인 마지막 주소 / X-Real-IP 사용
+        self.assertEqual(client_key(scope("1.2.3.4, 203.0.113.7"), trust_forwarded=True), "ip:203.0.113.7")
+        self.assertEqual(client_key(scope("5.6.7.8, 203.0.113.7", "203.0.113.7"), trust_forwarded=True), "ip:203.0.113.7")
+
+        clock = FakeClock()
+        limiter = RateLimiter(routes={"/jobs": (1, 1)}, clock=clock)
+        self.assertTrue(limiter.check(client_key(scope("1.1.1.1, 203.0.113.7"), trust_forwarded=True), "/jobs")[0])
+        self.assertFalse(limiter.check(client_key(scope("9.9.9.9, 203.0.113.7"), trust_forwarded=True), "/jobs")[0])
+
+    def test_exempt_requests(self):
+        """CORS preflight와 SSE 스트림은 토큰 버킷을 쓰지 않음"""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def call(middleware, method, path):
+            statuses = []
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            scope = {"type": "http", "method": method, "path": path, "headers": [], "client": ("10.0.0.1", 5000)}
+            await middleware(scope, None, send)
+            return statuses[0]
+
+        async def scenario():
+            limiter = RateLimiter(routes={}, default=(0, 1), clock=FakeClock())
+            middleware = AdmissionControlMiddleware(
+                app, limiter, ConcurrencyGate(), gated_routes=[], exempt_paths=["/crawl/logs/stream"]
+            )
+            return [
+                await call(middleware, "OPTIONS", "/jobs"),
+                await call(middleware, "GET", "/crawl/logs/stream"),
+                await call(middleware, "GET", "/crawl/logs/stream"),
+                await call(middleware, "GET", "/jobs"),
+                await call(middleware, "GET", "/jobs"),
+            ]
+
+        self.assertEqual(asyncio.run(scenario()), [200, 200, 200, 200, 429])
+
+    def test_concurrency_gate(self):
+        """자리가 없으면 대기하다가 시간 초과 시 거절"""
+        async def scenario():
+            gate = ConcurrencyGate(max_concurrent=1, queue_timeout=0.05)
+            self.assertTrue(await gate.acquire())
+            self.assertFalse(await gate.acquire())
+
+            # 대기 중 자리가 나면 입장
+            waiter = asyncio.ensure_future(gate.acquire())
+            await asyncio.sleep(0.01)
+            gate.release(0.01)
+            self.assertTrue(await waiter)
+            gate.release(0.01)
+            return gate.stats()
+
+        stats = asyncio.run(scenario())
+        self.assertEqual((stats["admitted"], stats["rejected"], stats["queued"], stats["inFlight"]), (2, 1, 2, 0))
+
+if __name__ == '__main__':
+    unittest.main()
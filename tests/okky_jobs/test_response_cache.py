@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API 응답 캐시 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.response_cache import ResponseCache, normalize_key
+
+class TestResponseCache(unittest.TestCase):
+    """LRU + TTL + 세대 무효화 테스트"""
+    
+    def test_hit_and_miss(self):
+        """같은 세대에서는 적중, 세대가 바뀌면 무효화"""
+        cache = ResponseCache("test_hit", max_bytes=1000, ttl=60)
+        self.assertIsNone(cache.get("a", 1))
+        cache.set("a", "value", 1)
+        self.assertEqual(cache.get("a", 1), "value")
+        self.assertIsNone(cache.get("a", 2))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["invalidations"]), (1, 2, 1))
+    
+    def test_byte_bound_evicts_lru(self):
+        """바이트 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+        cache = ResponseCache("test_lru", max_bytes=30, ttl=60, max_entry_bytes=30)
+        cache.set("a", "x" * 10)
+        cache.set("b", "x" * 10)
+        cache.get("a")
+        cache.set("c", "x" * 15)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertLessEqual(cache.stats()["bytes"], 30)
+        self.assertFalse(cache.set("big", "x" * 31))
+    
+    def test_ttl(self):
+        """TTL이 지난 항목은 미스"""
+        cache = ResponseCache("test_ttl", max_bytes=1000, ttl=-1)
+        cache.set("a", "value")
+        self.assertIsNone(cache.get("a"))
+    
+    def test_tee(self):
+        """끝까지 전송된 청크 스트림만 캐시에 저장"""
+        cache = ResponseCache("test_tee", max_bytes=1000, ttl=60, max_entry_bytes=10)
+        self.assertEqual(list(cache.tee("a", [b"ab", b"cd"])), [b"ab", b"cd"])
+        self.assertEqual(cache.get("a"), b"abcd")
+        list(cache.tee("big", [b"x" * 6, b"x" * 6]))
+        self.assertIsNone(cache.get("big"))
+    
+    def test_normalize_key(self):
+        """목록 순서와 빈 값 차이는 같은 키"""
+        self.assertEqual(
+            normalize_key(skills=["Spring", "Java"], keyword="", page=1),
+            normalize_key(page=1, keyword=None, skills=("Java", "Spring"))
+        )
+
+if __name__ == '__main__':
+    unittest.main()
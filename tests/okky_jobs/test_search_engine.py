@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+인메모리 검색 엔진 테스트
+"""
+
+import importlib.util
+import sqlite3
+import time
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.search.engine import (
+    SearchEngine, SearchEngineHolder, SEARCH_ENGINE_MAX_AGE, drop_lowest_bits, rows_from_bits
+)
+
+def make_row(i, title, company, category="개발", location="서울", experience="신입",
+             deadline=None, views=0, description=""):
+    created = datetime(2025, 1, 1) + timedelta(days=i)
+    return {
+        "id": i, "title": title, "company": company, "category": category,
+        "location": location, "experience": experience, "deadline": deadline,
+        "views": views, "created_at": created, "updated_at": created,
+        "original_url": f"https://okky.kr/recruit/{i}", "description": description,
+    }
+
+class TestSearchEngine(unittest.TestCase):
+    """필터/키워드/정렬/페이지네이션 테스트"""
+    
+    def setUp(self):
+        rows = [
+            make_row(1, "백엔드 개발자 채용", "오키", deadline="2025-02-01", views=10, description="Java Spring 경험자"),
+            make_row(2, "프론트엔드 개발자", "가나다", location="경기", deadline="2025-01-15", views=30),
+            make_row(3, "UI 디자이너", "오키", category="디자인", views=20, description="Figma"),
+            make_row(4, "Backend Engineer", "ABC", experience="3-5년", deadline="2025-03-01", views=5),
+        ]
+        skills = {
+            "https://okky.kr/recruit/1": ["Java", "Spring"],
+            "https://okky.kr/recruit/4": ["Java"],
+        }
+        self.engine = SearchEngine(rows, skills, generation=1)
+    
+    def ids(self, mask, sort="createdAt", offset=0, limit=20):
+        return [self.engine.row(i)["id"] for i in self.engine.page_rows(mask, sort, offset, limit)]
+    
+    def test_keyword(self):
+        """제목/회사/설명 부분 문자열 일치, 대소문자 무시"""
+        self.assertEqual(self.ids(self.engine.match(keyword="개발자")), [2, 1])
+        self.assertEqual(self.ids(self.engine.match(keyword="오키")), [3, 1])
+        self.assertEqual(self.ids(self.engine.match(keyword="spring")), [1])
+        self.assertEqual(self.ids(self.engine.match(keyword="backend")), [4])
+        self.assertEqual(self.ids(self.engine.match(keyword="없는키워드")), [])
+        self.assertFalse(self.engine.supports("100%"))
+    
+    def test_filters(self):
+        """범주 비트셋, 스킬 and/or, 마감일 기준 필터"""
+        self.assertEqual(self.ids(self.engine.match(category="개발", location="서울")), [4, 1])
+        self.assertEqual(self.ids(self.engine.match(skills=["Java", "Spring"], skills_mode="and")), [1])
+        self.assertEqual(self.ids(self.engine.match(skills=["Java", "Spring"], skills_mode="or")), [4, 1])
+        self.assertEqual(self.ids(self.engine.match(deadline_cutoff="2025-02-01")), [2, 1])
+        self.assertEqual(self.engine.skill_counts(self.engine.match()), {"Java": 2, "Spring": 1})
+    
+    def test_facets(self):
+        """현재 검색 조건의 category/location/experience 값별 공고 수"""
+        mask = self.engine.match()
+        self.assertEqual(self.engine.facet_counts(mask, "category"), {"개발": 3, "디자인": 1})
+        self.assertEqual(self.engine.facet_counts(mask, "location"), {"서울": 3, "경기": 1})
+        mask = self.engine.match(keyword="개발자")
+        self.assertEqual(self.engine.facet_counts(mask, "location"), {"서울": 1, "경기": 1})
+        self.assertEqual(self.engine.facet_counts(mask, "experience"), {"신입": 2})
+    
+    def test_sort_and_paging(self):
+        """정렬 기준별 순서와 OFFSET/LIMIT"""
+        mask = self.engine.match()
+        self.assertEqual(self.ids(mask), [4, 3, 2, 1])
+        self.assertEqual(self.ids(mask, offset=1, limit=2), [3, 2])
+        self.assertEqual(self.ids(mask, sort="views"), [2, 3, 1, 4])
+        self.assertEqual(self.ids(mask, sort="deadline"), [3, 2, 1, 4])
+        self.assertEqual(self.ids(mask, sort="company", offset=1, limit=2), [2, 3])
+    
+    def test_bit_helpers(self):
+        """비트셋 보조 함수"""
+        self.assertEqual(rows_from_bits(0b101001), [0, 3, 5])
+        self.assertEqual(drop_lowest_bits(0b101001, 2), 0b100000)
+        self.assertEqual(drop_lowest_bits(0b101001, 3), 0)
+
+@unittest.skipUnless(
+    all(importlib.util.find_spec(m) for m in ("fastapi", "pymysql", "dotenv")),
+    "fastapi/pymysql/python-dotenv가 없음"
+)
+class TestSqlParity(unittest.TestCase):
+    """대소문자만 다른 스킬에 대해 엔진과 SQL(대소문자 무시 비교) 결과가 같은지 확인"""
+    
+    SKILLS = {
+        "https://okky.kr/recruit/1": ["Svelte", "Elasticsearch"],
+        "https://okky.kr/recruit/2": ["svelte"],
+        "https://okky.kr/recruit/3": ["SVELTE", "elasticsearch"],
+    }
+    
+    def setUp(self):
+        from src.okky_jobs.api import api_main
+        self.api = api_main
+        rows = [make_row(i, f"공고 {i}", "오키") for i in (1, 2, 3, 4)]
+        self.engine = SearchEngine(rows, self.SKILLS, generation=1)
+        
+        # MySQL utf8mb4_general_ci 대신 SQLite NOCASE 비교로 같은 SQL 실행
+        self.db = sqlite3.connect(":memory:")
+        self.db.executescript("""
+            CREATE TABLE okky_jobs (
+                id INTEGER, title TEXT, company TEXT, link TEXT, deadline TEXT,
+                category TEXT COLLATE NOCASE, career TEXT COLLATE NOCASE, location TEXT COLLATE NOCASE,
+                created_at TEXT, updated_at TEXT, closed_at TEXT
+            );
+            CREATE TABLE okky_job_details (link TEXT, view_count INTEGER, local_view_count INTEGER, description TEXT);
+            CREATE TABLE job_skills (link TEXT, skill TEXT COLLATE NOCASE);
+        """)
+        for r in rows:
+            self.db.execute(
+                "INSERT INTO okky_jobs VALUES (?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, NULL)",
+                (r["id"], r["title"], r["company"], r["original_url"], r["category"], r["experience"],
+                 r["location"], str(r["created_at"]), str(r["updated_at"]))
+            )
+        for link, skills in self.SKILLS.items():
+            self.db.executemany("INSERT INTO job_skills VALUES (?, ?)", [(link, skill) for skill in skills])
+    
+    def sql_ids(self, skills, skills_mode):
+        conditions, params = self.api.build_search_conditions(skills=skills, skills_mode=skills_mode)
+        sql = f"SELECT j.id FROM {self.api.build_search_source()} WHERE 1=1 {conditions}"
+        return sorted(row[0] for row in self.db.execute(sql.replace("%s", "?"), params))
+    
+    def test_mixed_case_skill(self):
+        """스킬 필터 일치 공고와 스킬 facet 집계가 두 경로에서 같음"""
+        for skills, mode in ((["svelte"], "or"), (["Svelte", "ELASTICSEARCH"], "and"), (["elasticsearch"], "or")):
+            engine_ids = sorted(self.engine.row(i)["id"] for i in self.engine.page_rows(
+                self.engine.match(skills=skills, skills_mode=mode), limit=100))
+            self.assertEqual(engine_ids, self.sql_ids(skills, mode), (skills, mode))
+        
+        sql = self.api.build_skill_facet_query("").replace("%s", "?")
+        sql_counts = {skill.casefold(): count for skill, count in self.db.execute(sql)}
+        engine_counts = {skill.casefold(): count for skill, count in self.engine.skill_counts(self.engine.match()).items()}
+        self.assertEqual(engine_counts, sql_counts)
+        self.assertEqual(engine_counts, {"svelte": 3, "elasticsearch": 2})
+
+class TestSearchEngineHolder(unittest.TestCase):
+    """엔진 교체 시점 테스트"""
+    
+    def setUp(self):
+        self.holder = SearchEngineHolder(enabled=True)
+        self.refreshes = []
+        self.holder.refresh_async = self.refreshes.append
+        self.holder.engine = SearchEngine([make_row(1, "백엔드", "오키")], {}, generation=1)
+        self.holder.loaded_at = time.time()
+    
+    def test_generation_change(self):
+        """세대가 바뀌면 SQL로 처리하면서 새 엔진 적재"""
+        self.assertIs(self.holder.get(1), self.holder.engine)
+        self.assertIsNone(self.holder.get(2))
+        self.assertEqual(self.refreshes, [2])
+    
+    def test_max_age(self):
+        """세대가 같아도 오래된 엔진은 기존 엔진으로 응답하면서 다시 적재 (조회수 반영)"""
+        self.holder.loaded_at = time.time() - SEARCH_ENGINE_MAX_AGE - 1
+        self.assertIs(self.holder.get(1), self.holder.engine)
+        self.assertEqual(self.refreshes, [1])
+    
+    def test_failure_backoff(self):
+        """적재 실패 후에는 재시도 간격 동안 다시 적재하지 않고 SQL로 처리"""
+        def fail(generation):
+            raise RuntimeError("replica down")
+        
+        holder = SearchEngineHolder(enabled=True, retry_base=60, retry_max=600)
+        holder._load = fail
+        holder._refresh(1)
+        self.assertEqual(holder.failures, 1)
+        self.assertGreater(holder.retry_in(), 59)
+        # 대기 중에는 적재 스레드를 띄우지 않음
+        self.assertIsNone(holder.get(1))
+        self.assertFalse(holder._loading)
+        
+        # 대기 시간이 지나면 다시 시도, 실패할 때마다 간격 두 배
+        holder.failed_at -= 61
+        holder._refresh(1)
+        self.assertEqual(holder.failures, 2)
+        self.assertGreater(holder.retry_in(), 119)
+        
+        holder._load = lambda generation: SearchEngine([make_row(1, "백엔드", "오키")], {}, generation=generation)
+        holder.failed_at -= 121
+        holder._refresh(1)
+        self.assertEqual((holder.failures, holder.retry_in()), (0, 0.0))
+        self.assertIs(holder.get(1), holder.engine)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,13 @@
 검색 및 Excel 내보내기 테스트
 """
 
+import asyncio
+import importlib.util
+import time
 import unittest
 import sys
 import os
+from unittest import mock
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -25,5 +29,40 @@ class TestSearchExport(unittest.TestCase):
         print("===== Excel 내보내기 테스트 (스킵됨) =====")
         self.skipTest("OKKY 모듈 테스트는 외부 의존성으로 인해 스킵")
 
+@unittest.skipUnless(
+    all(importlib.util.find_spec(m) for m in ("fastapi", "pymysql", "dotenv")),
+    "fastapi/pymysql/python-dotenv가 없음"
+)
+class TestExportEventLoop(unittest.TestCase):
+    """느린 내보내기 쿼리가 이벤트 루프를 막지 않는지 테스트"""
+    
+    def test_first_row_off_loop(self):
+        """첫 행을 기다리는 동안 다른 요청(코루틴)이 계속 실행됨"""
+        from src.okky_jobs.api import api_main
+        
+        def slow_rows(keyword, fields=None):
+            time.sleep(0.3)
+            yield {"title": "백엔드", "company": "오키"}
+        
+        async def scenario():
+            ticks = []
+            
+            async def ticker():
+                while True:
+                    ticks.append(time.monotonic())
+                    await asyncio.sleep(0.02)
+            
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            response = await api_main.export_jobs(keyword="없는조건", format="csv", fields=None)
+            task.cancel()
+            return response, len(ticks)
+        
+        with mock.patch.object(api_main, "iter_search_jobs", slow_rows), \
+                mock.patch.object(api_main, "get_data_generation", return_value=1):
+            response, ticks = asyncio.run(scenario())
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(ticks, 5)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
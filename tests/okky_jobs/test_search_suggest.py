@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검색어 자동완성 색인 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.search.suggest import (
+    SuggestIndex, SuggestIndexHolder, build_suggestions, to_jamo, to_choseong, is_choseong_query, PRECOMPUTE_PREFIX
+)
+
+class TestSearchSuggest(unittest.TestCase):
+    """자모/초성 접두어 자동완성 테스트"""
+    
+    def setUp(self):
+        self.companies = SuggestIndex([
+            ("삼성전자", 10, None),
+            ("삼성SDS", 30, None),
+            ("사람인", 5, None),
+            ("과학기술원", 1, None),
+            ("Kakao Bank", 7, None),
+        ])
+    
+    def texts(self, index, query, limit=10):
+        return [r["text"] for r in index.suggest(query, limit)]
+    
+    def test_jamo(self):
+        """자모 분해 (겹모음/겹받침 포함)와 초성 변환"""
+        self.assertEqual(to_jamo("삼"), "ㅅㅏㅁ")
+        self.assertEqual(to_jamo("과"), "ㄱㅗㅏ")
+        self.assertEqual(to_jamo("값"), "ㄱㅏㅂㅅ")
+        self.assertEqual(to_choseong("삼성 SDS"), "ㅅㅅsds")
+        self.assertTrue(is_choseong_query("ㅅㅅ"))
+        self.assertFalse(is_choseong_query("삼ㅅ"))
+        self.assertFalse(is_choseong_query("java"))
+    
+    def test_prefix(self):
+        """입력 중인 글자, 초성, 영문 대소문자/공백 무시 접두어 일치 (점수 순)"""
+        self.assertEqual(self.texts(self.companies, "삼"), ["삼성SDS", "삼성전자"])
+        self.assertEqual(self.texts(self.companies, "삼ㅅ"), ["삼성SDS", "삼성전자"])
+        self.assertEqual(self.texts(self.companies, "사"), ["삼성SDS", "삼성전자", "사람인"])
+        self.assertEqual(self.texts(self.companies, "ㅅㅅ"), ["삼성SDS", "삼성전자"])
+        self.assertEqual(self.texts(self.companies, "고"), ["과학기술원"])
+        self.assertEqual(self.texts(self.companies, "KAKAOB"), ["Kakao Bank"])
+        self.assertEqual(self.texts(self.companies, "사", limit=1), ["삼성SDS"])
+        self.assertEqual(self.texts(self.companies, "없는회사"), [])
+    
+    def test_title_words(self):
+        """제목은 단어 시작 위치에서도 일치하고, 긴 접두어는 정렬 배열에서 찾음"""
+        titles = SuggestIndex([
+            ("[삼성] 백엔드 개발자 채용", 100, 1),
+            ("프론트엔드 개발자 모집", 300, 2),
+            ("백엔드 엔지니어", 50, 3),
+        ], words=True)
+        self.assertEqual([r["id"] for r in titles.suggest("백엔")], [1, 3])
+        long_query = "백엔드 개발자 채"
+        self.assertGreater(len(to_jamo(long_query)), PRECOMPUTE_PREFIX)
+        self.assertEqual([r["id"] for r in titles.suggest(long_query)], [1])
+        self.assertEqual([r["id"] for r in titles.suggest("개발")], [2, 1])
+    
+    def test_holder(self):
+        """검색 엔진과 무관하게 세대별로 적재, 새 세대 적재 중에는 이전 색인으로 응답"""
+        def load(generation):
+            return build_suggestions(
+                [("오키 ", 2), ("오키", 1), ("", 3)],
+                [(1, f"백엔드 개발자 {generation}", 10)],
+                [("Java", 4)]
+            )
+        
+        holder = SuggestIndexHolder(enabled=True)
+        holder._load = load
+        holder.refresh_async = lambda generation: None
+        self.assertIsNone(holder.current(1))
+        holder._refresh(1)
+        indexes = holder.current(1)
+        self.assertEqual(indexes["companies"].suggest("오키"), [{"text": "오키", "score": 3}])
+        self.assertEqual(indexes["titles"].suggest("개발"), [{"text": "백엔드 개발자 1", "score": 10, "id": 1}])
+        self.assertEqual(indexes["skills"].suggest("ja"), [{"text": "Java", "score": 4}])
+        
+        # 세대가 바뀌면 새로 적재하는 동안 이전 색인 사용
+        self.assertIs(holder.current(2), indexes)
+
+if __name__ == '__main__':
+    unittest.main()
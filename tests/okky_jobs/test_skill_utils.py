@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보유스킬 정규화 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.skill_utils import normalize_skill, normalize_skills, tokenize_skills
+
+class TestSkillUtils(unittest.TestCase):
+    """보유스킬 토큰화/정규화 테스트"""
+    
+    def test_aliases(self):
+        """별칭과 대소문자를 대표 표기로 통일"""
+        self.assertEqual(normalize_skill("JS"), "JavaScript")
+        self.assertEqual(normalize_skill("javascript"), "JavaScript")
+        self.assertEqual(normalize_skill("Node JS"), "Node.js")
+        self.assertEqual(normalize_skill("스프링부트"), "Spring Boot")
+    
+    def test_separators(self):
+        """쉼표/슬래시/가운뎃점 구분, 알려진 슬래시 표기는 유지"""
+        self.assertEqual(tokenize_skills("Java, Spring·Oracle"), ["Java", "Spring", "Oracle"])
+        self.assertEqual(normalize_skills("C/C++, PL/SQL"), ["C", "C++", "PL/SQL"])
+    
+    def test_deduplicate(self):
+        """같은 스킬의 다른 표기는 하나로 합치고 순서 유지"""
+        self.assertEqual(normalize_skills("JS, React, javascript, 자바"), ["JavaScript", "React", "Java"])
+    
+    def test_unknown_and_empty(self):
+        """알 수 없는 스킬은 공백만 정리, 빈 값은 빈 목록"""
+        self.assertEqual(normalize_skills("  Some   Tool "), ["Some Tool"])
+        self.assertEqual(normalize_skills(None), [])
+        self.assertEqual(normalize_skills(""), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+조회수 쓰기 지연 집계 테스트
+"""
+
+import unittest
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.okky_jobs.utils.view_counter import ViewCountBuffer, build_flush_statement
+
+class TestViewCounter(unittest.TestCase):
+    """조회수 합산/일괄 반영 문장 테스트"""
+    
+    def test_flush_statement(self):
+        """링크별 증가분을 UPDATE 한 문장으로 변환"""
+        sql, params = build_flush_statement({"a": 3, "b": 1})
+        self.assertEqual(sql.count("UPDATE"), 1)
+        self.assertEqual(sql.count("UNION ALL"), 1)
+        self.assertIn("local_view_count", sql)
+        self.assertEqual(params, ["a", 3, "b", 1])
+    
+    def test_pending(self):
+        """반영 전 조회수는 링크별로 합산"""
+        buffer = ViewCountBuffer()
+        buffer._ensure_started = lambda: None
+        buffer.add("a")
+        buffer.add("a")
+        buffer.add("b")
+        self.assertEqual(buffer.pending("a"), 2)
+        self.assertEqual(buffer.stats()["pendingViews"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
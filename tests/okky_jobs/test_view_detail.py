@@ -4,9 +4,13 @@
 상세 공고 조회 테스트
 """
 
+import importlib.util
+import json
 import unittest
 import sys
 import os
+from datetime import datetime
+from unittest import mock
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
@@ -20,5 +24,35 @@ class TestViewDetail(unittest.TestCase):
         print("===== 상세 공고 조회 테스트 (스킵됨) =====")
         self.skipTest("OKKY 모듈 테스트는 외부 의존성으로 인해 스킵")
 
+@unittest.skipUnless(
+    all(importlib.util.find_spec(m) for m in ("fastapi", "pymysql", "dotenv")),
+    "fastapi/pymysql/python-dotenv가 없음"
+)
+class TestJobDetailCache(unittest.TestCase):
+    """상세 캐시 항목/키 테스트"""
+    
+    def test_canonical_job_id(self):
+        """앞자리 0은 DB id와 같은 키로, 정수가 아니면 None(404)"""
+        from src.okky_jobs.api.api_main import canonical_job_id
+        self.assertEqual(canonical_job_id("7"), "7")
+        self.assertEqual(canonical_job_id("007"), "7")
+        for job_id in ("7.0", "-7", "abc", "", "1_000", "٧"):
+            self.assertIsNone(canonical_job_id(job_id), job_id)
+    
+    def test_cached_views(self):
+        """캐시 항목의 조회수는 DB 값 그대로 (일괄 미리보기와 공유하므로 +1 하지 않음)"""
+        from src.okky_jobs.api import api_main
+        row = {
+            "id": 7, "company": "오키", "title": "백엔드", "category": "개발", "location": "서울",
+            "experience": "신입", "deadline": None, "views": 12, "created_at": datetime(2025, 3, 1),
+            "updated_at": datetime(2025, 3, 1), "original_url": "https://okky.kr/recruit/7", "description": None,
+            "skill": "Java", "contact_id": None, "contact_name": None, "contact_phone": None, "contact_email": None,
+        }
+        conn = mock.MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [row]
+        with mock.patch.object(api_main, "get_read_connection", return_value=conn):
+            entries = api_main._load_job_details(["7"])
+        self.assertEqual(json.loads(entries["7"]["data"])["views"], 12)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file